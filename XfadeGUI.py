@@ -1,7 +1,19 @@
+import time
+
+STARTUP_TIME = time.perf_counter()
+
 import sys
 import os
 import subprocess
 import json
+import hashlib
+import queue
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from types import SimpleNamespace
 
 if sys.platform == 'win32':
     import ctypes
@@ -26,189 +38,2898 @@ if sys.platform == 'win32':
         return _original_popen(*args, **kwargs)
     subprocess.Popen = _patched_popen
 
-from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QPushButton, QLineEdit, QLabel, QFileDialog, 
-                             QListWidget, QMessageBox, QDoubleSpinBox, QTextEdit,
-                             QComboBox, QGridLayout, QScrollArea, QTabWidget, QAbstractItemView,
-                             QMenu)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QSettings
-from PyQt6.QtGui import QTextCursor, QMovie, QIcon, QDragEnterEvent, QDropEvent, QPainter, QPixmap, QAction
-from PyQt6.QtWidgets import QGraphicsColorizeEffect
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
+                             QPushButton, QLineEdit, QLabel, QFileDialog, 
+                             QListWidget, QTableView, QHeaderView, QMessageBox, QDoubleSpinBox, QPlainTextEdit,
+                             QComboBox, QGridLayout, QScrollArea, QTabWidget, QAbstractItemView,
+                             QMenu, QCheckBox, QSpinBox, QProgressBar, QDialog, QSlider)
+from PyQt6.QtCore import (Qt, QThread, QObject, QTimer, QUrl, pyqtSignal, QSize, QSettings, QStandardPaths,
+                          QCoreApplication, QAbstractTableModel, QModelIndex, QFileSystemWatcher)
+from PyQt6.QtGui import (QMovie, QIcon, QDragEnterEvent, QDropEvent, QPainter, QPixmap, QAction, QDesktopServices,
+                         QImage)
+from PyQt6.QtWidgets import QGraphicsColorizeEffect
+
+import filtergraph
+
+def get_resource_path(relative_path):
+    if getattr(sys, 'frozen', False):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.dirname(__file__)
+    
+    return os.path.join(base_path, relative_path)
+
+def get_ffmpeg_path():
+    if getattr(sys, 'frozen', False):
+        ffmpeg_path = get_resource_path('ffmpeg.exe')
+        ffprobe_path = get_resource_path('ffprobe.exe')
+    elif sys.platform == 'win32':
+        ffmpeg_path = 'ffmpeg.exe'
+        ffprobe_path = 'ffprobe.exe'
+    else:
+        ffmpeg_path = 'ffmpeg'
+        ffprobe_path = 'ffprobe'
+    
+    return ffmpeg_path, ffprobe_path
+
+def run_subprocess(cmd, **kwargs):
+    default_kwargs = {
+        'creationflags': subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+    }
+    default_kwargs.update(kwargs)
+    return subprocess.Popen(cmd, **default_kwargs)
+
+def run_subprocess_simple(cmd, **kwargs):
+    default_kwargs = {
+        'creationflags': subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+    }
+    default_kwargs.update(kwargs)
+    return subprocess.run(cmd, **default_kwargs)
+
+def get_cache_dir(*parts):
+    base_path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.GenericCacheLocation)
+    if not base_path:
+        base_path = tempfile.gettempdir()
+    cache_dir = os.path.join(base_path, 'FFmpeg Xfade GUI', *parts)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def get_file_identity(file_path):
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+def get_cache_key(*parts):
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()[:32]
+
+def prune_cache_dir(directory, max_bytes, keep=()):
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.path not in keep:
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+FFMPEG_PATH, FFPROBE_PATH = get_ffmpeg_path()
+
+SMART_RENDER_VIDEO_ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+SMART_RENDER_AUDIO_ENCODERS = {'aac': 'aac', 'mp3': 'libmp3lame', 'opus': 'libopus', 'ac3': 'ac3'}
+SMART_RENDER_ANNEXB_FILTERS = {'h264': 'h264_mp4toannexb', 'hevc': 'hevc_mp4toannexb'}
+
+PROGRESS_KEYS = {'frame', 'fps', 'bitrate', 'total_size', 'out_time_us', 'out_time_ms', 'out_time',
+                 'dup_frames', 'drop_frames', 'speed', 'progress'}
+
+STDOUT_OUTPUT = 'pipe:1'
+OUTPUT_MODES = ['mp4', 'fmp4', 'hls', 'pipe']
+FRAGMENTED_MP4_FLAGS = '+frag_keyframe+empty_moov+default_base_moof'
+FASTSTART_EXTENSIONS = {'.mp4', '.m4v', '.mov'}
+DEFAULT_HLS_TIME = 4.0
+
+def with_progress_args(ffmpeg_args):
+    progress_pipe = 'pipe:2' if ffmpeg_args[-1] == STDOUT_OUTPUT else 'pipe:1'
+    return [ffmpeg_args[0], '-progress', progress_pipe, '-nostats', *ffmpeg_args[1:]]
+
+def parse_float(value, default=None):
+    try:
+        return float(str(value).strip().rstrip('x'))
+    except (TypeError, ValueError):
+        return default
+
+class ProgressParser:
+    def __init__(self, total_duration=0, offset=0):
+        self.total_duration = total_duration
+        self.offset = offset
+        self.values = {}
+        self.started = time.time()
+
+    def feed(self, line):
+        key, separator, value = line.strip().partition('=')
+        if not separator or not (key in PROGRESS_KEYS or re.match(r'stream_\d+_\d+_q$', key)):
+            return False, None
+        self.values[key] = value.strip()
+        if key != 'progress':
+            return True, None
+        event = self.build_event()
+        self.values = {}
+        return True, event
+
+    def build_event(self):
+        out_time_us = parse_float(self.values.get('out_time_us'), None)
+        if out_time_us is None:
+            out_time_us = parse_float(self.values.get('out_time_ms'), 0)
+        out_time = max(out_time_us / 1000000, 0)
+        speed = parse_float(self.values.get('speed'))
+        done = self.offset + out_time
+        elapsed = time.time() - self.started
+
+        percent = None
+        eta = None
+        if self.total_duration > 0:
+            percent = min(done / self.total_duration * 100, 100.0)
+            remaining = max(self.total_duration - done, 0)
+            if speed:
+                eta = remaining / speed
+            elif out_time > 0:
+                eta = elapsed * remaining / out_time
+
+        return {
+            'frame': int(parse_float(self.values.get('frame'), 0)),
+            'fps': parse_float(self.values.get('fps'), 0.0),
+            'speed': speed,
+            'out_time': done,
+            'percent': percent,
+            'eta': eta,
+            'bitrate': self.values.get('bitrate', 'N/A'),
+            'finished': self.values.get('progress') == 'end',
+        }
+
+def format_progress_info(info):
+    parts = []
+    if info.get('percent') is not None:
+        parts.append(f"{info['percent']:.1f}%")
+    parts.append(f"{info.get('fps', 0):.0f} fps")
+    if info.get('speed'):
+        parts.append(f"{info['speed']:.2f}x")
+    if info.get('eta') is not None:
+        eta = int(info['eta'])
+        parts.append(f"ETA {eta // 3600:02d}:{eta % 3600 // 60:02d}:{eta % 60:02d}")
+    if info.get('bitrate') and info['bitrate'] != 'N/A':
+        parts.append(info['bitrate'])
+    return " | ".join(parts)
+
+def format_bytes(value):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(value) < 1024 or unit == 'GB':
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+
+def format_resource_sample(sample):
+    return " | ".join([f"CPU {sample['cpu_percent']:.0f}%", f"RSS {format_bytes(sample['rss'])}",
+                       f"{sample['threads']} threads", f"read {format_bytes(sample['read_bytes'])}",
+                       f"write {format_bytes(sample['write_bytes'])}"])
+
+def read_process_stats(pid):
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            fields = f.read().rsplit(')', 1)[1].split()
+        stats = {'cpu_time': (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK'),
+                 'threads': int(fields[17])}
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key in ('VmRSS', 'VmHWM'):
+                    stats['rss' if key == 'VmRSS' else 'peak_rss'] = int(value.split()[0]) * 1024
+        try:
+            with open(f"/proc/{pid}/io", 'r') as f:
+                for line in f:
+                    key, _, value = line.partition(':')
+                    if key in ('read_bytes', 'write_bytes'):
+                        stats[key] = int(value)
+        except OSError:
+            pass
+        return stats
+    except (OSError, IndexError, ValueError):
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        process = psutil.Process(pid)
+        with process.oneshot():
+            cpu_times = process.cpu_times()
+            memory = process.memory_info()
+            stats = {'cpu_time': cpu_times.user + cpu_times.system, 'threads': process.num_threads(),
+                     'rss': memory.rss, 'peak_rss': getattr(memory, 'peak_wset', memory.rss)}
+            try:
+                io_counters = process.io_counters()
+                stats.update(read_bytes=io_counters.read_bytes, write_bytes=io_counters.write_bytes)
+            except (AttributeError, psutil.Error):
+                pass
+        return stats
+    except psutil.Error:
+        return None
+
+def get_child_processes(pid):
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", 'r') as f:
+                children.extend(SimpleNamespace(pid=int(child)) for child in f.read().split())
+        return children
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return []
+    try:
+        return psutil.Process(pid).children()
+    except psutil.Error:
+        return []
+
+RESOURCE_SAMPLE_INTERVAL = 1.0
+
+class ResourceSampler:
+    def __init__(self, get_processes, interval=RESOURCE_SAMPLE_INTERVAL, memory_alert_bytes=0,
+                 on_sample=None, on_alert=None):
+        self.get_processes = get_processes
+        self.interval = interval
+        self.memory_alert_bytes = memory_alert_bytes
+        self.on_sample = on_sample
+        self.on_alert = on_alert
+        self.samples = []
+        self.cpu_times = {}
+        self.io_bytes = {}
+        self.peak_rss = 0
+        self.memory_alerts = 0
+        self.alerting = False
+        self.started = time.time()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.started = time.time()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+        return self.get_summary()
+
+    def run(self):
+        last = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            now = time.perf_counter()
+            self.take_sample(now - last)
+            last = now
+
+    def take_sample(self, elapsed):
+        cpu_time = 0.0
+        rss = 0
+        threads = 0
+        count = 0
+        for process in self.get_processes():
+            stats = read_process_stats(process.pid)
+            if stats is None:
+                continue
+            count += 1
+            cpu_time += stats['cpu_time'] - self.cpu_times.get(process.pid, 0.0)
+            self.cpu_times[process.pid] = stats['cpu_time']
+            self.io_bytes[process.pid] = (stats.get('read_bytes', 0), stats.get('write_bytes', 0))
+            self.peak_rss = max(self.peak_rss, stats.get('peak_rss', 0))
+            rss += stats.get('rss', 0)
+            threads += stats.get('threads', 0)
+
+        sample = {'time': round(time.time() - self.started, 3), 'processes': count,
+                  'cpu_percent': round(cpu_time / elapsed * 100, 1) if elapsed > 0 else 0.0,
+                  'rss': rss, 'threads': threads,
+                  'read_bytes': sum(read for read, _ in self.io_bytes.values()),
+                  'write_bytes': sum(write for _, write in self.io_bytes.values())}
+        self.samples.append(sample)
+        if self.on_sample:
+            self.on_sample(sample)
+
+        if self.memory_alert_bytes and rss > self.memory_alert_bytes:
+            if not self.alerting:
+                self.alerting = True
+                self.memory_alerts += 1
+                if self.on_alert:
+                    self.on_alert(f"FFmpeg memory use {format_bytes(rss)} is above the "
+                                  f"{format_bytes(self.memory_alert_bytes)} alert threshold")
+        else:
+            self.alerting = False
+
+    def get_summary(self):
+        duration = time.time() - self.started
+        cpu = [sample['cpu_percent'] for sample in self.samples]
+        last = self.samples[-1] if self.samples else {'read_bytes': 0, 'write_bytes': 0}
+        return {'duration': round(duration, 3), 'samples': len(self.samples),
+                'cpu_percent_avg': round(sum(cpu) / len(cpu), 1) if cpu else None,
+                'cpu_percent_max': max(cpu, default=None),
+                'rss_max': max((sample['rss'] for sample in self.samples), default=None),
+                'peak_rss': self.peak_rss or None,
+                'threads_max': max((sample['threads'] for sample in self.samples), default=None),
+                'read_bytes': last['read_bytes'], 'write_bytes': last['write_bytes'],
+                'read_rate': round(last['read_bytes'] / duration) if duration > 0 else None,
+                'write_rate': round(last['write_bytes'] / duration) if duration > 0 else None,
+                'memory_alerts': self.memory_alerts}
+
+    def write_report(self, report_file, **extra):
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(dict(extra, summary=self.get_summary(), samples=self.samples), f, indent=1)
+        return report_file
+
+def get_resource_report_path(output_file):
+    return f"{os.path.splitext(str(output_file))[0]}.resources.json"
+
+def make_clip(path, info):
+    video_stream = get_video_stream(info) or {}
+    return filtergraph.Clip(path, float(info['format']['duration']), get_audio_stream(info) is not None,
+                            width=video_stream.get('width'), height=video_stream.get('height'),
+                            fps=video_stream.get('r_frame_rate'), avg_fps=video_stream.get('avg_frame_rate'),
+                            sar=video_stream.get('sample_aspect_ratio'), pix_fmt=video_stream.get('pix_fmt'))
+
+def get_video_stream(info):
+    return next((stream for stream in info.get('streams', []) if stream.get('codec_type') == 'video'), None)
+
+def get_audio_stream(info):
+    return next((stream for stream in info.get('streams', []) if stream.get('codec_type') == 'audio'), None)
+
+
+PROBE_CACHE_SAVE_DELAY = 2.0
+PROBE_CACHE_LOG_LIMIT = 1000
+
+class ProbeCache:
+    def __init__(self, cache_file=None, max_entries=5000):
+        self.cache_file = cache_file or os.path.join(get_cache_dir(), 'probe_cache.json')
+        self.log_file = f"{os.path.splitext(self.cache_file)[0]}.log"
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.save_timer = None
+        self.changed = {}
+        self.log_entries = 0
+        self.load()
+
+    def make_key(self, file_path):
+        return get_file_identity(file_path)
+
+    def load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        log_entries = []
+        try:
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        log_entries.append(json.loads(line))
+                    except ValueError:
+                        pass
+        except OSError:
+            pass
+        with self.lock:
+            for key, info in data.get('entries', []) + log_entries:
+                self.entries[key] = info
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.log_entries = len(log_entries)
+
+    def save(self):
+        with self.save_lock:
+            with self.lock:
+                self.save_timer = None
+                if not self.changed:
+                    return
+                changed = list(self.changed.items())
+                self.changed = {}
+                compact = self.log_entries + len(changed) > max(PROBE_CACHE_LOG_LIMIT, len(self.entries))
+                if compact:
+                    data = {'entries': list(self.entries.items())}
+                    self.log_entries = 0
+                else:
+                    self.log_entries += len(changed)
+            try:
+                if compact:
+                    temp_file = f"{self.cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    with open(temp_file, 'w', encoding='utf-8') as f:
+                        json.dump(data, f)
+                    os.replace(temp_file, self.cache_file)
+                    if os.path.exists(self.log_file):
+                        os.remove(self.log_file)
+                else:
+                    with open(self.log_file, 'a', encoding='utf-8') as f:
+                        f.write(''.join(json.dumps([key, info]) + '\n' for key, info in changed))
+            except OSError:
+                pass
+
+    def schedule_save(self, delay=PROBE_CACHE_SAVE_DELAY):
+        with self.lock:
+            if self.save_timer is not None:
+                return
+            self.save_timer = threading.Timer(delay, self.save)
+            self.save_timer.start()
+
+    def get(self, file_path):
+        key = self.make_key(file_path)
+        if key is None:
+            return None
+        with self.lock:
+            info = self.entries.get(key)
+            if info is not None:
+                self.entries.move_to_end(key)
+            return info
+
+    def put(self, file_path, info):
+        key = self.make_key(file_path)
+        if key is None:
+            return
+        with self.lock:
+            self.entries[key] = info
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.changed[key] = info
+
+class ProbeService:
+    def __init__(self, cache=None, max_workers=8):
+        self.cache = cache or ProbeCache()
+        self.max_workers = max_workers
+
+    def run_ffprobe(self, file_path):
+        result = run_subprocess_simple([FFPROBE_PATH, '-v', 'quiet', '-print_format', 'json',
+                                       '-show_format', '-show_streams', file_path],
+                                      capture_output=True, text=True)
+        info = json.loads(result.stdout)
+        if 'format' not in info:
+            raise Exception(f"Unable to read video info: {os.path.basename(file_path)}")
+        return info
+
+    def probe(self, file_path):
+        info = self.cache.get(file_path)
+        if info is None:
+            info = self.run_ffprobe(file_path)
+            self.cache.put(file_path, info)
+            self.cache.schedule_save()
+        return info
+
+    def probe_many(self, file_paths):
+        from concurrent.futures import ThreadPoolExecutor
+        results = {file_path: self.cache.get(file_path) for file_path in file_paths}
+        missing = list(dict.fromkeys(f for f, info in results.items() if info is None))
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                for file_path, info in zip(missing, executor.map(self.run_ffprobe, missing)):
+                    self.cache.put(file_path, info)
+                    results[file_path] = info
+            self.cache.save()
+
+        return [results[file_path] for file_path in file_paths]
+
+_probe_service = None
+_probe_service_lock = threading.Lock()
+
+def get_probe_service():
+    global _probe_service
+    with _probe_service_lock:
+        if _probe_service is None:
+            _probe_service = ProbeService()
+        return _probe_service
+
+class ProbeWorker(QThread):
+    probed = pyqtSignal(str, dict)
+
+    def __init__(self, files):
+        super().__init__()
+        self.files = files
+
+    def run(self):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        service = get_probe_service()
+        with ThreadPoolExecutor(max_workers=service.max_workers) as executor:
+            futures = {executor.submit(service.probe, f): f for f in self.files}
+            for future in as_completed(futures):
+                try:
+                    self.probed.emit(futures[future], future.result())
+                except Exception:
+                    continue
+        service.cache.save()
+
+HARDWARE_ENCODERS = {'NVIDIA': 'h264_nvenc', 'RADEON': 'h264_amf', 'AMD': 'h264_amf', 'Intel': 'h264_qsv'}
+HARDWARE_ENCODER_ORDER = ['h264_nvenc', 'h264_qsv', 'h264_amf', 'h264_videotoolbox']
+SOFTWARE_ENCODER_ORDER = ['libx264', 'libopenh264']
+
+ENCODING_PROFILES = {
+    'fast': {
+        'libx264': ['-preset', 'veryfast', '-crf', '23'],
+        'libx265': ['-preset', 'veryfast', '-crf', '28'],
+        'libopenh264': ['-b:v', '8M'],
+        'h264_nvenc': ['-preset', 'p2', '-rc', 'vbr', '-cq', '23'],
+        'h264_qsv': ['-preset', 'veryfast', '-global_quality', '23'],
+        'h264_amf': ['-quality', 'speed', '-rc', 'cqp', '-qp_i', '23', '-qp_p', '23'],
+        'h264_videotoolbox': ['-q:v', '55'],
+    },
+    'balanced': {
+        'libx264': ['-preset', 'medium', '-crf', '23'],
+        'libx265': ['-preset', 'medium', '-crf', '26'],
+        'libopenh264': ['-b:v', '12M'],
+        'h264_nvenc': ['-preset', 'p4', '-rc', 'vbr', '-cq', '21'],
+        'h264_qsv': ['-preset', 'medium', '-global_quality', '21'],
+        'h264_amf': ['-quality', 'balanced', '-rc', 'cqp', '-qp_i', '21', '-qp_p', '21'],
+        'h264_videotoolbox': ['-q:v', '65'],
+    },
+    'quality': {
+        'libx264': ['-preset', 'slow', '-crf', '18'],
+        'libx265': ['-preset', 'slow', '-crf', '22'],
+        'libopenh264': ['-b:v', '20M'],
+        'h264_nvenc': ['-preset', 'p6', '-rc', 'vbr', '-cq', '19'],
+        'h264_qsv': ['-preset', 'veryslow', '-global_quality', '19'],
+        'h264_amf': ['-quality', 'quality', '-rc', 'cqp', '-qp_i', '19', '-qp_p', '19'],
+        'h264_videotoolbox': ['-q:v', '75'],
+    },
+}
+DEFAULT_PROFILE = 'balanced'
+
+def get_profile_args(encoder, profile):
+    return list(ENCODING_PROFILES.get(profile, ENCODING_PROFILES[DEFAULT_PROFILE]).get(encoder, []))
+
+ENCODER_ERROR_PATTERN = re.compile(r'error (while opening|initializing) (encoder|output stream)|could not open encoder|'
+                                   r'OpenEncodeSession|no capable devices|cannot load|unknown encoder|encoder not found',
+                                   re.IGNORECASE)
+
+ENCODER_LINE_ERROR_PATTERN = re.compile(r'error|fail|cannot|could not|unable|not supported|no usable|no capable|invalid',
+                                        re.IGNORECASE)
+ENCODER_FAILURE_TTL = 10 * 60
+
+class EncoderStartError(Exception):
+    pass
+
+def is_encoder_error(lines, encoder):
+    return any(ENCODER_ERROR_PATTERN.search(line) or
+               (f"[{encoder} @" in line and ENCODER_LINE_ERROR_PATTERN.search(line)) for line in lines)
+
+class EncoderRegistry:
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file or os.path.join(get_cache_dir(), 'encoders.json')
+        self.lock = threading.Lock()
+        self.data = None
+
+    def get_ffmpeg_key(self):
+        ffmpeg_path = shutil.which(FFMPEG_PATH) or FFMPEG_PATH
+        try:
+            stat = os.stat(ffmpeg_path)
+        except OSError:
+            return None
+        return f"{os.path.abspath(ffmpeg_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def probe(self):
+        with self.lock:
+            if self.data is not None:
+                return self.data
+
+            key = self.get_ffmpeg_key()
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if key and cached.get('key') == key:
+                    self.data = cached
+                    return self.data
+            except (OSError, ValueError):
+                pass
+
+            self.data = {'key': key, 'encoders': self.run_list('-encoders'), 'hwaccels': self.run_list('-hwaccels'),
+                         'verified': {}}
+            self.save()
+            return self.data
+
+    def run_list(self, option):
+        try:
+            result = run_subprocess_simple([FFMPEG_PATH, '-hide_banner', option], capture_output=True, text=True)
+        except OSError:
+            return None
+        if option == '-encoders':
+            names = []
+            for line in result.stdout.splitlines():
+                parts = line.split()
+                if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in 'VAS' and parts[1] != '=':
+                    names.append(parts[1])
+            return names
+        return [line.strip() for line in result.stdout.splitlines()[1:] if line.strip()]
+
+    def save(self):
+        if not self.data or not self.data.get('key'):
+            return
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f)
+        except OSError:
+            pass
+
+    def has_encoder(self, encoder):
+        encoders = self.probe()['encoders']
+        return encoders is None or encoder in encoders
+
+    def verify(self, encoder):
+        data = self.probe()
+        with self.lock:
+            if data['verified'].get(encoder):
+                return True
+            failed_at = data.setdefault('failed', {}).get(encoder)
+            if failed_at and time.time() - failed_at < ENCODER_FAILURE_TTL:
+                return False
+        try:
+            result = run_subprocess_simple([FFMPEG_PATH, '-hide_banner', '-v', 'error', '-f', 'lavfi',
+                                           '-i', 'color=c=black:s=256x256:r=30:d=0.2', '-frames:v', '3',
+                                           '-c:v', encoder, '-f', 'null', '-'], capture_output=True, text=True)
+            works = result.returncode == 0
+        except OSError:
+            works = False
+        with self.lock:
+            if works:
+                data['verified'][encoder] = True
+                data['failed'].pop(encoder, None)
+            else:
+                data['verified'].pop(encoder, None)
+                data['failed'][encoder] = time.time()
+        self.save()
+        return works
+
+    def get_candidates(self, use_gpu=False, gpu_type=None):
+        candidates = []
+        if use_gpu:
+            preferred = HARDWARE_ENCODERS.get(gpu_type)
+            for encoder in ([preferred] if preferred else []) + HARDWARE_ENCODER_ORDER:
+                if encoder not in candidates and self.has_encoder(encoder) and self.verify(encoder):
+                    candidates.append(encoder)
+        candidates.extend(encoder for encoder in SOFTWARE_ENCODER_ORDER if self.has_encoder(encoder))
+        return candidates or ['libx264']
+
+_encoder_registry = None
+
+def get_encoder_registry():
+    global _encoder_registry
+    with _probe_service_lock:
+        if _encoder_registry is None:
+            _encoder_registry = EncoderRegistry()
+        return _encoder_registry
+
+DEFAULT_INTERMEDIATE_CACHE_BYTES = 20 * 1024 ** 3
+INTERMEDIATE_VIDEO_ARGS = ['-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'fastdecode', '-crf', '10', '-g', '1']
+INTERMEDIATE_AUDIO_ARGS = ['-c:a', 'pcm_s16le']
+
+class IntermediateCache:
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_INTERMEDIATE_CACHE_BYTES):
+        self.cache_dir = cache_dir or get_cache_dir('intermediates')
+        self.max_bytes = max_bytes
+
+    def get_filters(self, clip, output_format):
+        return filtergraph.normalize_filters(clip, output_format) + [
+            filtergraph.Filter('format', pix_fmts=output_format.pix_fmt)]
+
+    def get_path(self, clip, output_format):
+        key = get_cache_key('intermediate-v1', get_file_identity(clip.path),
+                            [str(f) for f in self.get_filters(clip, output_format)], repr(output_format),
+                            INTERMEDIATE_VIDEO_ARGS, INTERMEDIATE_AUDIO_ARGS if clip.has_audio else None)
+        return os.path.join(self.cache_dir, f"{key}.mkv")
+
+    def build_args(self, clip, output_format, partial_file):
+        ffmpeg_args = [FFMPEG_PATH, '-i', clip.path, '-map', '0:v:0',
+                       '-vf', ','.join(str(f) for f in self.get_filters(clip, output_format))]
+        if clip.has_audio:
+            ffmpeg_args.extend(['-map', '0:a:0', *INTERMEDIATE_AUDIO_ARGS])
+        ffmpeg_args.extend([*INTERMEDIATE_VIDEO_ARGS, '-y', partial_file])
+        return ffmpeg_args
+
+    def make_clip(self, clip, output_format, cache_file):
+        return filtergraph.Clip(cache_file, clip.duration, clip.has_audio, width=output_format.width,
+                                height=output_format.height, fps=output_format.fps, avg_fps=output_format.fps,
+                                sar='1:1', pix_fmt=output_format.pix_fmt)
+
+    def make_partial_path(self, cache_file):
+        fd, partial_file = tempfile.mkstemp(prefix=f"{os.path.basename(cache_file)}.", suffix='.part.mkv',
+                                            dir=self.cache_dir)
+        os.close(fd)
+        return partial_file
+
+    def prune(self, keep=()):
+        prune_cache_dir(self.cache_dir, self.max_bytes, keep=keep)
+
+SEGMENT_MANIFEST_VERSION = 1
+SEGMENT_KEY_IGNORED_ARGS = {'-i', '-threads', '-filter_complex_threads'}
+SEGMENT_DURATION_TOLERANCE = 0.001
+
+def get_file_checksum(file_path, block_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def get_media_duration(file_path):
+    try:
+        return float(get_probe_service().probe(file_path)['format']['duration'])
+    except Exception:
+        return None
+
+class SegmentManifest:
+    name = "Incremental render"
+    verify_pieces = False
+
+    def __init__(self, segment_dir, manifest_file=None):
+        self.segment_dir = segment_dir
+        self.manifest_file = manifest_file or os.path.join(segment_dir, 'manifest.json')
+        self.segments = {}
+        self.used = set()
+        self.lock = threading.Lock()
+        os.makedirs(segment_dir, exist_ok=True)
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == SEGMENT_MANIFEST_VERSION:
+                self.segments = data.get('segments', {})
+        except (OSError, ValueError):
+            pass
+
+    def make_key(self, job):
+        settings = []
+        skip = False
+        for arg in job['args'][1:-1]:
+            if not skip:
+                settings.append(arg)
+            skip = arg in SEGMENT_KEY_IGNORED_ARGS
+        return get_cache_key('segment-v1', [get_file_identity(path) for path in job['inputs']], settings)
+
+    def assign(self, job):
+        key = self.make_key(job)
+        segment_file = os.path.join(self.segment_dir, key + os.path.splitext(job['output'])[1])
+        self.used.add(key)
+        job['segment_key'] = key
+        job['output'] = segment_file
+        job['args'] = [*job['args'][:-1], segment_file]
+        entry = self.segments.get(key)
+        try:
+            if entry is None or os.path.getsize(segment_file) != entry['size']:
+                return False
+        except OSError:
+            return False
+        if not self.verify_pieces:
+            return True
+        duration = get_media_duration(segment_file)
+        return (entry.get('checksum') == get_file_checksum(segment_file) and duration is not None
+                and abs(duration - entry.get('duration', -1)) <= SEGMENT_DURATION_TOLERANCE)
+
+    def commit(self, job):
+        entry = {'label': job['label'], 'length': job['length'], 'size': os.path.getsize(job['output'])}
+        if self.verify_pieces:
+            entry.update(checksum=get_file_checksum(job['output']), duration=get_media_duration(job['output']))
+        with self.lock:
+            self.segments[job['segment_key']] = entry
+            self.write()
+
+    def write(self):
+        partial_file = f"{self.manifest_file}.tmp"
+        with open(partial_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': SEGMENT_MANIFEST_VERSION, 'segments': self.segments}, f, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial_file, self.manifest_file)
+
+    def finish(self):
+        with self.lock:
+            for key in list(self.segments):
+                if key not in self.used:
+                    del self.segments[key]
+            for entry in os.scandir(self.segment_dir):
+                if entry.path != self.manifest_file and os.path.splitext(entry.name)[0] not in self.used:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+            self.write()
+
+def get_segment_dir(output_file):
+    return f"{os.path.splitext(os.path.abspath(str(output_file)))[0]}.segments"
+
+def get_journal_paths(output_file):
+    base = os.path.splitext(os.path.abspath(str(output_file)))[0]
+    return f"{base}.journal.json", f"{base}.pieces"
+
+class RenderJournal(SegmentManifest):
+    name = "Resumed render"
+    verify_pieces = True
+
+    def __init__(self, output_file):
+        journal_file, piece_dir = get_journal_paths(output_file)
+        super().__init__(piece_dir, journal_file)
+
+    def finish(self):
+        shutil.rmtree(self.segment_dir, ignore_errors=True)
+        try:
+            os.remove(self.manifest_file)
+        except OSError:
+            pass
+
+FFMPEG_POLL_INTERVAL = 0.2
+FFMPEG_STOP_GRACE = 5.0
+FFMPEG_KILL_GRACE = 3.0
+DEFAULT_STALL_TIMEOUT = 120
+
+class FFmpegProcess:
+    def __init__(self, ffmpeg_args, stall_timeout=0, deadline=None):
+        if ffmpeg_args[-1] == STDOUT_OUTPUT:
+            self.process = run_subprocess(ffmpeg_args, stdin=subprocess.PIPE, stderr=subprocess.PIPE,
+                                          universal_newlines=True)
+            self.output = self.process.stderr
+        else:
+            self.process = run_subprocess(ffmpeg_args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                          stderr=subprocess.STDOUT, universal_newlines=True)
+            self.output = self.process.stdout
+        self.stall_timeout = stall_timeout
+        self.deadline = deadline
+        self.error = None
+        self.cancelled = threading.Event()
+        self.abandon_at = None
+        self.progress_value = None
+        self.last_progress = time.monotonic()
+        self.lines = queue.Queue()
+        self.reader = threading.Thread(target=self.read_output, daemon=True)
+        self.reader.start()
+
+    def read_output(self):
+        try:
+            for line in self.output:
+                self.lines.put(line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.lines.put(None)
+
+    def __iter__(self):
+        while True:
+            try:
+                line = self.lines.get(timeout=FFMPEG_POLL_INTERVAL)
+            except queue.Empty:
+                if self.abandon_at is not None and time.monotonic() > self.abandon_at:
+                    return
+                self.check_health()
+                continue
+            if line is None:
+                break
+            self.note_progress(line)
+            yield line
+            self.check_health()
+        if not self.cancelled.is_set():
+            self.process.wait()
+
+    def note_progress(self, line):
+        key, _, value = line.strip().partition('=')
+        if key == 'out_time_us' and value != self.progress_value:
+            self.progress_value = value
+            self.last_progress = time.monotonic()
+
+    def check_health(self):
+        if self.cancelled.is_set():
+            return
+        if self.deadline and time.time() > self.deadline:
+            self.cancel("FFmpeg job timed out")
+        elif self.stall_timeout and time.monotonic() - self.last_progress > self.stall_timeout:
+            self.cancel(f"FFmpeg stalled: no progress for {self.stall_timeout:g} s")
+
+    def cancel(self, error=None):
+        if self.cancelled.is_set():
+            return
+        self.error = error
+        self.abandon_at = time.monotonic() + FFMPEG_STOP_GRACE + FFMPEG_KILL_GRACE + 1
+        self.cancelled.set()
+        threading.Thread(target=self.reap, daemon=True).start()
+
+    def reap(self):
+        try:
+            self.process.stdin.write('q\n')
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            pass
+        for stop, grace in ((None, FFMPEG_STOP_GRACE), (self.process.terminate, FFMPEG_KILL_GRACE),
+                            (self.process.kill, None)):
+            if stop:
+                stop()
+            try:
+                self.process.wait(grace)
+                return
+            except subprocess.TimeoutExpired:
+                continue
+
+THROUGHPUT_HISTORY_WEIGHT = 0.3
+
+class ThroughputHistory:
+    def __init__(self, history_file=None):
+        self.history_file = history_file or os.path.join(get_cache_dir(), 'throughput_history.json')
+        self.lock = threading.Lock()
+
+    def make_key(self, encoder, width, height, profile, workers):
+        return f"{encoder}|{width}x{height}|{profile}|{workers}"
+
+    def load(self):
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('entries', {})
+        except (OSError, ValueError):
+            return {}
+
+    def record(self, encoder, width, height, profile, workers, duration, elapsed, size):
+        if duration <= 0 or elapsed <= 0:
+            return None
+        with self.lock:
+            entries = self.load()
+            key = self.make_key(encoder, width, height, profile, workers)
+            speed = duration / elapsed
+            bytes_per_second = size / duration
+            entry = entries.get(key)
+            if entry:
+                weight = THROUGHPUT_HISTORY_WEIGHT
+                speed = entry['speed'] * (1 - weight) + speed * weight
+                bytes_per_second = entry['bytes_per_second'] * (1 - weight) + bytes_per_second * weight
+            entries[key] = {'encoder': encoder, 'width': width, 'height': height, 'profile': profile,
+                            'workers': workers, 'speed': speed, 'bytes_per_second': bytes_per_second,
+                            'samples': (entry or {}).get('samples', 0) + 1, 'updated': time.time()}
+            temp_file = f"{self.history_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f, indent=2)
+            os.replace(temp_file, self.history_file)
+            return entries[key]
+
+    def estimate(self, encoder, width, height, profile, workers, duration):
+        entries = [entry for entry in self.load().values()
+                   if entry['encoder'] == encoder and entry['profile'] == profile]
+        if not entries:
+            return None
+        pixels = width * height
+        entry = min(entries, key=lambda e: (e['workers'] != workers, abs(e['width'] * e['height'] - pixels)))
+        scale = pixels / (entry['width'] * entry['height'])
+        exact = scale == 1 and entry['workers'] == workers
+        return {'wall_time': round(duration / entry['speed'] * scale, 1),
+                'output_size': int(duration * entry['bytes_per_second'] * scale),
+                'samples': entry['samples'],
+                'basis': 'measured' if exact else
+                         f"scaled from {entry['width']}x{entry['height']} with {entry['workers']} workers"}
+
+_throughput_history = None
+_throughput_history_lock = threading.Lock()
+
+def get_throughput_history():
+    global _throughput_history
+    with _throughput_history_lock:
+        if _throughput_history is None:
+            _throughput_history = ThroughputHistory()
+        return _throughput_history
+
+class FFmpegWorker(QThread):
+    finished = pyqtSignal(bool, str)
+    progress = pyqtSignal(str)
+    progress_info = pyqtSignal(dict)
+    resource_sample = pyqtSignal(dict)
+
+    def __init__(self, segments, output_file, transition_duration, transition_type, ffmpeg_path, use_gpu=False, smart_render=False,
+                 threads=0, output_format=None, profile=DEFAULT_PROFILE, use_cache=False,
+                 cache_size=DEFAULT_INTERMEDIATE_CACHE_BYTES, incremental=False, memory_alert_mb=0,
+                 resumable=False, stall_timeout=DEFAULT_STALL_TIMEOUT, timeout=0, output_mode='mp4',
+                 faststart=False, hls_time=DEFAULT_HLS_TIME, hls_list_size=0):
+        super().__init__()
+        self.segments = segments
+        self.output_file = output_file
+        self.transition_duration = transition_duration
+        self.transition_type = transition_type
+        self.ffmpeg_path = ffmpeg_path
+        self.use_gpu = use_gpu
+        self.smart_render = smart_render
+        self.threads = threads
+        self.output_format = output_format or {}
+        self.profile = profile
+        self.use_cache = use_cache
+        self.cache_size = cache_size
+        self.incremental = incremental
+        self.memory_alert_mb = memory_alert_mb
+        self.resumable = resumable
+        self.stall_timeout = stall_timeout
+        self.timeout = timeout
+        self.output_mode = output_mode
+        self.faststart = faststart
+        self.hls_time = hls_time
+        self.hls_list_size = hls_list_size
+        self.deadline = None
+        self.segment_store = None
+        self.resource_summary = None
+        self.video_encoder = None
+        self.encoder_started = False
+        self.gpu_type = 'GPU'
+        self.total_duration = 0
+        self.record_history = True
+        self.fully_encoded = True
+        self.is_running = True
+        self.process = None
+        self.supervisor = None
+
+    def run(self):
+        self.deadline = time.time() + self.timeout if self.timeout else None
+        sampler = self.start_resource_sampler()
+        started = time.time()
+        try:
+            if self.is_running:
+                self.process_videos()
+                if self.is_running:
+                    self.record_throughput(time.time() - started)
+                    self.finished.emit(True, "Video processing completed successfully!")
+                else:
+                    self.finished.emit(False, "Processing stopped by user")
+        except Exception as e:
+            self.finished.emit(False, str(e))
+        finally:
+            if sampler:
+                self.finish_resource_sampler(sampler)
+
+    def start_resource_sampler(self):
+        if not self.output_file:
+            return None
+        sampler = ResourceSampler(self.get_processes, memory_alert_bytes=self.memory_alert_mb * 1024 ** 2,
+                                  on_sample=self.resource_sample.emit,
+                                  on_alert=lambda message: self.progress.emit(f"⚠️ {message}"))
+        sampler.start()
+        return sampler
+
+    def finish_resource_sampler(self, sampler):
+        self.resource_summary = sampler.stop()
+        try:
+            report_file = sampler.write_report(get_resource_report_path(self.output_file),
+                                               output_file=str(self.output_file), clips=len(self.segments))
+        except OSError:
+            return
+        self.progress.emit(f"Resource report written to {report_file}")
+    
+    def record_throughput(self, elapsed):
+        if not self.record_history or not self.fully_encoded or self.output_mode in ('hls', 'pipe'):
+            return
+        try:
+            info = get_probe_service().run_ffprobe(self.output_file)
+            video_stream = get_video_stream(info) or {}
+            get_throughput_history().record(self.video_encoder, video_stream.get('width'), video_stream.get('height'),
+                                            self.profile, self.get_worker_count(),
+                                            float(info['format']['duration']), elapsed,
+                                            os.path.getsize(self.output_file))
+        except Exception:
+            pass
+
+    def get_worker_count(self):
+        return 1
+
+    def get_output_path(self):
+        if self.output_mode == 'pipe':
+            return STDOUT_OUTPUT
+        if self.output_mode == 'hls':
+            return f"{os.path.splitext(self.output_file)[0]}.m3u8"
+        return self.output_file
+
+    def get_output_args(self):
+        if self.output_mode == 'hls':
+            output_args = ['-f', 'hls', '-hls_time', f"{self.hls_time:g}", '-hls_list_size', str(self.hls_list_size),
+                           '-hls_segment_filename', f"{os.path.splitext(self.output_file)[0]}_%05d.ts"]
+            if self.hls_list_size:
+                output_args.extend(['-hls_flags', 'delete_segments+temp_file'])
+            else:
+                output_args.extend(['-hls_playlist_type', 'event', '-hls_flags', 'temp_file'])
+        elif self.output_mode in ('fmp4', 'pipe'):
+            output_args = ['-f', 'mp4', '-movflags', FRAGMENTED_MP4_FLAGS]
+        elif self.faststart and os.path.splitext(self.output_file)[1].lower() in FASTSTART_EXTENSIONS:
+            output_args = ['-movflags', '+faststart']
+        else:
+            output_args = []
+        return output_args + ['-y', self.get_output_path()]
+
+    def stop(self):
+        self.is_running = False
+        if self.supervisor:
+            self.supervisor.cancel()
+
+    def get_processes(self):
+        process = self.process
+        return [process] if process and process.poll() is None else []
+
+    def get_video_info(self, file_path):
+        return get_probe_service().probe(file_path)
+
+    def get_file_info(self):
+        return get_probe_service().probe_many(self.segments)
+
+    def get_clips(self, file_info):
+        return [make_clip(path, info) for path, info in zip(self.segments, file_info)]
+
+    def choose_output_format(self, clips):
+        output_format = filtergraph.choose_output_format(clips, **self.output_format)
+        skipped = sum(1 for clip in clips if len(filtergraph.normalize_filters(clip, output_format)) == 1)
+        self.progress.emit(f"Output format: {output_format} ({skipped} of {len(clips)} clips need no normalization)")
+        return output_format
+
+    def get_keyframes(self, file_path):
+        start_time = parse_float(self.get_video_info(file_path)['format'].get('start_time'), 0.0)
+        result = run_subprocess_simple([FFPROBE_PATH, '-v', 'quiet', '-select_streams', 'v:0',
+                                       '-show_entries', 'packet=pts_time,flags', '-of', 'csv=print_section=0',
+                                       file_path], capture_output=True, text=True)
+        keyframes = []
+        for line in result.stdout.splitlines():
+            parts = line.strip().split(',')
+            if len(parts) >= 2 and 'K' in parts[1] and parts[0] not in ('', 'N/A'):
+                keyframes.append(float(parts[0]) - start_time)
+        return sorted(keyframes)
+
+    def get_stream_copy_issue(self, file_info):
+        video_streams = [get_video_stream(info) for info in file_info]
+        if any(stream is None for stream in video_streams):
+            return "an input has no video stream"
+
+        first = video_streams[0]
+        if first.get('codec_name') not in SMART_RENDER_VIDEO_ENCODERS:
+            return f"video codec {first.get('codec_name')} cannot be re-encoded to match"
+        for key in ('codec_name', 'width', 'height', 'pix_fmt', 'r_frame_rate', 'sample_aspect_ratio'):
+            if any(stream.get(key) != first.get(key) for stream in video_streams[1:]):
+                return f"inputs differ in video {key}"
+
+        audio_streams = [get_audio_stream(info) for info in file_info]
+        if any(stream is None for stream in audio_streams) and not all(stream is None for stream in audio_streams):
+            return "some inputs have audio and some do not"
+        if audio_streams[0] is not None:
+            if audio_streams[0].get('codec_name') not in SMART_RENDER_AUDIO_ENCODERS:
+                return f"audio codec {audio_streams[0].get('codec_name')} cannot be re-encoded to match"
+            for key in ('codec_name', 'sample_rate', 'channels'):
+                if any(stream.get(key) != audio_streams[0].get(key) for stream in audio_streams[1:]):
+                    return f"inputs differ in audio {key}"
+
+        return None
+
+    def build_smart_render_plan(self, file_info):
+        file_lengths = [float(info['format']['duration']) for info in file_info]
+        count = len(self.segments)
+        starts = []
+        ends = []
+
+        for i, file_path in enumerate(self.segments):
+            keyframes = self.get_keyframes(file_path) if count > 1 else []
+            start = 0.0
+            end = file_lengths[i]
+            if i > 0:
+                later = [k for k in keyframes if k >= self.transition_duration]
+                if not later:
+                    return None
+                start = later[0]
+            if i < count - 1:
+                earlier = [k for k in keyframes if k <= file_lengths[i] - self.transition_duration]
+                if not earlier:
+                    return None
+                end = earlier[-1]
+            if end <= start:
+                return None
+            starts.append(start)
+            ends.append(end)
+
+        plan = []
+        for i, file_path in enumerate(self.segments):
+            if i > 0:
+                plan.append({'type': 'transition', 'first': self.segments[i - 1], 'second': file_path,
+                             'tail_start': ends[i - 1], 'tail_length': file_lengths[i - 1] - ends[i - 1],
+                             'head_length': starts[i]})
+            plan.append({'type': 'copy', 'file': file_path, 'start': starts[i], 'length': ends[i] - starts[i]})
+        return plan
+
+    def smart_render_videos(self, file_info, plan):
+        video_stream = get_video_stream(file_info[0])
+        audio_stream = get_audio_stream(file_info[0])
+        work_dir = self.create_work_dir()
+        self.fully_encoded = False
+
+        try:
+            jobs = []
+            for index, piece in enumerate(plan):
+                piece_file = os.path.join(work_dir, f"piece_{index:05d}.ts")
+                if piece['type'] == 'copy':
+                    ffmpeg_args = [FFMPEG_PATH, '-ss', f"{piece['start']:.6f}", '-i', piece['file'],
+                                   '-t', f"{piece['length']:.6f}", '-map', '0:v:0']
+                    if audio_stream is not None:
+                        ffmpeg_args.extend(['-map', '0:a:0'])
+                    ffmpeg_args.extend(['-c', 'copy', '-bsf:v', SMART_RENDER_ANNEXB_FILTERS[video_stream['codec_name']],
+                                        '-avoid_negative_ts', 'make_zero', '-f', 'mpegts', '-y', piece_file])
+                    jobs.append({'label': f"Copy {os.path.basename(piece['file'])}", 'args': ffmpeg_args,
+                                 'output': piece_file, 'length': piece['length'], 'inputs': [piece['file']]})
+                else:
+                    jobs.append({'label': f"Transition {os.path.basename(piece['first'])} -> {os.path.basename(piece['second'])}",
+                                 'args': self.build_transition_args(piece, video_stream, audio_stream, piece_file),
+                                 'output': piece_file, 'length': self.get_piece_length(piece),
+                                 'inputs': [piece['first'], piece['second']]})
+
+            self.render_pieces(self.reuse_segments(jobs))
+            if not self.is_running:
+                return
+
+            self.concat_pieces([job['output'] for job in jobs], work_dir)
+            self.finish_segments()
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def get_piece_length(self, piece):
+        if piece['type'] == 'copy':
+            return piece['length']
+        return piece['tail_length'] + piece['head_length'] - self.transition_duration
+
+    def open_segment_store(self):
+        if self.incremental:
+            return SegmentManifest(get_segment_dir(self.get_state_file()))
+        if self.resumable:
+            return RenderJournal(self.get_state_file())
+        return None
+
+    def reuse_segments(self, jobs):
+        self.segment_store = self.open_segment_store()
+        if self.segment_store is None:
+            return jobs
+        pending = {}
+        for job in jobs:
+            if not self.segment_store.assign(job):
+                pending.setdefault(job['segment_key'], job)
+        pending = list(pending.values())
+        if len(pending) < len(jobs):
+            self.fully_encoded = False
+        self.progress.emit(f"{self.segment_store.name}: reusing {len(jobs) - len(pending)} of {len(jobs)} pieces")
+        return pending
+
+    def commit_piece(self, job):
+        if self.segment_store is not None and 'segment_key' in job:
+            self.segment_store.commit(job)
+
+    def finish_segments(self):
+        if self.segment_store is not None:
+            self.segment_store.finish()
+            self.segment_store = None
+
+    def get_work_root(self):
+        if self.output_file:
+            return os.path.dirname(os.path.abspath(self.output_file))
+        return tempfile.gettempdir()
+
+    def get_state_file(self):
+        if self.output_file:
+            return self.output_file
+        return os.path.join(tempfile.gettempdir(), f"xfade_{get_cache_key([os.path.abspath(p) for p in self.segments])}.mp4")
+
+    def create_work_dir(self):
+        return tempfile.mkdtemp(prefix='.xfade_', dir=self.get_work_root())
+
+    def render_pieces(self, jobs):
+        self.total_duration = sum(job['length'] for job in jobs)
+        offset = 0
+        for job in jobs:
+            if not self.is_running:
+                return
+            self.progress.emit(job['label'])
+            self.run_ffmpeg(job['args'], offset=offset)
+            if not self.is_running:
+                return
+            self.commit_piece(job)
+            offset += job['length']
+
+    def concat_pieces(self, pieces, work_dir, audio_file=None):
+        concat_list = os.path.join(work_dir, 'concat.txt')
+        with open(concat_list, 'w', encoding='utf-8') as f:
+            for piece_file in pieces:
+                escaped = piece_file.replace('\\', '/').replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        self.progress.emit("Joining segments...")
+        ffmpeg_args = [FFMPEG_PATH, '-f', 'concat', '-safe', '0', '-i', concat_list]
+        if audio_file:
+            ffmpeg_args.extend(['-i', audio_file, '-map', '0:v', '-map', '1:a'])
+        else:
+            ffmpeg_args.extend(['-map', '0'])
+        ffmpeg_args.extend(['-c', 'copy', *self.get_output_args()])
+        self.run_ffmpeg(ffmpeg_args)
+
+    def build_transition_args(self, piece, video_stream, audio_stream, piece_file):
+        fps = video_stream.get('r_frame_rate', '30/1')
+        offset = max(piece['tail_length'] - self.transition_duration, 0)
+        filter_complex = (f"[0:v]fps={fps}[t0];[1:v]fps={fps}[t1];"
+                          f"[t0][t1]xfade=transition={self.transition_type}:duration={self.transition_duration}:offset={offset:.3f},"
+                          f"format=pix_fmts={video_stream.get('pix_fmt', 'yuv420p')}[final]")
+        if audio_stream is not None:
+            filter_complex += f";[0:a][1:a]acrossfade=d={self.transition_duration}[audio]"
+
+        ffmpeg_args = [FFMPEG_PATH,
+                       '-ss', f"{piece['tail_start']:.6f}", '-i', piece['first'],
+                       '-t', f"{piece['head_length']:.6f}", '-i', piece['second'],
+                       '-filter_complex', filter_complex,
+                       '-map', '[final]']
+        if audio_stream is not None:
+            ffmpeg_args.extend(['-map', '[audio]',
+                                '-c:a', SMART_RENDER_AUDIO_ENCODERS[audio_stream['codec_name']],
+                                '-ar', str(audio_stream.get('sample_rate', 48000)),
+                                '-ac', str(audio_stream.get('channels', 2))])
+            if audio_stream.get('bit_rate'):
+                ffmpeg_args.extend(['-b:a', str(audio_stream['bit_rate'])])
+
+        encoder = SMART_RENDER_VIDEO_ENCODERS[video_stream['codec_name']]
+        ffmpeg_args.extend(['-c:v', encoder, *get_profile_args(encoder, self.profile), '-r', fps,
+                            *self.get_thread_args(), '-flags:v', '-global_header', '-f', 'mpegts', '-y', piece_file])
+        return ffmpeg_args
+
+    def start_ffmpeg(self, ffmpeg_args):
+        return FFmpegProcess(with_progress_args(ffmpeg_args), stall_timeout=self.stall_timeout,
+                             deadline=self.deadline)
+
+    def run_ffmpeg(self, ffmpeg_args, offset=0):
+        parser = ProgressParser(self.total_duration, offset)
+        output_lines = deque(maxlen=50)
+        self.encoder_started = False
+        self.supervisor = self.start_ffmpeg(ffmpeg_args)
+        self.process = self.supervisor.process
+        if not self.is_running:
+            self.supervisor.cancel()
+
+        for line in self.supervisor:
+            handled, info = parser.feed(line)
+            if info:
+                self.encoder_started = self.encoder_started or info['frame'] > 0
+                self.progress_info.emit(info)
+            elif not handled:
+                output_lines.append(line)
+                self.progress.emit(line.strip())
+
+        if self.supervisor.error:
+            raise Exception(self.supervisor.error)
+        if self.is_running and self.process.returncode != 0:
+            if not self.encoder_started and self.video_encoder and is_encoder_error(output_lines, self.video_encoder):
+                raise EncoderStartError("FFmpeg process failed before encoding started")
+            raise Exception("FFmpeg process failed")
+
+    def get_smart_render_plan(self, file_info):
+        issue = self.get_stream_copy_issue(file_info)
+        plan = None if issue else self.build_smart_render_plan(file_info)
+        if plan is None and not issue:
+            issue = "clips have no keyframes outside the transition windows"
+        return plan, issue
+
+    def get_smart_render_encoder(self, file_info):
+        return f"copy+{SMART_RENDER_VIDEO_ENCODERS[get_video_stream(file_info[0])['codec_name']]}"
+
+    def try_smart_render(self, file_info):
+        plan, issue = self.get_smart_render_plan(file_info)
+        if plan is not None:
+            self.video_encoder = self.get_smart_render_encoder(file_info)
+            self.smart_render_videos(file_info, plan)
+            return True
+        self.progress.emit(f"Smart render unavailable ({issue}). Falling back to full re-encode.")
+        return False
+
+    def get_thread_args(self):
+        if self.threads > 0:
+            return ['-threads', str(self.threads), '-filter_complex_threads', str(self.threads)]
+        return []
+
+    def get_video_encoders(self):
+        encoders = get_encoder_registry().get_candidates(self.use_gpu, self.gpu_type)
+        if self.use_gpu and encoders[0] in SOFTWARE_ENCODER_ORDER:
+            self.progress.emit("No working GPU encoder found. Falling back to CPU encoding.")
+        return encoders
+
+    def get_video_encoder_args(self, encoder=None):
+        encoder = encoder or self.video_encoder or self.get_video_encoders()[0]
+        encoder_args = ['-c:v', encoder, *get_profile_args(encoder, self.profile), *self.get_thread_args()]
+        if self.output_mode == 'hls':
+            encoder_args.extend(['-force_key_frames', f"expr:gte(t,n_forced*{self.hls_time:g})"])
+        return encoder_args
+
+    def run_with_encoder_fallback(self, build_args):
+        encoders = self.get_video_encoders()
+        for index, encoder in enumerate(encoders):
+            self.video_encoder = encoder
+            self.progress.emit(f"Encoding with {encoder} ({self.profile} profile)")
+            try:
+                self.run_ffmpeg(build_args(self.get_video_encoder_args(encoder)))
+                return
+            except EncoderStartError:
+                if index == len(encoders) - 1:
+                    raise Exception(f"FFmpeg failed to start with any encoder ({', '.join(encoders)})")
+                self.progress.emit(f"Encoder {encoder} failed to start, falling back to {encoders[index + 1]}")
+
+    def process_videos(self):
+        file_info = self.get_file_info()
+
+        if self.smart_render and self.try_smart_render(file_info):
+            return
+
+        clips = self.get_clips(file_info)
+        output_format = self.choose_output_format(clips)
+        clips = self.prepare_intermediates(clips, output_format)
+        if not self.is_running:
+            return
+        input_paths = [clip.path for clip in clips]
+
+        use_movie_sources = filtergraph.needs_movie_sources(input_paths)
+        graph, video_output, audio_output, self.total_duration = filtergraph.build_xfade_graph(
+            clips, self.transition_type, self.transition_duration, output_format,
+            use_movie_sources=use_movie_sources)
+
+        ffmpeg_args = [FFMPEG_PATH]
+        if not use_movie_sources:
+            ffmpeg_args.extend(sum([['-i', f] for f in input_paths], []))
+
+        script_file = None
+        graph_text = graph.to_string()
+        if use_movie_sources or filtergraph.needs_filter_script(graph_text, input_paths):
+            script_file = self.write_filter_script(graph)
+            ffmpeg_args.extend(['-filter_complex_script', script_file])
+        else:
+            ffmpeg_args.extend(['-filter_complex', graph_text])
+        ffmpeg_args.extend(['-map', filtergraph.get_map_label(video_output)])
+
+        if audio_output:
+            ffmpeg_args.extend(['-map', filtergraph.get_map_label(audio_output)])
+        else:
+            ffmpeg_args.extend(['-an'])
+
+        try:
+            self.run_with_encoder_fallback(lambda encoder_args: ffmpeg_args + encoder_args + self.get_output_args())
+        finally:
+            if script_file:
+                os.remove(script_file)
+
+    def build_plan(self):
+        file_info = self.get_file_info()
+        clips = self.get_clips(file_info)
+        output_format = filtergraph.choose_output_format(clips, **self.output_format)
+        graph, _, audio_output, duration = filtergraph.build_xfade_graph(
+            clips, self.transition_type, self.transition_duration, output_format)
+        offsets = filtergraph.get_transition_offsets([clip.duration for clip in clips], self.transition_duration)
+        plan = {
+            'output_file': str(self.get_output_path()),
+            'output_mode': self.output_mode,
+            'output_format': {'width': output_format.width, 'height': output_format.height,
+                              'fps': output_format.fps, 'pix_fmt': output_format.pix_fmt},
+            'transition': self.transition_type,
+            'transition_duration': self.transition_duration,
+            'profile': self.profile,
+            'workers': self.get_worker_count(),
+            'duration': round(duration, 3),
+            'audio': audio_output is not None,
+            'clips': [],
+        }
+        for i, clip in enumerate(clips):
+            filters = filtergraph.normalize_filters(clip, output_format)
+            plan['clips'].append({'path': clip.path, 'duration': clip.duration, 'has_audio': clip.has_audio,
+                                  'resolution': f"{clip.width}x{clip.height}", 'fps': clip.fps,
+                                  'offset': round(offsets[i], 3) if i > 0 else None,
+                                  'scale': any(f.name == 'scale' for f in filters),
+                                  'fps_conversion': any(f.name == 'fps' for f in filters),
+                                  'filters': ','.join(str(f) for f in filters)})
+
+        if self.smart_render:
+            pieces, issue = self.get_smart_render_plan(file_info)
+            if pieces is not None:
+                plan.update(mode='smart_render', encoder=self.get_smart_render_encoder(file_info), pieces=pieces,
+                            duration=round(sum(self.get_piece_length(piece) for piece in pieces), 3))
+                return plan
+            plan['smart_render_issue'] = issue
+
+        encode = self.describe_encode(clips, output_format, graph)
+        for clip, offset in zip(plan['clips'][1:], encode.pop('offsets', offsets[1:])):
+            clip['offset'] = round(offset, 3)
+        plan.update(encode)
+        return plan
+
+    def describe_encode(self, clips, output_format, graph):
+        return {'mode': 'single', 'encoder': self.get_video_encoders()[0], 'filtergraph': graph.to_string(),
+                'filter_script': filtergraph.needs_filter_script(graph.to_string(), [clip.path for clip in clips])}
+
+    def prepare_intermediates(self, clips, output_format):
+        if not self.use_cache:
+            return clips
+
+        cache = IntermediateCache(max_bytes=self.cache_size)
+        prepared = []
+        jobs = []
+        for source, clip in zip(self.segments, clips):
+            cache_file = cache.get_path(clip, output_format)
+            if os.path.exists(cache_file):
+                os.utime(cache_file)
+            else:
+                jobs.append({'label': f"Caching {os.path.basename(source)}", 'output': cache_file,
+                             'args': cache.build_args(clip, output_format, cache.make_partial_path(cache_file)),
+                             'length': clip.duration})
+            prepared.append(cache.make_clip(clip, output_format, cache_file))
+
+        self.progress.emit(f"Intermediate cache: {len(clips) - len(jobs)} of {len(clips)} clips reused")
+        self.total_duration = sum(job['length'] for job in jobs)
+        offset = 0
+        try:
+            for job in jobs:
+                if not self.is_running:
+                    break
+                self.progress.emit(job['label'])
+                self.run_ffmpeg(job['args'], offset=offset)
+                if self.is_running:
+                    os.replace(job['args'][-1], job['output'])
+                offset += job['length']
+        finally:
+            for job in jobs:
+                if os.path.exists(job['args'][-1]):
+                    os.remove(job['args'][-1])
+
+        cache.prune(keep={clip.path for clip in prepared})
+        return prepared
+
+    def write_filter_script(self, graph):
+        fd, script_file = tempfile.mkstemp(prefix='.xfade_', suffix='.txt', dir=self.get_work_root())
+        os.close(fd)
+        self.progress.emit(f"Filtergraph has {len(graph)} chains, writing it to {script_file}")
+        return graph.write_script(script_file)
+
+class ParallelFFmpegWorker(FFmpegWorker):
+    chunk_progress = pyqtSignal(int, str)
+
+    def __init__(self, *args, max_workers=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self.supervisors = []
+        self.process_lock = threading.Lock()
+        self.chunk_info = {}
+        self.frame_rate = 30.0
+
+    def stop(self):
+        self.is_running = False
+        self.terminate_processes()
+
+    def get_processes(self):
+        with self.process_lock:
+            return [supervisor.process for supervisor in self.supervisors if supervisor.process.poll() is None]
+
+    def terminate_processes(self):
+        with self.process_lock:
+            for supervisor in self.supervisors:
+                supervisor.cancel()
+
+    def get_worker_count(self):
+        return self.max_workers
+
+    def describe_encode(self, clips, output_format, graph):
+        jobs = self.build_chunk_jobs(clips, output_format, '')
+        offsets = []
+        position = 0.0
+        for job in jobs:
+            if len(job['inputs']) > 1:
+                offsets.append(position)
+            position += job['length']
+        return {'mode': 'chunks', 'encoder': self.video_encoder, 'duration': round(position, 3), 'offsets': offsets,
+                'chunks': [{'label': job['label'], 'length': round(job['length'], 3),
+                            'filter': job['args'][job['args'].index('-filter_complex') + 1]} for job in jobs]}
+
+    def get_thread_args(self):
+        if self.threads > 0:
+            threads = str(max(1, self.threads // self.max_workers))
+            return ['-threads', threads, '-filter_complex_threads', threads]
+        return []
+
+    def snap_to_frame(self, seconds):
+        return round(seconds * self.frame_rate) / self.frame_rate
+
+    def get_timeline(self, clips, output_format):
+        self.frame_rate = output_format.frame_rate
+        lengths = [self.snap_to_frame(clip.duration) for clip in clips[:-1]] + [clips[-1].duration]
+        return lengths, self.snap_to_frame(self.transition_duration)
+
+    def build_chunk_jobs(self, clips, output_format, work_dir):
+        file_lengths, duration = self.get_timeline(clips, output_format)
+        pixel_format = filtergraph.Filter('format', pix_fmts=output_format.pix_fmt)
+        normalizers = [','.join(str(f) for f in filtergraph.normalize_filters(clip, output_format) + [pixel_format])
+                       for clip in clips]
+        self.video_encoder = self.video_encoder or self.get_video_encoders()[0]
+        self.progress.emit(f"Encoding chunks with {self.video_encoder} ({self.profile} profile)")
+        encoder_args = self.get_video_encoder_args()
+        count = len(self.segments)
+        jobs = []
+
+        for i, clip in enumerate(clips):
+            file_path = clip.path
+            start = duration if i > 0 else 0
+            end = file_lengths[i] - duration if i < count - 1 else file_lengths[i]
+            if end < start:
+                raise Exception(f"Clip is shorter than its transitions: {os.path.basename(self.segments[i])}")
+
+            if i > 0:
+                previous = clips[i - 1].path
+                tail_start = file_lengths[i - 1] - duration
+                piece_file = os.path.join(work_dir, f"chunk_{len(jobs):05d}.mkv")
+                filter_complex = (f"[0:v]{normalizers[i - 1]}[t0];[1:v]{normalizers[i]}[t1];"
+                                  f"[t0][t1]xfade=transition={self.transition_type}:duration={duration}:offset=0[final]")
+                jobs.append({'label': f"Transition {os.path.basename(self.segments[i - 1])} -> {os.path.basename(self.segments[i])}",
+                             'args': [FFMPEG_PATH, '-ss', f"{tail_start:.6f}", '-t', f"{duration:.6f}", '-i', previous,
+                                      '-t', f"{duration:.6f}", '-i', file_path,
+                                      '-filter_complex', filter_complex, '-map', '[final]', '-an',
+                                      *encoder_args, '-y', piece_file],
+                             'output': piece_file, 'length': duration,
+                             'inputs': [self.segments[i - 1], self.segments[i]]})
+
+            if end > start:
+                piece_file = os.path.join(work_dir, f"chunk_{len(jobs):05d}.mkv")
+                jobs.append({'label': f"Clip {os.path.basename(self.segments[i])}",
+                             'args': [FFMPEG_PATH, '-ss', f"{start:.6f}", '-t', f"{end - start:.6f}", '-i', file_path,
+                                      '-filter_complex', f"[0:v]{normalizers[i]}[final]", '-map', '[final]', '-an',
+                                      *encoder_args, '-y', piece_file],
+                             'output': piece_file, 'length': end - start, 'inputs': [self.segments[i]]})
+
+        return jobs
+
+    def build_audio_job(self, clips, output_format, work_dir):
+        lengths, duration = self.get_timeline(clips, output_format)
+        has_audio = [clip.has_audio for clip in clips]
+        graph = filtergraph.FilterGraph()
+        audio_inputs = []
+        for i, length in enumerate(lengths):
+            if has_audio[i]:
+                graph.add([f"{i}:a"], [filtergraph.Filter('apad'), filtergraph.Filter('atrim', end=f"{length:.6f}")],
+                          [f"trim{i}"])
+            audio_inputs.append(f"trim{i}")
+        last_audio_output = filtergraph.add_audio_crossfades(graph, has_audio, duration, audio_inputs)
+        if not last_audio_output:
+            return None
+
+        audio_file = os.path.join(work_dir, 'audio.m4a')
+        ffmpeg_args = [FFMPEG_PATH, *sum([['-i', f] for f in self.segments], [])]
+        ffmpeg_args.extend(['-filter_complex', graph.to_string(), '-map', filtergraph.get_map_label(last_audio_output),
+                            '-vn', '-c:a', 'aac', '-y', audio_file])
+        total_length = sum(lengths) - (len(lengths) - 1) * duration
+        return {'label': "Audio", 'args': ffmpeg_args, 'output': audio_file, 'length': total_length,
+                'count_progress': False}
+
+    def process_videos(self):
+        file_info = self.get_file_info()
+
+        if self.smart_render and self.try_smart_render(file_info):
+            return
+
+        clips = self.get_clips(file_info)
+        output_format = self.choose_output_format(clips)
+        clips = self.prepare_intermediates(clips, output_format)
+        if not self.is_running:
+            return
+
+        work_dir = self.create_work_dir()
+        try:
+            encoders = self.get_video_encoders()
+            for index, encoder in enumerate(encoders):
+                self.video_encoder = encoder
+                jobs = self.build_chunk_jobs(clips, output_format, work_dir)
+                audio_job = self.build_audio_job(clips, output_format, work_dir)
+                try:
+                    self.render_pieces(self.reuse_segments(jobs) + ([audio_job] if audio_job else []))
+                    break
+                except EncoderStartError:
+                    if index == len(encoders) - 1:
+                        raise Exception(f"FFmpeg failed to start with any encoder ({', '.join(encoders)})")
+                    self.progress.emit(f"Encoder {encoder} failed to start on a chunk, "
+                                       f"re-rendering all chunks with {encoders[index + 1]}")
+            if not self.is_running:
+                return
+
+            self.concat_pieces([job['output'] for job in jobs], work_dir,
+                               audio_file=audio_job['output'] if audio_job else None)
+            self.finish_segments()
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def render_pieces(self, jobs):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        self.progress.emit(f"Rendering {len(jobs)} chunks with {self.max_workers} parallel FFmpeg processes...")
+        for index, job in enumerate(jobs):
+            self.chunk_progress.emit(index, f"{job['label']}: queued")
+        self.total_duration = sum(job['length'] for job in jobs if job.get('count_progress', True))
+        self.chunk_info = {}
+        self.render_started = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.render_chunk, index, job) for index, job in enumerate(jobs)]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                self.terminate_processes()
+                raise
+
+    def render_chunk(self, index, job):
+        if not self.is_running:
+            return
+
+        self.chunk_progress.emit(index, f"{job['label']}: starting")
+        supervisor = self.start_ffmpeg(job['args'])
+        with self.process_lock:
+            self.supervisors.append(supervisor)
+        if not self.is_running:
+            supervisor.cancel()
+
+        parser = ProgressParser(job['length'])
+        output_lines = deque(maxlen=50)
+        started = False
+        try:
+            for line in supervisor:
+                handled, info = parser.feed(line)
+                if info:
+                    started = started or info['frame'] > 0
+                    self.chunk_progress.emit(index, f"{job['label']}: {format_progress_info(info)}")
+                    if job.get('count_progress', True):
+                        self.update_chunk_info(index, info)
+                elif not handled:
+                    output_lines.append(line)
+        finally:
+            with self.process_lock:
+                self.supervisors.remove(supervisor)
+
+        if supervisor.error:
+            self.chunk_progress.emit(index, f"{job['label']}: {supervisor.error}")
+            raise Exception(f"{supervisor.error} on chunk {index + 1}: {job['label']}")
+        if not self.is_running:
+            return
+        if supervisor.process.returncode != 0:
+            self.chunk_progress.emit(index, f"{job['label']}: failed")
+            if not started and job.get('count_progress', True) and is_encoder_error(output_lines, self.video_encoder):
+                raise EncoderStartError(f"{self.video_encoder} failed to start on chunk {index + 1}: {job['label']}")
+            raise Exception(f"FFmpeg process failed on chunk {index + 1}: {job['label']}")
+        self.commit_piece(job)
+        self.chunk_progress.emit(index, f"{job['label']}: done")
+
+    def update_chunk_info(self, index, info):
+        with self.process_lock:
+            self.chunk_info[index] = info
+            chunks = list(self.chunk_info.values())
+        done = sum(chunk['out_time'] for chunk in chunks)
+        elapsed = time.time() - self.render_started
+        running = [chunk for chunk in chunks if not chunk['finished']]
+        percent = min(done / self.total_duration * 100, 100.0) if self.total_duration > 0 else None
+        self.progress_info.emit({
+            'frame': sum(chunk['frame'] for chunk in chunks),
+            'fps': sum(chunk['fps'] for chunk in running),
+            'speed': done / elapsed if elapsed > 0 else None,
+            'out_time': done,
+            'percent': percent,
+            'eta': elapsed * (self.total_duration - done) / done if done > 0 else None,
+            'bitrate': 'N/A',
+            'finished': False,
+        })
+
+NODE_HEARTBEAT_INTERVAL = 5.0
+NODE_TIMEOUT = 30.0
+NODE_CONNECT_TIMEOUT = 60.0
+MAX_TASK_ATTEMPTS = 3
+
+NODE_TOKEN_ENV = 'XFADE_NODE_TOKEN'
+
+def parse_address(address, default_host='127.0.0.1'):
+    host, _, port = str(address).rpartition(':')
+    return host or default_host, int(port)
+
+class RenderNodeConnection:
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.reader = sock.makefile('r', encoding='utf-8')
+        self.writer = sock.makefile('w', encoding='utf-8')
+        self.lock = threading.Lock()
+        self.name = f"{address[0]}:{address[1]}"
+        self.task = None
+        self.last_seen = time.monotonic()
+
+    def send(self, message):
+        try:
+            with self.lock:
+                self.writer.write(json.dumps(message) + '\n')
+                self.writer.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def close(self):
+        try:
+            self.sock.shutdown(2)
+        except OSError:
+            pass
+        self.sock.close()
+
+class RenderCoordinator:
+    def __init__(self, address, on_event=None, token=None):
+        import socket
+        self.server = socket.create_server(parse_address(address))
+        self.address = self.server.getsockname()[:2]
+        self.on_event = on_event or (lambda kind, task_id, detail: None)
+        self.token = token
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self.nodes = []
+        self.tasks = {}
+        self.pending = deque()
+        self.done = set()
+        self.error = None
+        self.running = True
+        threading.Thread(target=self.accept_nodes, daemon=True).start()
+
+    def accept_nodes(self):
+        while self.running:
+            try:
+                sock, address = self.server.accept()
+            except OSError:
+                return
+            node = RenderNodeConnection(sock, address)
+            threading.Thread(target=self.read_node, args=(node,), daemon=True).start()
+
+    def read_node(self, node):
+        try:
+            for line in node.reader:
+                node.last_seen = time.monotonic()
+                self.handle_message(node, json.loads(line))
+        except (OSError, ValueError):
+            pass
+        self.drop_node(node, "disconnected")
+
+    def handle_message(self, node, message):
+        import hmac
+        kind = message.get('type')
+        if kind == 'hello':
+            if not self.running or (self.token and not hmac.compare_digest(str(message.get('token') or ''), self.token)):
+                raise ValueError("Invalid node token")
+            node.name = message.get('name', node.name)
+            with self.lock:
+                if node not in self.nodes:
+                    self.nodes.append(node)
+                self.changed.notify_all()
+            self.on_event('node', None, node.name)
+            return
+        if node not in self.nodes:
+            raise ValueError("Node did not say hello")
+        if kind == 'progress':
+            if self.is_current(message):
+                self.on_event('progress', message['id'], message['info'])
+        elif kind == 'result':
+            with self.lock:
+                if node.task == message['id']:
+                    node.task = None
+                if self.is_current(message):
+                    task = self.tasks[message['id']]
+                    try:
+                        if message['success']:
+                            os.replace(self.get_attempt_output(task), task['output'])
+                    except OSError as e:
+                        message = dict(message, success=False, message=str(e))
+                    if message['success']:
+                        self.done.add(message['id'])
+                        self.on_event('done', message['id'], node.name)
+                    else:
+                        self.retry(message['id'], message.get('message') or f"failed on {node.name}")
+                self.changed.notify_all()
+
+    def is_current(self, message):
+        with self.lock:
+            task = self.tasks.get(message['id'])
+            return (task is not None and message['id'] not in self.done
+                    and message.get('attempt') == task['attempts'])
+
+    def get_attempt_output(self, task):
+        base, ext = os.path.splitext(task['output'])
+        return f"{base}.attempt{task['attempts']}{ext}"
+
+    def retry(self, task_id, reason):
+        task = self.tasks[task_id]
+        task['attempts'] += 1
+        if task['attempts'] >= MAX_TASK_ATTEMPTS:
+            self.error = f"{task['label']} failed {task['attempts']} times: {reason}"
+        else:
+            self.pending.appendleft(task_id)
+            self.on_event('retry', task_id, reason)
+
+    def drop_node(self, node, reason):
+        with self.lock:
+            if node not in self.nodes:
+                node.close()
+                return
+            self.nodes.remove(node)
+            node.close()
+            self.on_event('lost', None, f"{node.name} {reason}")
+            if node.task is not None and node.task not in self.done:
+                self.retry(node.task, f"node {node.name} {reason}")
+            node.task = None
+            self.changed.notify_all()
+
+    def dispatch(self):
+        for node in list(self.nodes):
+            if node.task is not None or not self.pending:
+                continue
+            task_id = self.pending.popleft()
+            task = self.tasks[task_id]
+            node.task = task_id
+            attempt_output = self.get_attempt_output(task)
+            args = [attempt_output if arg == task['output'] else arg for arg in task['args'][1:]]
+            if node.send({'type': 'task', 'id': task_id, 'attempt': task['attempts'], 'args': args,
+                          'length': task['length']}):
+                self.on_event('assigned', task_id, node.name)
+            else:
+                self.drop_node(node, "unreachable")
+
+    def run(self, tasks, deadline=None):
+        with self.lock:
+            for task in tasks:
+                self.tasks[task['id']] = dict(task, attempts=0)
+                self.pending.append(task['id'])
+            while True:
+                if self.error:
+                    raise Exception(self.error)
+                if not self.running or len(self.done) == len(self.tasks):
+                    return
+                if deadline and time.time() > deadline:
+                    raise Exception("Distributed render timed out")
+                now = time.monotonic()
+                for node in [node for node in self.nodes if now - node.last_seen > NODE_TIMEOUT]:
+                    self.drop_node(node, "timed out")
+                self.dispatch()
+                self.changed.wait(1.0)
+
+    def stop(self):
+        with self.lock:
+            self.running = False
+            for node in self.nodes:
+                if node.task is not None:
+                    node.send({'type': 'cancel'})
+            self.changed.notify_all()
+
+    def close(self):
+        self.running = False
+        self.server.close()
+        with self.lock:
+            for node in self.nodes:
+                node.send({'type': 'shutdown'})
+                node.close()
+            self.nodes = []
+
+def run_node_task(send, task, current):
+    supervisor = FFmpegProcess(with_progress_args([FFMPEG_PATH, *task['args']]), stall_timeout=DEFAULT_STALL_TIMEOUT)
+    current['supervisor'] = supervisor
+    parser = ProgressParser(task['length'])
+    last_sent = 0
+    for line in supervisor:
+        handled, info = parser.feed(line)
+        if info and (info['finished'] or time.monotonic() - last_sent >= 0.5):
+            last_sent = time.monotonic()
+            send({'type': 'progress', 'id': task['id'], 'attempt': task.get('attempt'), 'info': info})
+    success = supervisor.error is None and supervisor.process.returncode == 0
+    message = supervisor.error or ('' if success else f"FFmpeg exited with code {supervisor.process.returncode}")
+    current['supervisor'] = None
+    send({'type': 'result', 'id': task['id'], 'attempt': task.get('attempt'), 'success': success, 'message': message})
+
+def run_render_node(address, name=None, token=None):
+    import socket
+    host, port = parse_address(address, 'localhost')
+    name = name or f"{socket.gethostname()}-{os.getpid()}"
+    give_up = time.monotonic() + NODE_CONNECT_TIMEOUT
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.monotonic() > give_up:
+                print(f"Could not reach coordinator at {host}:{port}", file=sys.stderr)
+                return 1
+            time.sleep(1)
+
+    node = RenderNodeConnection(sock, (host, port))
+    node.send({'type': 'hello', 'name': name, 'token': token})
+    stopped = threading.Event()
+    current = {'supervisor': None}
+
+    def send_heartbeats():
+        while not stopped.wait(NODE_HEARTBEAT_INTERVAL):
+            node.send({'type': 'heartbeat'})
+
+    threading.Thread(target=send_heartbeats, daemon=True).start()
+    try:
+        for line in node.reader:
+            message = json.loads(line)
+            if message.get('type') == 'task':
+                threading.Thread(target=run_node_task, args=(node.send, message, current), daemon=True).start()
+            elif message.get('type') == 'cancel' and current['supervisor']:
+                current['supervisor'].cancel()
+            elif message.get('type') == 'shutdown':
+                break
+    except (OSError, ValueError):
+        pass
+    finally:
+        stopped.set()
+        if current['supervisor']:
+            current['supervisor'].cancel()
+        node.close()
+    return 0
+
+class DistributedFFmpegWorker(ParallelFFmpegWorker):
+    def __init__(self, *args, coordinator_address='127.0.0.1:0', local_nodes=0, node_token=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.coordinator_address = coordinator_address
+        self.local_nodes = local_nodes
+        self.node_token = node_token
+        self.coordinator = None
+        self.node_processes = []
+
+    def stop(self):
+        super().stop()
+        if self.coordinator:
+            self.coordinator.stop()
+
+    def get_processes(self):
+        processes = super().get_processes()
+        for process in self.node_processes:
+            if process.poll() is None:
+                processes.extend(get_child_processes(process.pid))
+        return processes
+
+    def start_local_nodes(self, address):
+        if getattr(sys, 'frozen', False):
+            command = [sys.executable]
+        else:
+            command = [sys.executable, os.path.abspath(__file__)]
+        host = '127.0.0.1' if address[0] in ('0.0.0.0', '') else address[0]
+        env = dict(os.environ, **{NODE_TOKEN_ENV: self.node_token}) if self.node_token else None
+        for index in range(self.local_nodes):
+            self.node_processes.append(run_subprocess([*command, '--node', f"{host}:{address[1]}",
+                                                       '--node-name', f"local-{index + 1}"],
+                                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env))
+
+    def stop_local_nodes(self):
+        for process in self.node_processes:
+            try:
+                process.wait(FFMPEG_KILL_GRACE)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self.node_processes = []
+
+    def render_pieces(self, jobs):
+        for index, job in enumerate(jobs):
+            self.chunk_progress.emit(index, f"{job['label']}: queued")
+        self.total_duration = sum(job['length'] for job in jobs if job.get('count_progress', True))
+        self.chunk_info = {}
+        self.render_started = time.time()
+
+        self.coordinator = RenderCoordinator(self.coordinator_address, token=self.node_token,
+                                             on_event=lambda kind, index, detail: self.on_coordinator_event(jobs, kind, index, detail))
+        host, port = self.coordinator.address
+        self.progress.emit(f"Coordinator listening on {host}:{port}, rendering {len(jobs)} chunks on render nodes...")
+        self.start_local_nodes(self.coordinator.address)
+        try:
+            self.coordinator.run([{'id': index, 'args': job['args'], 'label': job['label'], 'length': job['length'],
+                                   'output': job['output']} for index, job in enumerate(jobs)], deadline=self.deadline)
+        finally:
+            self.coordinator.close()
+            self.stop_local_nodes()
+
+    def on_coordinator_event(self, jobs, kind, index, detail):
+        if kind == 'node':
+            self.progress.emit(f"Render node connected: {detail}")
+        elif kind == 'lost':
+            self.progress.emit(f"Render node lost: {detail}")
+        elif kind == 'assigned':
+            self.chunk_progress.emit(index, f"{jobs[index]['label']}: running on {detail}")
+        elif kind == 'progress':
+            self.chunk_progress.emit(index, f"{jobs[index]['label']}: {format_progress_info(detail)}")
+            if jobs[index].get('count_progress', True):
+                self.update_chunk_info(index, detail)
+        elif kind == 'retry':
+            self.chunk_progress.emit(index, f"{jobs[index]['label']}: retrying ({detail})")
+        elif kind == 'done':
+            self.commit_piece(jobs[index])
+            self.chunk_progress.emit(index, f"{jobs[index]['label']}: done on {detail}")
+
+PREVIEW_CACHE_LIMIT = 512 * 1024 * 1024
+
+class PreviewWorker(FFmpegWorker):
+    preview_ready = pyqtSignal(str)
+
+    def __init__(self, segments, transition_duration, transition_type, preview_height=360, padding=1.0,
+                 output_format=None):
+        super().__init__(segments, '', transition_duration, transition_type, '', output_format=output_format)
+        self.preview_height = preview_height
+        self.padding = padding
+
+    def process_videos(self):
+        file_info = self.get_file_info()
+        clips = self.get_clips(file_info)
+        output_format = filtergraph.choose_output_format(clips, **self.output_format)
+        width = max(2, round(output_format.width * self.preview_height / output_format.height / 2) * 2)
+        preview_format = filtergraph.OutputFormat(width, self.preview_height, output_format.fps, 'yuv420p')
+        offsets = filtergraph.get_transition_offsets([clip.duration for clip in clips], self.transition_duration)
+        cache_dir = get_cache_dir('previews')
+
+        jobs = []
+        previews = []
+        for i in range(1, len(clips)):
+            first, second = clips[i - 1], clips[i]
+            local_start = offsets[i] - offsets[i - 1]
+            seek = max(0.0, local_start - self.padding)
+            key = get_cache_key(get_file_identity(first.path), get_file_identity(second.path), self.transition_type,
+                                self.transition_duration, round(local_start, 3), self.padding, repr(preview_format))
+            preview_file = os.path.join(cache_dir, f"{key}.mp4")
+            previews.append(preview_file)
+            if os.path.exists(preview_file):
+                os.utime(preview_file)
+                continue
+
+            first_filters = ','.join(str(f) for f in filtergraph.normalize_filters(first, preview_format))
+            second_filters = ','.join(str(f) for f in filtergraph.normalize_filters(second, preview_format))
+            filter_complex = (f"[0:v]{first_filters}[t0];[1:v]{second_filters}[t1];"
+                              f"[t0][t1]xfade=transition={self.transition_type}:duration={self.transition_duration}:"
+                              f"offset={local_start - seek:.3f},format=pix_fmts=yuv420p[final]")
+            partial_file = f"{preview_file}.{os.getpid()}.{threading.get_ident()}.part.mp4"
+            jobs.append({'label': f"Preview {os.path.basename(first.path)} -> {os.path.basename(second.path)}",
+                         'args': [FFMPEG_PATH, '-ss', f"{seek:.6f}", '-i', first.path,
+                                  '-t', f"{self.transition_duration + self.padding:.6f}", '-i', second.path,
+                                  '-filter_complex', filter_complex, '-map', '[final]', '-an',
+                                  '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '28',
+                                  '-y', partial_file],
+                         'output': partial_file, 'final': preview_file,
+                         'length': local_start - seek + self.padding})
+
+        self.progress.emit(f"Preview: {len(previews) - len(jobs)} cached, {len(jobs)} to render")
+        self.total_duration = sum(job['length'] for job in jobs)
+        offset = 0
+        for job in jobs:
+            if not self.is_running:
+                return
+            self.progress.emit(job['label'])
+            self.run_ffmpeg(job['args'], offset=offset)
+            if not self.is_running:
+                return
+            os.replace(job['output'], job['final'])
+            offset += job['length']
+
+        reel_file = os.path.join(cache_dir, 'preview_reel.mp4')
+        concat_list = os.path.join(cache_dir, 'preview_reel.txt')
+        with open(concat_list, 'w', encoding='utf-8') as f:
+            for preview_file in previews:
+                escaped = preview_file.replace('\\', '/').replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        self.total_duration = 0
+        self.run_ffmpeg([FFMPEG_PATH, '-f', 'concat', '-safe', '0', '-i', concat_list, '-c', 'copy', '-y', reel_file])
+        prune_cache_dir(cache_dir, PREVIEW_CACHE_LIMIT, keep=set(previews) | {reel_file, concat_list})
+        if self.is_running:
+            self.preview_ready.emit(reel_file)
+
+SCRUB_FRAME_COUNT = 24
+SCRUB_SIZE = (320, 180)
+SCRUB_CACHE_FRAMES = 512
+
+class FrameCache:
+    def __init__(self, max_frames=SCRUB_CACHE_FRAMES):
+        self.max_frames = max_frames
+        self.frames = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            frame = self.frames.get(key)
+            if frame is not None:
+                self.frames.move_to_end(key)
+            return frame
+
+    def put(self, key, frame):
+        with self.lock:
+            self.frames[key] = frame
+            self.frames.move_to_end(key)
+            while len(self.frames) > self.max_frames:
+                self.frames.popitem(last=False)
+
+scrub_frame_cache = FrameCache()
+
+def get_scrub_filter(size, fps):
+    width, height = size
+    return (f"fps={fps:.6f},scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,format=rgb24")
+
+def read_raw_frames(ffmpeg_args, size, count):
+    result = run_subprocess_simple(ffmpeg_args, capture_output=True)
+    frame_size = size[0] * size[1] * 3
+    frames = [result.stdout[i:i + frame_size] for i in range(0, len(result.stdout) - frame_size + 1, frame_size)]
+    if result.returncode != 0 or not frames:
+        message = result.stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise Exception(f"FFmpeg could not extract preview frames: {message[-1] if message else 'no frames'}")
+    return (frames + [frames[-1]] * count)[:count]
+
+def get_cached_frames(keys, ffmpeg_args, size):
+    frames = [scrub_frame_cache.get(key) for key in keys]
+    if all(frame is not None for frame in frames):
+        return frames
+    frames = read_raw_frames(ffmpeg_args, size, len(keys))
+    for key, frame in zip(keys, frames):
+        scrub_frame_cache.put(key, frame)
+    return frames
+
+def extract_scrub_frames(clip, start, duration, count=SCRUB_FRAME_COUNT, size=SCRUB_SIZE):
+    identity = get_file_identity(clip)
+    keys = [(identity, round(start + duration * i / count, 3), size) for i in range(count)]
+    ffmpeg_args = [FFMPEG_PATH, '-v', 'error', '-ss', f"{start:.3f}", '-t', f"{duration:.3f}", '-i', clip, '-an',
+                   '-vf', get_scrub_filter(size, count / duration), '-frames:v', str(count),
+                   '-f', 'rawvideo', '-pix_fmt', 'rgb24', 'pipe:1']
+    return get_cached_frames(keys, ffmpeg_args, size)
+
+def render_scrub_frames(first, tail_start, second, transition, duration, count=SCRUB_FRAME_COUNT, size=SCRUB_SIZE):
+    identities = (get_file_identity(first), round(tail_start, 3), get_file_identity(second), transition, duration)
+    keys = [(identities, i, size) for i in range(count)]
+    scrub_filter = get_scrub_filter(size, count / duration)
+    ffmpeg_args = [FFMPEG_PATH, '-v', 'error', '-ss', f"{tail_start:.3f}", '-t', f"{duration:.3f}", '-i', first,
+                   '-t', f"{duration:.3f}", '-i', second,
+                   '-filter_complex', f"[0:v]{scrub_filter}[a];[1:v]{scrub_filter}[b];"
+                                      f"[a][b]xfade=transition={transition}:duration={duration}:offset=0[final]",
+                   '-map', '[final]', '-frames:v', str(count), '-f', 'rawvideo', '-pix_fmt', 'rgb24', 'pipe:1']
+    return get_cached_frames(keys, ffmpeg_args, size)
+
+class ScrubFrameWorker(QThread):
+    frames_ready = pyqtSignal(int, dict)
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, generation, first, second, transition, duration):
+        super().__init__()
+        self.generation = generation
+        self.first = first
+        self.second = second
+        self.transition = transition
+        self.duration = duration
+
+    def run(self):
+        import blend
+        try:
+            length = float(get_probe_service().probe(self.first)['format']['duration'])
+            tail_start = max(length - self.duration, 0.0)
+            if blend.can_blend(self.transition):
+                frames = {'mode': 'blend',
+                          'first': extract_scrub_frames(self.first, tail_start, self.duration),
+                          'second': extract_scrub_frames(self.second, 0.0, self.duration)}
+            else:
+                frames = {'mode': 'render', 'frames': render_scrub_frames(self.first, tail_start, self.second,
+                                                                          self.transition, self.duration)}
+            self.frames_ready.emit(self.generation, frames)
+        except Exception as e:
+            self.failed.emit(self.generation, str(e))
+
+def detect_gpu():
+    try:
+        import GPUtil
+        gpus = GPUtil.getGPUs()
+        if gpus:
+            gpu_name = gpus[0].name.lower()
+            if 'nvidia' in gpu_name:
+                return 'NVIDIA'
+            elif 'radeon' in gpu_name:
+                return 'RADEON'
+        
+        import platform
+        if platform.system() == 'Windows':
+            import wmi
+            c = wmi.WMI()
+            for gpu in c.Win32_VideoController():
+                if 'intel' in gpu.Name.lower() or 'amd' in gpu.Name.lower():
+                    return 'GPU'
+    except ImportError:
+        pass
+    
+    return 'GPU'
+
+_reserved_output_files = set()
+_reserved_output_files_lock = threading.Lock()
+
+def get_unique_output_name(base_name):
+    name, ext = os.path.splitext(base_name)
+    counter = 1
+    while os.path.exists(f"{name}{ext}") or f"{name}{ext}" in _reserved_output_files:
+        name = f"{name.rstrip('_0123456789')}_{counter}"
+        counter += 1
+    return f"{name}{ext}"
+
+def get_default_output_file(segments, output_filename='output.mp4'):
+    from pathlib import Path
+    transitioned_folder = Path(segments[0]).parent / "Transitioned"
+    transitioned_folder.mkdir(exist_ok=True)
+    output_file = str(transitioned_folder / Path(output_filename or 'output.mp4').name)
+    with _reserved_output_files_lock:
+        reusable = os.path.exists(get_journal_paths(output_file)[0]) or os.path.isdir(get_segment_dir(output_file))
+        if output_file in _reserved_output_files or not reusable:
+            output_file = get_unique_output_name(output_file)
+        _reserved_output_files.add(output_file)
+    return output_file
+
+def release_output_file(output_file):
+    with _reserved_output_files_lock:
+        _reserved_output_files.discard(str(output_file))
+
+def parse_output_format(resolution=None, fps=None, pix_fmt=None):
+    output_format = {}
+    if resolution and resolution.lower() != 'auto':
+        width, _, height = resolution.lower().partition('x')
+        if not (width.isdigit() and height.isdigit()):
+            raise Exception(f"Invalid resolution: {resolution}")
+        output_format.update(width=int(width), height=int(height))
+    if fps and str(fps).lower() != 'auto':
+        if filtergraph.parse_frame_rate(fps) is None:
+            raise Exception(f"Invalid frame rate: {fps}")
+        output_format['fps'] = str(fps)
+    if pix_fmt and pix_fmt.lower() != 'auto':
+        output_format['pix_fmt'] = pix_fmt
+    return output_format
+
+def create_render_worker(job):
+    args = (job['segments'], job['output_file'], job.get('transition_duration', 0.5),
+            job.get('transition_type', 'fade'), '', job.get('use_gpu', False))
+    kwargs = {'smart_render': job.get('smart_render', False), 'threads': job.get('threads', 0),
+              'output_format': job.get('output_format'), 'profile': job.get('profile', DEFAULT_PROFILE),
+              'use_cache': job.get('use_cache', False),
+              'cache_size': int(job.get('cache_size_gb', DEFAULT_INTERMEDIATE_CACHE_BYTES / 1024 ** 3) * 1024 ** 3),
+              'incremental': job.get('incremental', False), 'memory_alert_mb': job.get('memory_alert_mb', 0),
+              'resumable': job.get('resumable', False),
+              'stall_timeout': job.get('stall_timeout', DEFAULT_STALL_TIMEOUT), 'timeout': job.get('timeout', 0),
+              'output_mode': job.get('output_mode', 'mp4'), 'faststart': job.get('faststart', False),
+              'hls_time': job.get('hls_time', DEFAULT_HLS_TIME), 'hls_list_size': job.get('hls_list_size', 0)}
+    if job.get('coordinator') or job.get('local_nodes'):
+        import secrets
+        node_token = job.get('node_token') or (None if job.get('coordinator') else secrets.token_hex(16))
+        worker = DistributedFFmpegWorker(*args, max_workers=max(1, job.get('local_nodes', 0)),
+                                         coordinator_address=job.get('coordinator') or '127.0.0.1:0',
+                                         local_nodes=job.get('local_nodes', 0), node_token=node_token, **kwargs)
+    elif job.get('parallel_workers', 1) > 1 or job.get('incremental', False) or job.get('resumable', False):
+        worker = ParallelFFmpegWorker(*args, max_workers=job.get('parallel_workers', 1), **kwargs)
+    else:
+        worker = FFmpegWorker(*args, **kwargs)
+    worker.gpu_type = job.get('gpu_type', 'GPU')
+    return worker
+
+GPU_DETECTION_TTL = 7 * 24 * 3600
+
+def get_cached_gpu_type(settings):
+    gpu_type = settings.value('gpu_type', '')
+    detected_at = settings.value('gpu_detected_at', 0, type=float)
+    if gpu_type and time.time() - detected_at < GPU_DETECTION_TTL:
+        return gpu_type
+    return None
+
+class GpuDetectWorker(QThread):
+    detected = pyqtSignal(str)
+
+    def run(self):
+        try:
+            gpu_type = detect_gpu()
+        except Exception:
+            gpu_type = 'GPU'
+        self.detected.emit(gpu_type)
+        get_encoder_registry().probe()
+
+def report_startup_time(milestone):
+    report_file = os.environ.get('XFADE_STARTUP_REPORT')
+    if not report_file:
+        return
+    entry = {'milestone': milestone, 'seconds': round(time.perf_counter() - STARTUP_TIME, 4), 'time': time.time()}
+    if report_file == '-':
+        print(json.dumps(entry), file=sys.stderr, flush=True)
+    else:
+        with open(report_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+
+class RenderQueue(QObject):
+    job_status = pyqtSignal(dict)
+
+    def __init__(self, max_jobs=1, status_file=None):
+        super().__init__()
+        self.max_jobs = max(1, max_jobs)
+        self.status_file = status_file
+        self.status_stream = sys.stdout
+        self.pending = queue.Queue()
+        self.lock = threading.Lock()
+        self.threads = []
+        self.workers = {}
+        self.cancelled = set()
+        self.next_job_id = 1
+
+    def set_max_jobs(self, max_jobs):
+        with self.lock:
+            self.max_jobs = max(1, max_jobs)
+            if self.threads:
+                self.start_threads()
+
+    def start_threads(self):
+        self.threads = [thread for thread in self.threads if thread.is_alive()]
+        while len(self.threads) < self.max_jobs:
+            thread = threading.Thread(target=self.run_jobs, args=(len(self.threads),), daemon=True)
+            self.threads.append(thread)
+            thread.start()
+
+    def allocate_id(self):
+        with self.lock:
+            job_id = f"job-{self.next_job_id}"
+            self.next_job_id += 1
+            return job_id
+
+    def submit(self, job, worker=None):
+        job = dict(job)
+        if 'id' not in job:
+            job['id'] = self.allocate_id()
+        with self.lock:
+            self.start_threads()
+        self.record(job, 'queued')
+        self.pending.put((job, worker))
+        return job['id']
+
+    def cancel(self, job_id):
+        with self.lock:
+            self.cancelled.add(job_id)
+            worker = self.workers.get(job_id)
+        if worker:
+            worker.stop()
+
+    def cancel_all(self):
+        with self.lock:
+            job_ids = list(self.workers)
+        while True:
+            try:
+                job, worker = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            self.record(job, 'cancelled')
+            if worker:
+                worker.finished.emit(False, "Processing stopped by user")
+            self.pending.task_done()
+        for job_id in job_ids:
+            self.cancel(job_id)
+
+    def wait(self):
+        self.pending.join()
+
+    def backlog(self):
+        return self.pending.unfinished_tasks
+
+    def run_jobs(self, index):
+        while True:
+            with self.lock:
+                if index >= self.max_jobs:
+                    return
+            try:
+                job, worker = self.pending.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self.run_job(job, worker)
+            except Exception as e:
+                self.record(job, 'failed', message=str(e))
+            finally:
+                self.pending.task_done()
 
-def get_resource_path(relative_path):
-    if getattr(sys, 'frozen', False):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(__file__)
-    
-    return os.path.join(base_path, relative_path)
+    def run_job(self, job, worker):
+        with self.lock:
+            cancelled = job['id'] in self.cancelled
+        if cancelled:
+            self.record(job, 'cancelled')
+            if worker:
+                worker.finished.emit(False, "Processing stopped by user")
+            return
 
-def get_ffmpeg_path():
-    if getattr(sys, 'frozen', False):
-        ffmpeg_path = get_resource_path('ffmpeg.exe')
-        ffprobe_path = get_resource_path('ffprobe.exe')
-    else:
-        ffmpeg_path = 'ffmpeg.exe'
-        ffprobe_path = 'ffprobe.exe'
-    
-    return ffmpeg_path, ffprobe_path
+        worker = worker or create_render_worker(job)
+        result = {'success': False, 'message': ''}
+        worker.finished.connect(lambda success, message: result.update(success=success, message=message),
+                                Qt.ConnectionType.DirectConnection)
+        with self.lock:
+            self.workers[job['id']] = worker
 
-def run_subprocess(cmd, **kwargs):
-    default_kwargs = {
-        'creationflags': subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-    }
-    default_kwargs.update(kwargs)
-    return subprocess.Popen(cmd, **default_kwargs)
+        started = time.time()
+        self.record(job, 'running', started=started)
+        try:
+            worker.run()
+        finally:
+            with self.lock:
+                self.workers.pop(job['id'], None)
 
-def run_subprocess_simple(cmd, **kwargs):
-    default_kwargs = {
-        'creationflags': subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-    }
-    default_kwargs.update(kwargs)
-    return subprocess.run(cmd, **default_kwargs)
+        if result['success']:
+            status = 'completed'
+        elif not worker.is_running:
+            status = 'cancelled'
+        else:
+            status = 'failed'
+        self.record(job, status, started=started, finished=time.time(),
+                    elapsed=round(time.time() - started, 3), message=result['message'],
+                    resources=getattr(worker, 'resource_summary', None))
 
-FFMPEG_PATH, FFPROBE_PATH = get_ffmpeg_path()
+    def record(self, job, status, **extra):
+        if status in ('completed', 'failed', 'cancelled'):
+            release_output_file(job.get('output_file', ''))
+        entry = {'job_id': job['id'], 'status': status, 'time': time.time(),
+                 'output_file': str(job.get('output_file') or ''), 'clips': len(job.get('segments', []))}
+        entry.update(extra)
+        line = json.dumps(entry)
+        with self.lock:
+            if self.status_file == '-':
+                print(line, file=self.status_stream, flush=True)
+            elif self.status_file:
+                with open(self.status_file, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+        self.job_status.emit(entry)
 
+MAX_GALLERY_MOVIES = 24
 
-class FFmpegWorker(QThread):
-    finished = pyqtSignal(bool, str)
-    progress = pyqtSignal(str)
+PROGRESS_LINE_PATTERN = re.compile(r'^\s*(frame|size)=\s*\S+')
+
+_render_logger = None
+
+def get_render_logger():
+    global _render_logger
+    if _render_logger is None:
+        import logging
+        from logging.handlers import RotatingFileHandler
+        _render_logger = logging.getLogger('xfade.render')
+        _render_logger.setLevel(logging.INFO)
+        _render_logger.propagate = False
+        try:
+            handler = RotatingFileHandler(os.path.join(get_cache_dir('logs'), 'render.log'),
+                                          maxBytes=10 * 1024 * 1024, backupCount=5, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            _render_logger.addHandler(handler)
+        except OSError:
+            _render_logger.addHandler(logging.NullHandler())
+    return _render_logger
+
+class BatchedLogView(QPlainTextEdit):
+    status_changed = pyqtSignal(str)
+
+    def __init__(self, max_lines=2000, flush_interval=200, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)
+        self.pending = deque(maxlen=max_lines)
+        self.status_line = None
+        self.logger = None
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(flush_interval)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start()
+
+    def append_line(self, line):
+        if self.logger is None:
+            self.logger = get_render_logger()
+        self.logger.info(line)
+        if PROGRESS_LINE_PATTERN.match(line):
+            self.status_line = line
+        else:
+            self.pending.append(line)
 
-    def __init__(self, segments, output_file, transition_duration, transition_type, ffmpeg_path, use_gpu=False):
+    def flush(self):
+        if self.pending:
+            scroll_bar = self.verticalScrollBar()
+            at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 4
+            lines = "\n".join(self.pending)
+            self.pending.clear()
+            self.appendPlainText(lines)
+            if at_bottom:
+                scroll_bar.setValue(scroll_bar.maximum())
+        if self.status_line is not None:
+            self.status_changed.emit(self.status_line)
+            self.status_line = None
+
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v',
+                              '.mpg', '.mpeg', '.m2v', '.m2ts', '.mts', '.ts', '.vob', '.3gp',
+                              '.3g2', '.f4v', '.asf', '.rmvb', '.rm', '.ogv', '.mxf', '.dv',
+                              '.divx', '.xvid', '.mpv', '.m2p', '.mp2', '.mpeg2', '.ogm'})
+SCAN_BATCH_SIZE = 1000
+
+def is_video_file(file_path):
+    return os.path.splitext(file_path)[1].lower() in VIDEO_EXTENSIONS
+
+def is_video_source(file_path):
+    return is_video_file(file_path) or os.path.isdir(file_path)
+
+class FolderScanWorker(QThread):
+    found = pyqtSignal(list)
+
+    def __init__(self, paths, batch_size=SCAN_BATCH_SIZE):
         super().__init__()
-        self.segments = segments
-        self.output_file = output_file
-        self.transition_duration = transition_duration
-        self.transition_type = transition_type
-        self.ffmpeg_path = ffmpeg_path
-        self.use_gpu = use_gpu
+        self.paths = paths
+        self.batch_size = batch_size
         self.is_running = True
-        self.process = None
 
-    def run(self):
-        try:
-            if self.is_running:
-                self.process_videos()
-                if self.is_running:
-                    self.finished.emit(True, "Video processing completed successfully!")
-                else:
-                    self.finished.emit(False, "Processing stopped by user")
-        except Exception as e:
-            self.finished.emit(False, str(e))
-    
     def stop(self):
         self.is_running = False
-        if self.process:
-            self.process.terminate()
 
-    def get_video_info(self, file_path):
-        result = run_subprocess_simple([FFPROBE_PATH, '-v', 'quiet', '-print_format', 'json', 
-                                       '-show_format', '-show_streams', file_path], 
-                                      capture_output=True, text=True)
-        return json.loads(result.stdout)
+    def run(self):
+        batch = []
+        for file_path in self.iter_videos():
+            if not self.is_running:
+                return
+            batch.append(file_path)
+            if len(batch) >= self.batch_size:
+                self.found.emit(batch)
+                batch = []
+        if batch:
+            self.found.emit(batch)
 
-    def process_videos(self):
-        file_info = [self.get_video_info(f) for f in self.segments]
-        file_lengths = [float(info['format']['duration']) for info in file_info]
-        has_audio = [any(stream['codec_type'] == 'audio' for stream in info['streams']) for info in file_info]
+    def iter_videos(self):
+        for path in self.paths:
+            if not os.path.isdir(path):
+                if is_video_file(path):
+                    yield path
+                continue
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != 'Transitioned')
+                for name in sorted(files):
+                    if is_video_file(name):
+                        yield os.path.join(root, name).replace('\\', '/')
 
-        width = int(file_info[0]['streams'][0]['width'])
-        height = int(file_info[0]['streams'][0]['height'])
+THUMBNAIL_SIZE = (48, 27)
+THUMBNAIL_MEMORY_LIMIT = 32 * 1024 * 1024
+THUMBNAIL_DISK_LIMIT = 256 * 1024 * 1024
+THUMBNAIL_PENDING_LIMIT = 64
+CLIP_COLUMNS = ['Clip', 'Duration', 'Resolution', 'FPS', 'Codec', 'Audio']
+CLIP_COLUMN_WIDTHS = [0, 62, 78, 50, 56, 48]
 
-        files_input = [['-i', f] for f in self.segments]
+class ThumbnailCache:
+    def __init__(self, max_bytes=THUMBNAIL_MEMORY_LIMIT):
+        self.max_bytes = max_bytes
+        self.images = OrderedDict()
+        self.total = 0
 
-        video_transitions = ""
-        audio_transitions = ""
-        last_transition_output = "0v"
-        last_audio_output = "0:a" if has_audio[0] else None
-        video_length = 0
-        normalizer = ""
-        scaler_default = f",scale=w={width}:h={height}:force_original_aspect_ratio=1,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+    def get(self, key):
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+        return image
 
-        for i in range(len(self.segments)):
-            scaler = scaler_default if i > 0 else ""
-            normalizer += f"[{i}:v]settb=AVTB,setsar=sar=1,fps=30{scaler}[{i}v];"
+    def put(self, key, image):
+        previous = self.images.pop(key, None)
+        if previous is not None:
+            self.total -= previous.sizeInBytes()
+        self.images[key] = image
+        self.total += image.sizeInBytes()
+        while self.total > self.max_bytes and len(self.images) > 1:
+            self.total -= self.images.popitem(last=False)[1].sizeInBytes()
 
-            if i == 0:
-                continue
+thumbnail_cache = ThumbnailCache()
 
-            video_length += file_lengths[i - 1] - self.transition_duration / 2
-            next_transition_output = f"v{i-1}{i}"
-            video_transitions += f"[{last_transition_output}][{i}v]xfade=transition={self.transition_type}:duration={self.transition_duration}:offset={video_length - self.transition_duration / 2:.3f}[{next_transition_output}];"
-            last_transition_output = next_transition_output
+class ThumbnailLoader(QObject):
+    thumbnail_ready = pyqtSignal(str, QImage)
 
-            if has_audio[i-1] and has_audio[i]:
-                next_audio_output = f"a{i-1}{i}"
-                audio_transitions += f"[{last_audio_output}][{i}:a]acrossfade=d={self.transition_duration}[{next_audio_output}];"
-                last_audio_output = next_audio_output
-            elif has_audio[i]:
-                last_audio_output = f"{i}:a"
+    def __init__(self, size=THUMBNAIL_SIZE, max_workers=None, max_pending=THUMBNAIL_PENDING_LIMIT, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.pending = deque()
+        self.max_pending = max_pending
+        self.requested = set()
+        self.failed = set()
+        self.condition = threading.Condition()
+        self.threads = []
+        self.cache_dir = None
 
-        video_transitions += f"[{last_transition_output}]format=pix_fmts=yuv420p[final];"
+    def request(self, file_path):
+        with self.condition:
+            if file_path in self.requested or file_path in self.failed:
+                return
+            if len(self.pending) >= self.max_pending:
+                self.requested.discard(self.pending.popleft())
+            self.pending.append(file_path)
+            self.requested.add(file_path)
+            if not self.threads:
+                self.cache_dir = get_cache_dir('thumbnails')
+                threading.Thread(target=prune_cache_dir, args=(self.cache_dir, THUMBNAIL_DISK_LIMIT),
+                                 daemon=True).start()
+                self.threads = [threading.Thread(target=self.run, daemon=True) for _ in range(self.max_workers)]
+                for thread in self.threads:
+                    thread.start()
+            self.condition.notify()
 
-        ffmpeg_args = [FFMPEG_PATH,
-                       *sum(files_input, []),
-                       '-filter_complex', normalizer + video_transitions + audio_transitions[:-1],
-                       '-map', '[final]']
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                file_path = self.pending.pop()
+            image = self.load(file_path)
+            with self.condition:
+                self.requested.discard(file_path)
+                if image is None:
+                    self.failed.add(file_path)
+            if image is not None:
+                self.thumbnail_ready.emit(file_path, image)
 
-        if last_audio_output:
-            ffmpeg_args.extend(['-map', f"[{last_audio_output}]"])
-        else:
-            ffmpeg_args.extend(['-an'])
+    def get_path(self, file_path):
+        identity = get_file_identity(file_path)
+        if identity is None:
+            return None
+        return os.path.join(self.cache_dir, f"{get_cache_key('thumbnail', identity, self.size)}.jpg")
 
-        if self.use_gpu:
-            if self.gpu_type == 'NVIDIA':
-                ffmpeg_args.extend(['-c:v', 'h264_nvenc'])
-            elif self.gpu_type == 'AMD' or self.gpu_type == 'RADEON':
-                ffmpeg_args.extend(['-c:v', 'h264_amf'])
-            elif self.gpu_type == 'Intel':
-                ffmpeg_args.extend(['-c:v', 'h264_qsv'])
-            else:
-                self.progress.emit("Unknown GPU type. Falling back to CPU encoding.")
+    def load(self, file_path):
+        thumbnail_file = self.get_path(file_path)
+        if thumbnail_file is None:
+            return None
+        if os.path.exists(thumbnail_file):
+            image = QImage(thumbnail_file)
+            if not image.isNull():
+                try:
+                    os.utime(thumbnail_file)
+                except OSError:
+                    pass
+                return image
+        return self.generate(file_path, thumbnail_file)
 
-        ffmpeg_args.extend(['-y', self.output_file])
+    def generate(self, file_path, thumbnail_file):
+        try:
+            duration = float(get_probe_service().probe(file_path)['format'].get('duration', 0))
+        except Exception:
+            duration = 0.0
+        width, height = self.size
+        partial_file = f"{thumbnail_file}.part.jpg"
+        result = run_subprocess_simple([FFMPEG_PATH, '-v', 'error', '-ss', f"{min(1.0, duration / 4):.3f}",
+                                        '-i', file_path, '-an', '-frames:v', '1',
+                                        '-vf', f"scale={width}:{height}:force_original_aspect_ratio=decrease",
+                                        '-q:v', '4', '-y', partial_file], capture_output=True)
+        if result.returncode != 0 or not os.path.exists(partial_file):
+            return None
+        os.replace(partial_file, thumbnail_file)
+        image = QImage(thumbnail_file)
+        return None if image.isNull() else image
 
-        self.process = run_subprocess(ffmpeg_args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, 
-                                     universal_newlines=True)
-        
-        while self.is_running:
-            line = self.process.stdout.readline()
-            if not line:
-                break
-            self.progress.emit(line.strip())
-        
-        if self.is_running:
-            self.process.wait()
-            if self.process.returncode != 0:
-                raise Exception("FFmpeg process failed")
-        else:
-            self.process.terminate()
+def get_clip_details(info):
+    video_stream = get_video_stream(info) or {}
+    audio_stream = get_audio_stream(info)
+    rate = filtergraph.parse_frame_rate(video_stream.get('r_frame_rate'))
+    return {
+        'Duration': f"{float(info['format'].get('duration', 0)):.2f}s",
+        'Resolution': f"{video_stream['width']}x{video_stream['height']}" if video_stream.get('width') else '',
+        'FPS': f"{float(rate):.2f}".rstrip('0').rstrip('.') if rate else '',
+        'Codec': video_stream.get('codec_name', ''),
+        'Audio': audio_stream.get('codec_name', 'yes') if audio_stream else 'no',
+    }
+
+class ClipListModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clips = []
+        self.rows = {}
+        self.details = {}
+        self.thumbnail_loader = ThumbnailLoader(parent=self)
+        self.thumbnail_loader.thumbnail_ready.connect(self.set_thumbnail)
 
-class DragDropListWidget(QListWidget):
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.clips)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(CLIP_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return CLIP_COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        file_path = self.clips[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return os.path.basename(file_path)
+            details = self.details.get(file_path)
+            return details[CLIP_COLUMNS[column]] if details else ''
+        if role == Qt.ItemDataRole.DecorationRole and column == 0:
+            image = thumbnail_cache.get(file_path)
+            if image is None:
+                self.thumbnail_loader.request(file_path)
+            return image
+        if role == Qt.ItemDataRole.ToolTipRole:
+            details = self.details.get(file_path)
+            if not details:
+                return file_path
+            return "\n".join([file_path] + [f"{name}: {details[name]}" for name in CLIP_COLUMNS[1:]])
+        if role == Qt.ItemDataRole.TextAlignmentRole and column > 0:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def paths(self):
+        return list(self.clips)
+
+    def add_paths(self, paths):
+        added = []
+        for file_path in paths:
+            if file_path not in self.rows:
+                self.rows[file_path] = len(self.clips) + len(added)
+                added.append(file_path)
+        if added:
+            self.beginInsertRows(QModelIndex(), len(self.clips), len(self.clips) + len(added) - 1)
+            self.clips.extend(added)
+            self.endInsertRows()
+        return added
+
+    def remove_rows(self, rows):
+        for row in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.details.pop(self.clips.pop(row), None)
+            self.endRemoveRows()
+        self.rows = {file_path: row for row, file_path in enumerate(self.clips)}
+
+    def clear(self):
+        self.beginResetModel()
+        self.clips = []
+        self.rows = {}
+        self.details = {}
+        self.endResetModel()
+
+    def set_info(self, file_path, info):
+        row = self.rows.get(file_path)
+        if row is None:
+            return
+        self.details[file_path] = get_clip_details(info)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(CLIP_COLUMNS) - 1),
+                              [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole])
+
+    def set_thumbnail(self, file_path, image):
+        thumbnail_cache.put(file_path, image)
+        row = self.rows.get(file_path)
+        if row is not None:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+class DragDropListView(QTableView):
     files_dropped = pyqtSignal(list)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setIconSize(QSize(*THUMBNAIL_SIZE))
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(THUMBNAIL_SIZE[1] + 6)
+        self.horizontalHeader().setHighlightSections(False)
         self.original_style = self.styleSheet()
+
+    def setModel(self, model):
+        super().setModel(model)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column, width in enumerate(CLIP_COLUMN_WIDTHS[1:], 1):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
+
+    def get_video_sources(self, event):
+        return [url.toLocalFile() for url in event.mimeData().urls()
+                if url.isLocalFile() and is_video_source(url.toLocalFile())]
+
+    def has_video_sources(self, event):
+        return any(url.isLocalFile() and is_video_source(url.toLocalFile()) for url in event.mimeData().urls())
         
     def dragEnterEvent(self, event: QDragEnterEvent):
         if event.mimeData().hasUrls():
-            video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v', 
-                               '.mpg', '.mpeg', '.m2v', '.m2ts', '.mts', '.ts', '.vob', '.3gp',
-                               '.3g2', '.f4v', '.asf', '.rmvb', '.rm', '.ogv', '.mxf', '.dv',
-                               '.divx', '.xvid', '.mpv', '.m2p', '.mp2', '.mpeg2', '.ogm'}
-            has_video = False
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = url.toLocalFile()
-                    if any(file_path.lower().endswith(ext) for ext in video_extensions):
-                        has_video = True
-                        break
-            
-            if has_video:
+            if self.has_video_sources(event):
                 self.setStyleSheet(self.original_style + """
-                    QListWidget {
+                    QTableView {
                         border: 2px dashed #4CAF50;
                         background-color: #E8F5E8;
                     }
@@ -216,7 +2937,7 @@ class DragDropListWidget(QListWidget):
                 event.acceptProposedAction()
             else:
                 self.setStyleSheet(self.original_style + """
-                    QListWidget {
+                    QTableView {
                         border: 2px dashed #F44336;
                         background-color: #FFEBEE;
                     }
@@ -226,23 +2947,8 @@ class DragDropListWidget(QListWidget):
             event.ignore()
         
     def dragMoveEvent(self, event):
-        if event.mimeData().hasUrls():
-            video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v', 
-                               '.mpg', '.mpeg', '.m2v', '.m2ts', '.mts', '.ts', '.vob', '.3gp',
-                               '.3g2', '.f4v', '.asf', '.rmvb', '.rm', '.ogv', '.mxf', '.dv',
-                               '.divx', '.xvid', '.mpv', '.m2p', '.mp2', '.mpeg2', '.ogm'}
-            has_video = False
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = url.toLocalFile()
-                    if any(file_path.lower().endswith(ext) for ext in video_extensions):
-                        has_video = True
-                        break
-            
-            if has_video:
-                event.acceptProposedAction()
-            else:
-                event.ignore()
+        if event.mimeData().hasUrls() and self.has_video_sources(event):
+            event.acceptProposedAction()
         else:
             event.ignore()
     
@@ -253,43 +2959,127 @@ class DragDropListWidget(QListWidget):
     def dropEvent(self, event: QDropEvent):
         self.setStyleSheet(self.original_style)
         
-        if event.mimeData().hasUrls():
-            video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v', 
-                               '.mpg', '.mpeg', '.m2v', '.m2ts', '.mts', '.ts', '.vob', '.3gp',
-                               '.3g2', '.f4v', '.asf', '.rmvb', '.rm', '.ogv', '.mxf', '.dv',
-                               '.divx', '.xvid', '.mpv', '.m2p', '.mp2', '.mpeg2', '.ogm'}
-            video_files = []
-            
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = url.toLocalFile()
-                    if any(file_path.lower().endswith(ext) for ext in video_extensions):
-                        video_files.append(file_path)
-            
-            if video_files:
-                self.files_dropped.emit(video_files)
-                event.acceptProposedAction()
-            else:
-                event.ignore()
+        sources = self.get_video_sources(event) if event.mimeData().hasUrls() else []
+        if sources:
+            self.files_dropped.emit(sources)
+            event.acceptProposedAction()
         else:
             event.ignore()
 
     def paintEvent(self, event):
         super().paintEvent(event)
-        if self.count() == 0:
+        if self.model() is None or self.model().rowCount() == 0:
             painter = QPainter(self.viewport())
             painter.save()
             col = self.palette().placeholderText().color()
             painter.setPen(col)
             fm = self.fontMetrics()
             elided_text = fm.elidedText(
-                "📁 Drag & drop video files here or click 'Add Files'", 
+                "📁 Drag & drop video files or folders here or click 'Add Files'", 
                 Qt.TextElideMode.ElideRight, 
                 self.viewport().width()
             )
             painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter, elided_text)
             painter.restore()
 
+class TransitionScrubber(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('Transition Scrubber')
+        self.clips = []
+        self.transition = 'fade'
+        self.duration = 0.5
+        self.frames = None
+        self.generation = 0
+        self.workers = []
+
+        layout = QVBoxLayout(self)
+        self.image = QLabel()
+        self.image.setFixedSize(*SCRUB_SIZE)
+        self.image.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.image)
+        self.slider = QSlider(Qt.Orientation.Horizontal)
+        self.slider.setRange(0, 1000)
+        self.slider.setValue(500)
+        self.slider.valueChanged.connect(self.update_frame)
+        layout.addWidget(self.slider)
+
+        pair_layout = QHBoxLayout()
+        pair_layout.addWidget(QLabel('Transition after clip:'))
+        self.pair = QSpinBox()
+        self.pair.setMinimum(1)
+        self.pair.valueChanged.connect(self.load_frames)
+        pair_layout.addWidget(self.pair)
+        pair_layout.addStretch()
+        self.status = QLabel('')
+        pair_layout.addWidget(self.status)
+        layout.addLayout(pair_layout)
+
+    def set_clips(self, clips):
+        self.clips = clips
+        self.pair.blockSignals(True)
+        self.pair.setMaximum(max(1, len(clips) - 1))
+        self.pair.blockSignals(False)
+        self.load_frames()
+
+    def set_transition(self, transition, duration):
+        self.transition = transition
+        self.duration = duration
+        self.load_frames()
+
+    def load_frames(self):
+        if len(self.clips) < 2 or not self.isVisible():
+            return
+        self.generation += 1
+        index = self.pair.value() - 1
+        worker = ScrubFrameWorker(self.generation, self.clips[index], self.clips[index + 1],
+                                  self.transition, self.duration)
+        worker.frames_ready.connect(self.on_frames_ready)
+        worker.failed.connect(self.on_failed)
+        worker.finished.connect(lambda: self.workers.remove(worker))
+        self.workers.append(worker)
+        self.status.setText('Loading...')
+        worker.start()
+
+    def on_frames_ready(self, generation, frames):
+        if generation != self.generation:
+            return
+        import blend
+        width, height = SCRUB_SIZE
+        if frames['mode'] == 'blend':
+            frames['first'] = [blend.frame_from_bytes(frame, width, height) for frame in frames['first']]
+            frames['second'] = [blend.frame_from_bytes(frame, width, height) for frame in frames['second']]
+            self.status.setText('NumPy blend')
+        else:
+            self.status.setText('FFmpeg render')
+        self.frames = frames
+        self.update_frame()
+
+    def on_failed(self, generation, message):
+        if generation == self.generation:
+            self.frames = None
+            self.image.clear()
+            self.status.setText(message)
+
+    def update_frame(self):
+        if not self.frames:
+            return
+        position = self.slider.value() / self.slider.maximum()
+        width, height = SCRUB_SIZE
+        if self.frames['mode'] == 'blend':
+            import blend
+            index = round(position * (len(self.frames['first']) - 1))
+            data = blend.blend_frames(self.transition, self.frames['first'][index], self.frames['second'][index],
+                                      1.0 - position).tobytes()
+        else:
+            data = self.frames['frames'][round(position * (len(self.frames['frames']) - 1))]
+        image = QImage(data, width, height, width * 3, QImage.Format.Format_RGB888)
+        self.image.setPixmap(QPixmap.fromImage(image.copy()))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.load_frames()
+
 class VideosTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -320,7 +3110,9 @@ class VideosTab(QWidget):
         
         layout.addLayout(btn_layout)
         
-        self.video_list = DragDropListWidget()
+        self.clip_model = ClipListModel(self)
+        self.video_list = DragDropListView()
+        self.video_list.setModel(self.clip_model)
         self.video_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.video_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         layout.addWidget(self.video_list)
@@ -344,41 +3136,52 @@ class VideosTab(QWidget):
         self.setLayout(layout)
 
     def clear_videos(self):
-        self.video_list.clear()
+        self.clip_model.clear()
         self.output_file.setText('output.mp4')
 
+    def get_clips(self):
+        return self.clip_model.paths()
+
 class XfadeGUI(QWidget):
     def __init__(self):
         super().__init__()
         self.settings = QSettings('afkarxyz', 'FFmpeg Xfade GUI')
-        self.gpu_type = self.detect_gpu()
+        self.gpu_type = get_cached_gpu_type(self.settings) or 'GPU'
+        self.gpu_worker = None
+        self.first_paint_reported = False
         self.transition_labels = {}
-        self.transition_movies = {}
+        self.transition_movies = OrderedDict()
+        self.transition_gif_paths = {}
+        self.probe_workers = []
+        self.scan_workers = []
+        self.active_jobs = {}
+        self.preview_worker = None
+        self.stopped_previews = []
+        self.scrubber = None
+        self.render_queue = RenderQueue(self.settings.value('max_jobs', 1, type=int))
         self._loading_settings = False
         self.initUI()
 
     def detect_gpu(self):
-        try:
-            import GPUtil
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                gpu_name = gpus[0].name.lower()
-                if 'nvidia' in gpu_name:
-                    return 'NVIDIA'
-                elif 'radeon' in gpu_name:
-                    return 'RADEON'
-            
-            import platform
-            if platform.system() == 'Windows':
-                import wmi
-                c = wmi.WMI()
-                for gpu in c.Win32_VideoController():
-                    if 'intel' in gpu.Name.lower() or 'amd' in gpu.Name.lower():
-                        return 'GPU'
-        except ImportError:
-            pass
-        
-        return 'GPU'
+        if get_cached_gpu_type(self.settings) or self.gpu_worker is not None:
+            return
+        self.gpu_worker = GpuDetectWorker()
+        self.gpu_worker.detected.connect(self.on_gpu_detected)
+        self.gpu_worker.start()
+
+    def on_gpu_detected(self, gpu_type):
+        self.gpu_type = gpu_type
+        self.settings.setValue('gpu_type', gpu_type)
+        self.settings.setValue('gpu_detected_at', time.time())
+        if not self.active_jobs:
+            self.videos_tab.process_gpu_btn.setText(f'Start ({self.gpu_type})')
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_reported:
+            self.first_paint_reported = True
+            report_startup_time('first_paint')
+            QTimer.singleShot(0, self.detect_gpu)
 
     def initUI(self):
         self.setWindowTitle('FFmpeg Xfade GUI')
@@ -410,9 +3213,73 @@ class XfadeGUI(QWidget):
         self.transition_duration.setSingleStep(0.1)
         self.transition_duration.setValue(0.5)
         transition_options_layout.addWidget(self.transition_duration)
+        transition_options_layout.addWidget(QLabel('Workers:'))
+        self.parallel_workers = QSpinBox()
+        self.parallel_workers.setRange(1, max(1, os.cpu_count() or 1))
+        self.parallel_workers.setToolTip('Number of FFmpeg processes rendering chunks in parallel (1 = single process)')
+        transition_options_layout.addWidget(self.parallel_workers)
+        transition_options_layout.addWidget(QLabel('Jobs:'))
+        self.max_jobs = QSpinBox()
+        self.max_jobs.setRange(1, 16)
+        self.max_jobs.setToolTip('Number of renders the queue runs at the same time')
+        transition_options_layout.addWidget(self.max_jobs)
         transition_options_layout.addStretch()
-        
+        self.preview_btn = QPushButton('Preview')
+        self.preview_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.preview_btn.setToolTip('Render a low-resolution reel of just the transitions')
+        self.preview_btn.clicked.connect(self.preview_transitions)
+        transition_options_layout.addWidget(self.preview_btn)
+        self.scrub_btn = QPushButton('Scrub')
+        self.scrub_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.scrub_btn.setToolTip('Scrub through the selected transition on your own clips')
+        self.scrub_btn.clicked.connect(self.open_scrubber)
+        transition_options_layout.addWidget(self.scrub_btn)
         transition_layout.addLayout(transition_options_layout)
+
+        render_options_layout = QHBoxLayout()
+        self.smart_render = QCheckBox('Smart render')
+        self.smart_render.setToolTip('Re-encode only the transitions and stream-copy the rest when inputs match')
+        render_options_layout.addWidget(self.smart_render)
+        self.intermediate_cache = QCheckBox('Cache')
+        self.intermediate_cache.setToolTip('Keep normalized copies of the clips so re-renders skip normalization')
+        render_options_layout.addWidget(self.intermediate_cache)
+        self.incremental = QCheckBox('Incremental')
+        self.incremental.setToolTip('Keep rendered segments and only re-encode the ones affected by clip list edits')
+        render_options_layout.addWidget(self.incremental)
+        self.resumable = QCheckBox('Resumable')
+        self.resumable.setToolTip('Journal finished pieces in the Transitioned folder so a stopped render can continue')
+        render_options_layout.addWidget(self.resumable)
+        self.faststart = QCheckBox('Faststart')
+        self.faststart.setToolTip('Move the MP4 index to the front so playback can start before the file is downloaded')
+        render_options_layout.addWidget(self.faststart)
+        render_options_layout.addStretch()
+        transition_layout.addLayout(render_options_layout)
+
+        output_options_layout = QHBoxLayout()
+        output_options_layout.addWidget(QLabel('Resolution:'))
+        self.output_resolution = QComboBox()
+        self.output_resolution.setEditable(True)
+        self.output_resolution.addItems(['Auto', '3840x2160', '2560x1440', '1920x1080', '1280x720', '854x480'])
+        self.output_resolution.setToolTip('Auto uses the most common resolution among the clips')
+        output_options_layout.addWidget(self.output_resolution)
+        output_options_layout.addWidget(QLabel('FPS:'))
+        self.output_fps = QComboBox()
+        self.output_fps.setEditable(True)
+        self.output_fps.addItems(['Auto', '24', '25', '30', '50', '60', '30000/1001', '60000/1001'])
+        self.output_fps.setToolTip('Auto uses the most common frame rate among the clips')
+        output_options_layout.addWidget(self.output_fps)
+        output_options_layout.addWidget(QLabel('Profile:'))
+        self.encoding_profile = QComboBox()
+        self.encoding_profile.addItems(list(ENCODING_PROFILES))
+        self.encoding_profile.setToolTip('Fast trades file size for speed, Quality trades speed for quality')
+        output_options_layout.addWidget(self.encoding_profile)
+        output_options_layout.addWidget(QLabel('Output:'))
+        self.output_mode = QComboBox()
+        self.output_mode.addItems([mode for mode in OUTPUT_MODES if mode != 'pipe'])
+        self.output_mode.setToolTip('fmp4 and hls can be played or uploaded while the render is still running')
+        output_options_layout.addWidget(self.output_mode)
+        output_options_layout.addStretch()
+        transition_layout.addLayout(output_options_layout)
         
         self.transition_type = QComboBox()
         self.transition_type.hide()
@@ -430,24 +3297,61 @@ class XfadeGUI(QWidget):
         if fade_index != -1:
             self.transition_type.setCurrentIndex(fade_index)
 
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
+        self.gallery_scroll_area = QScrollArea()
+        self.gallery_scroll_area.setWidgetResizable(True)
         gallery_widget = QWidget()
         gallery_layout = QGridLayout(gallery_widget)
         gallery_layout.setHorizontalSpacing(10)
         gallery_layout.setVerticalSpacing(10)
         self.load_gallery(gallery_layout)
-        scroll_area.setWidget(gallery_widget)
-        transition_layout.addWidget(scroll_area)
+        self.gallery_scroll_area.setWidget(gallery_widget)
+        transition_layout.addWidget(self.gallery_scroll_area)
+
+        self.gallery_timer = QTimer(self)
+        self.gallery_timer.setSingleShot(True)
+        self.gallery_timer.setInterval(50)
+        self.gallery_timer.timeout.connect(self.update_gallery_visibility)
+        self.gallery_scroll_area.verticalScrollBar().valueChanged.connect(self.gallery_timer.start)
 
         transition_tab.setLayout(transition_layout)
+        self.transition_tab = transition_tab
         self.tab_widget.addTab(transition_tab, "Transitions")
+        self.tab_widget.currentChanged.connect(self.gallery_timer.start)
 
         process_tab = QWidget()
         process_layout = QVBoxLayout()
 
-        self.log_output = QTextEdit()
-        self.log_output.setReadOnly(True)
+        progress_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setFormat('%p%')
+        progress_layout.addWidget(self.progress_bar)
+        self.progress_status = QLabel('')
+        self.progress_status.setMinimumWidth(300)
+        progress_layout.addWidget(self.progress_status)
+        process_layout.addLayout(progress_layout)
+
+        resource_layout = QHBoxLayout()
+        self.resource_status = QLabel('')
+        resource_layout.addWidget(self.resource_status)
+        resource_layout.addStretch()
+        resource_layout.addWidget(QLabel('Memory alert:'))
+        self.memory_alert = QSpinBox()
+        self.memory_alert.setRange(0, 1024 * 1024)
+        self.memory_alert.setSingleStep(256)
+        self.memory_alert.setSuffix(' MB')
+        self.memory_alert.setSpecialValueText('Off')
+        self.memory_alert.setToolTip('Warn in the log when FFmpeg memory use passes this amount')
+        resource_layout.addWidget(self.memory_alert)
+        process_layout.addLayout(resource_layout)
+
+        self.chunk_list = QListWidget()
+        self.chunk_list.setFixedHeight(90)
+        self.chunk_list.hide()
+        process_layout.addWidget(self.chunk_list)
+
+        self.log_output = BatchedLogView()
+        self.log_output.status_changed.connect(self.progress_status.setText)
         process_layout.addWidget(self.log_output)
 
         stop_layout = QHBoxLayout()
@@ -505,6 +3409,18 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
         
         self.transition_duration.valueChanged.connect(self.save_settings)
         self.transition_type.currentTextChanged.connect(self.save_settings)
+        self.smart_render.toggled.connect(self.save_settings)
+        self.parallel_workers.valueChanged.connect(self.save_settings)
+        self.max_jobs.valueChanged.connect(self.save_settings)
+        self.output_resolution.currentTextChanged.connect(self.save_settings)
+        self.output_fps.currentTextChanged.connect(self.save_settings)
+        self.encoding_profile.currentTextChanged.connect(self.save_settings)
+        self.output_mode.currentTextChanged.connect(self.save_settings)
+        self.faststart.toggled.connect(self.save_settings)
+        self.intermediate_cache.toggled.connect(self.save_settings)
+        self.incremental.toggled.connect(self.save_settings)
+        self.resumable.toggled.connect(self.save_settings)
+        self.memory_alert.valueChanged.connect(self.save_settings)
 
     def load_gallery(self, layout):
         transitions = [
@@ -525,19 +3441,65 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
             
             movie_label.clicked.connect(self.create_transition_handler(transition))
             
+            movie_label.setFixedSize(QSize(135, 102))
+            movie_label.setText(transition)
+            
             gif_path = get_resource_path(os.path.join("assets", f"{transition}.gif"))
             if os.path.exists(gif_path):
-                movie = QMovie(gif_path)
-                movie.setScaledSize(QSize(135, 102))
-                movie_label.setMovie(movie)
-                movie.start()
-                self.transition_movies[transition] = movie
-            else:
-                movie_label.setText(transition)
+                self.transition_gif_paths[transition] = gif_path
             
             layout.addWidget(movie_label, i // 4, i % 4)
             self.transition_labels[transition] = movie_label
 
+    def update_gallery_visibility(self):
+        if self.tab_widget.currentWidget() is not self.transition_tab or not self.isVisible():
+            for movie in self.transition_movies.values():
+                movie.setPaused(True)
+            return
+
+        viewport = self.gallery_scroll_area.viewport()
+        viewport_rect = viewport.rect()
+        for transition, label in self.transition_labels.items():
+            label_rect = label.rect().translated(label.mapTo(viewport, label.rect().topLeft()))
+            if label_rect.intersects(viewport_rect):
+                self.start_transition_movie(transition)
+            elif transition in self.transition_movies:
+                self.transition_movies[transition].setPaused(True)
+
+    def start_transition_movie(self, transition):
+        movie = self.transition_movies.get(transition)
+        if movie is None:
+            gif_path = self.transition_gif_paths.get(transition)
+            if gif_path is None:
+                return
+            movie = QMovie(gif_path, parent=self)
+            movie.setCacheMode(QMovie.CacheMode.CacheAll)
+            movie.setScaledSize(QSize(135, 102))
+            self.transition_labels[transition].setMovie(movie)
+            self.transition_movies[transition] = movie
+            movie.start()
+        else:
+            self.transition_movies.move_to_end(transition)
+            movie.setPaused(False)
+
+        while len(self.transition_movies) > MAX_GALLERY_MOVIES:
+            evicted, old_movie = self.transition_movies.popitem(last=False)
+            label = self.transition_labels[evicted]
+            still = old_movie.currentPixmap()
+            old_movie.stop()
+            label.setMovie(None)
+            if not still.isNull():
+                label.setPixmap(still)
+            old_movie.deleteLater()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.gallery_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_gallery_visibility()
+
 
     def create_transition_handler(self, transition):
         return lambda: self.select_transition(transition)
@@ -564,8 +3526,7 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
         label.setGraphicsEffect(None)
     
     def show_context_menu(self, position):
-        item = self.videos_tab.video_list.itemAt(position)
-        if item is not None:
+        if self.videos_tab.video_list.indexAt(position).isValid():
             context_menu = QMenu(self)
             delete_action = QAction("Delete", self)
             delete_action.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_TrashIcon))
@@ -574,21 +3535,40 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
             context_menu.exec(self.videos_tab.video_list.mapToGlobal(position))
     
     def delete_selected_file(self):
-        current_row = self.videos_tab.video_list.currentRow()
-        if current_row >= 0:
-            self.videos_tab.video_list.takeItem(current_row)
+        rows = [index.row() for index in self.videos_tab.video_list.selectionModel().selectedIndexes()]
+        current = self.videos_tab.video_list.currentIndex()
+        if not rows and current.isValid():
+            rows = [current.row()]
+        self.videos_tab.clip_model.remove_rows(rows)
     
     def handle_dropped_files(self, files):
-        for file in files:
-            self.videos_tab.video_list.addItem(file)
-        
-        if files:
+        scan_worker = FolderScanWorker(files)
+        scan_worker.found.connect(self.add_clips)
+        scan_worker.finished.connect(lambda: self.scan_workers.remove(scan_worker))
+        self.scan_workers.append(scan_worker)
+        scan_worker.start()
+
+    def add_clips(self, files):
+        added = self.videos_tab.clip_model.add_paths(files)
+        if added:
             self.update_output_path()
+            self.prefetch_video_info(added)
     
+    def prefetch_video_info(self, files):
+        probe_worker = ProbeWorker(files)
+        probe_worker.probed.connect(self.update_video_info)
+        probe_worker.finished.connect(lambda: self.probe_workers.remove(probe_worker))
+        self.probe_workers.append(probe_worker)
+        probe_worker.start()
+
+    def update_video_info(self, file_path, info):
+        self.videos_tab.clip_model.set_info(file_path, info)
+
     def update_output_path(self):
-        if self.videos_tab.video_list.count() > 0:
+        clips = self.videos_tab.get_clips()
+        if clips:
             from pathlib import Path
-            first_video = self.videos_tab.video_list.item(0).text()
+            first_video = clips[0]
             first_video_path = Path(first_video)
             transitioned_folder = first_video_path.parent / "Transitioned"
             
@@ -600,15 +3580,7 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
             self.videos_tab.output_file.setText(str(output_file).replace('\\', '/'))
 
     def add_video(self):
-        video_formats = "Video Files ("
-        extensions = [
-            "*.mp4", "*.avi", "*.mov", "*.mkv", "*.wmv", "*.flv", "*.webm", 
-            "*.m4v", "*.mpg", "*.mpeg", "*.m2v", "*.m2ts", "*.mts", "*.ts", 
-            "*.vob", "*.3gp", "*.3g2", "*.f4v", "*.asf", "*.rmvb", "*.rm", 
-            "*.ogv", "*.mxf", "*.dv", "*.divx", "*.xvid", "*.mpv", "*.m2p", 
-            "*.mp2", "*.mpeg2", "*.ogm"
-        ]
-        video_formats += " ".join(extensions) + ")"
+        video_formats = "Video Files (" + " ".join(f"*{ext}" for ext in sorted(VIDEO_EXTENSIONS)) + ")"
         
         files, _ = QFileDialog.getOpenFileNames(
             self, 
@@ -616,84 +3588,164 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
             '', 
             video_formats
         )
-        for file in files:
-            self.videos_tab.video_list.addItem(file)
-        
-        if files:
-            self.update_output_path()
+        self.add_clips(files)
 
     def get_unique_output_name(self, base_name):
-        name, ext = os.path.splitext(base_name)
-        counter = 1
-        while os.path.exists(f"{name}{ext}"):
-            name = f"{name.rstrip('_0123456789')}_{counter}"
-            counter += 1
-        return f"{name}{ext}"
+        return get_unique_output_name(base_name)
 
     def process_videos(self, use_gpu=False):
-        segments = [self.videos_tab.video_list.item(i).text() for i in range(self.videos_tab.video_list.count())]
+        segments = self.videos_tab.get_clips()
         if len(segments) < 2:
             QMessageBox.warning(self, 'Warning', 'Please select at least two videos.')
             return
 
-        from pathlib import Path
-        first_video_path = Path(segments[0])
-        first_video_dir = first_video_path.parent
-        
-        transitioned_folder = first_video_dir / "Transitioned"
-        transitioned_folder.mkdir(exist_ok=True)
-        
-        output_filename = self.videos_tab.output_file.text()
-        if not output_filename:
-            output_filename = 'output.mp4'
-        
-        output_file = transitioned_folder / Path(output_filename).name
-        output_file = self.get_unique_output_name(str(output_file))
+        output_file = get_default_output_file(segments, self.videos_tab.output_file.text())
         self.videos_tab.output_file.setText(str(output_file).replace('\\', '/'))
 
-        transition_duration = self.transition_duration.value()
-        transition_type = self.transition_type.currentText()
+        job = {
+            'segments': segments,
+            'output_file': output_file,
+            'transition_duration': self.transition_duration.value(),
+            'transition_type': self.transition_type.currentText(),
+            'use_gpu': use_gpu,
+            'gpu_type': self.gpu_type,
+            'smart_render': self.smart_render.isChecked(),
+            'parallel_workers': self.parallel_workers.value(),
+            'profile': self.encoding_profile.currentText(),
+            'use_cache': self.intermediate_cache.isChecked(),
+            'incremental': self.incremental.isChecked(),
+            'resumable': self.resumable.isChecked(),
+            'output_mode': self.output_mode.currentText(),
+            'faststart': self.faststart.isChecked(),
+            'memory_alert_mb': self.memory_alert.value(),
+            'stall_timeout': self.settings.value('stall_timeout', DEFAULT_STALL_TIMEOUT, type=float),
+            'timeout': self.settings.value('job_timeout', 0, type=float),
+            'cache_size_gb': self.settings.value('intermediate_cache_gb', DEFAULT_INTERMEDIATE_CACHE_BYTES / 1024 ** 3, type=float),
+        }
+        try:
+            job['output_format'] = parse_output_format(self.output_resolution.currentText(), self.output_fps.currentText())
+        except Exception as e:
+            release_output_file(output_file)
+            QMessageBox.warning(self, 'Warning', str(e))
+            return
 
-        self.worker = FFmpegWorker(segments, output_file, transition_duration, transition_type, '', use_gpu)
-        self.worker.gpu_type = self.gpu_type
-        self.worker.finished.connect(self.on_process_finished)
+        self.worker = create_render_worker(job)
+        self.chunk_list.clear()
+        if isinstance(self.worker, ParallelFFmpegWorker):
+            self.worker.chunk_progress.connect(self.update_chunk_progress)
+            self.chunk_list.show()
+        else:
+            self.chunk_list.hide()
         self.worker.progress.connect(self.update_log)
-        self.worker.start()
+        self.worker.progress_info.connect(self.update_progress_info)
+        self.worker.resource_sample.connect(self.update_resource_info)
+        self.progress_bar.setValue(0)
+        self.progress_status.setText('')
+        self.resource_status.setText('')
+
+        job_id = job['id'] = self.render_queue.allocate_id()
+        self.worker.finished.connect(lambda success, message, job_id=job_id: self.on_job_finished(job_id, success, message))
+        self.active_jobs[job_id] = self.worker
+        self.render_queue.submit(job, self.worker)
+        if len(self.active_jobs) > 1:
+            self.update_log(f"Queued {job_id}: {os.path.basename(output_file)}")
 
         self.tab_widget.setCurrentIndex(2)
 
-        self.videos_tab.process_cpu_btn.setEnabled(False)
-        self.videos_tab.process_gpu_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         
         if use_gpu:
-            self.videos_tab.process_gpu_btn.setText(f'Processing ({self.gpu_type})...')
+            self.videos_tab.process_gpu_btn.setText(f'Queue ({self.gpu_type})')
         else:
-            self.videos_tab.process_cpu_btn.setText('Processing...')
+            self.videos_tab.process_cpu_btn.setText('Queue (CPU)')
+
+    def preview_transitions(self):
+        segments = self.videos_tab.get_clips()
+        if len(segments) < 2:
+            QMessageBox.warning(self, 'Warning', 'Please select at least two videos.')
+            return
+        try:
+            output_format = parse_output_format(self.output_resolution.currentText(), self.output_fps.currentText())
+        except Exception as e:
+            QMessageBox.warning(self, 'Warning', str(e))
+            return
+
+        if self.preview_worker is not None:
+            self.preview_worker.stop()
+            self.stopped_previews = [worker for worker in self.stopped_previews if worker.isRunning()]
+            self.stopped_previews.append(self.preview_worker)
+
+        worker = self.preview_worker = PreviewWorker(segments, self.transition_duration.value(),
+                                                     self.transition_type.currentText(), output_format=output_format)
+        worker.progress.connect(self.update_log)
+        worker.preview_ready.connect(lambda path: QDesktopServices.openUrl(QUrl.fromLocalFile(path)))
+        worker.finished.connect(lambda success, message: self.on_preview_finished(worker, success, message))
+        self.preview_btn.setText('Previewing...')
+        worker.start()
+
+    def open_scrubber(self):
+        segments = self.videos_tab.get_clips()
+        if len(segments) < 2:
+            QMessageBox.warning(self, 'Warning', 'Please select at least two videos.')
+            return
+        if self.scrubber is None:
+            self.scrubber = TransitionScrubber(self)
+            self.transition_type.currentTextChanged.connect(self.update_scrubber)
+            self.transition_duration.valueChanged.connect(self.update_scrubber)
+        self.scrubber.transition = self.transition_type.currentText()
+        self.scrubber.duration = self.transition_duration.value()
+        self.scrubber.set_clips(segments)
+        self.scrubber.show()
+        self.scrubber.raise_()
+
+    def update_scrubber(self):
+        self.scrubber.set_transition(self.transition_type.currentText(), self.transition_duration.value())
+
+    def on_preview_finished(self, worker, success, message):
+        if worker is not self.preview_worker:
+            return
+        self.preview_btn.setText('Preview')
+        if not success:
+            self.update_log(f"❌ Preview failed: {message}")
 
     def update_log(self, message):
-        self.log_output.append(message)
-        self.log_output.moveCursor(QTextCursor.MoveOperation.End)
+        self.log_output.append_line(message)
+
+    def update_progress_info(self, info):
+        if info.get('percent') is not None:
+            self.progress_bar.setValue(int(info['percent'] * 10))
+        self.progress_status.setText(format_progress_info(info))
+
+    def update_resource_info(self, sample):
+        self.resource_status.setText(format_resource_sample(sample))
+
+    def update_chunk_progress(self, index, status):
+        while self.chunk_list.count() <= index:
+            self.chunk_list.addItem("")
+        self.chunk_list.item(index).setText(f"{index + 1}. {status}")
+
+    def on_job_finished(self, job_id, success, message):
+        self.active_jobs.pop(job_id, None)
+        if self.active_jobs:
+            self.update_log(f"{job_id}: {'completed' if success else 'stopped'}")
+        self.on_process_finished(success, message)
 
     def on_process_finished(self, success, message):
-        self.videos_tab.process_cpu_btn.setEnabled(True)
-        self.videos_tab.process_gpu_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-        
-        self.videos_tab.process_cpu_btn.setText('Start (CPU)')
-        self.videos_tab.process_gpu_btn.setText(f'Start ({self.gpu_type})')
+        if not self.active_jobs:
+            self.stop_btn.setEnabled(False)
+            self.videos_tab.process_cpu_btn.setText('Start (CPU)')
+            self.videos_tab.process_gpu_btn.setText(f'Start ({self.gpu_type})')
 
         if success:
+            if not self.active_jobs:
+                self.progress_bar.setValue(self.progress_bar.maximum())
             self.update_log("✅ Processing completed successfully!")
         else:
             self.update_log(f"❌ Error: {message}")
             self.tab_widget.setCurrentIndex(2)
     
     def stop_processing(self):
-        if hasattr(self, 'worker') and self.worker:
-            self.worker.stop()
-            self.worker.wait()
-        self.on_process_finished(False, "Processing stopped by user")
+        self.render_queue.cancel_all()
     
     def save_settings(self):
         current_transition = self.transition_type.currentText()
@@ -701,6 +3753,19 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
         
         self.settings.setValue('transition_type', current_transition)
         self.settings.setValue('transition_duration', current_duration)
+        self.settings.setValue('smart_render', self.smart_render.isChecked())
+        self.settings.setValue('parallel_workers', self.parallel_workers.value())
+        self.settings.setValue('max_jobs', self.max_jobs.value())
+        self.settings.setValue('output_resolution', self.output_resolution.currentText())
+        self.settings.setValue('output_fps', self.output_fps.currentText())
+        self.settings.setValue('encoding_profile', self.encoding_profile.currentText())
+        self.settings.setValue('output_mode', self.output_mode.currentText())
+        self.settings.setValue('faststart', self.faststart.isChecked())
+        self.settings.setValue('intermediate_cache', self.intermediate_cache.isChecked())
+        self.settings.setValue('incremental', self.incremental.isChecked())
+        self.settings.setValue('resumable', self.resumable.isChecked())
+        self.settings.setValue('memory_alert_mb', self.memory_alert.value())
+        self.render_queue.set_max_jobs(self.max_jobs.value())
         self.settings.sync()
     
     def load_settings(self):
@@ -709,6 +3774,18 @@ MP4, AVI, MOV, MKV, WMV, FLV, WEBM, M4V, MPG, MPEG, M2V, M2TS, MTS, TS, VOB, 3GP
         saved_duration = self.settings.value('transition_duration', 0.5, type=float)
         
         self.transition_duration.setValue(saved_duration)
+        self.smart_render.setChecked(self.settings.value('smart_render', False, type=bool))
+        self.parallel_workers.setValue(self.settings.value('parallel_workers', 1, type=int))
+        self.max_jobs.setValue(self.settings.value('max_jobs', 1, type=int))
+        self.output_resolution.setCurrentText(self.settings.value('output_resolution', 'Auto'))
+        self.output_fps.setCurrentText(self.settings.value('output_fps', 'Auto'))
+        self.encoding_profile.setCurrentText(self.settings.value('encoding_profile', DEFAULT_PROFILE))
+        self.output_mode.setCurrentText(self.settings.value('output_mode', 'mp4'))
+        self.faststart.setChecked(self.settings.value('faststart', False, type=bool))
+        self.intermediate_cache.setChecked(self.settings.value('intermediate_cache', False, type=bool))
+        self.incremental.setChecked(self.settings.value('incremental', False, type=bool))
+        self.resumable.setChecked(self.settings.value('resumable', False, type=bool))
+        self.memory_alert.setValue(self.settings.value('memory_alert_mb', 0, type=int))
         
         transition_index = self.transition_type.findText(saved_transition)
         if transition_index != -1:
@@ -723,11 +3800,394 @@ class ClickableLabel(QLabel):
         self.clicked.emit()
         super().mousePressEvent(event)
 
+CLI_COMMAND = 'render'
+
+def load_job_file(job_file):
+    with open(job_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    jobs = data.get('jobs', []) if isinstance(data, dict) else data
+    defaults = data.get('defaults', {}) if isinstance(data, dict) else {}
+    return [dict(defaults, **job) for job in jobs]
+
+def build_cli_job(job, args):
+    segments = job.get('segments') or job.get('clips') or []
+    if len(segments) < 2:
+        raise Exception("Each job needs at least two clips")
+    output_file = job.get('output_file') or job.get('output')
+    output_mode = job.get('output_mode', args.output_mode)
+    if output_file == '-':
+        output_file, output_mode = None, 'pipe'
+    if output_file:
+        output_dir = os.path.dirname(os.path.abspath(output_file))
+        os.makedirs(output_dir, exist_ok=True)
+    elif output_mode != 'pipe':
+        output_file = get_default_output_file(segments)
+    cli_job = {
+        'segments': segments,
+        'output_file': output_file,
+        'transition_type': job.get('transition_type', job.get('transition', args.transition)),
+        'transition_duration': float(job.get('transition_duration', job.get('duration', args.duration))),
+        'use_gpu': job.get('use_gpu', job.get('gpu', args.gpu)),
+        'gpu_type': args.gpu_type,
+        'smart_render': job.get('smart_render', args.smart_render),
+        'parallel_workers': int(job.get('parallel_workers', job.get('workers', args.workers))),
+        'threads': int(job.get('threads', args.threads)),
+        'profile': job.get('profile', args.profile),
+        'use_cache': job.get('cache', args.cache),
+        'incremental': job.get('incremental', args.incremental),
+        'resumable': job.get('resumable', args.resumable),
+        'coordinator': job.get('coordinator', args.coordinator),
+        'local_nodes': int(job.get('local_nodes', args.local_nodes)),
+        'node_token': job.get('node_token', args.node_token),
+        'stall_timeout': float(job.get('stall_timeout', args.stall_timeout)),
+        'timeout': float(job.get('timeout', args.timeout)),
+        'memory_alert_mb': int(job.get('memory_alert_mb', args.memory_alert_mb)),
+        'cache_size_gb': float(job.get('cache_size_gb', args.cache_size_gb)),
+        'output_mode': output_mode,
+        'faststart': job.get('faststart', args.faststart),
+        'hls_time': float(job.get('hls_time', args.hls_time)),
+        'hls_list_size': int(job.get('hls_list_size', args.hls_list_size)),
+        'output_format': parse_output_format(job.get('resolution', args.resolution), job.get('fps', args.fps),
+                                             job.get('pix_fmt', args.pix_fmt)),
+    }
+    if job.get('id'):
+        cli_job['id'] = job['id']
+    return cli_job
+
+def get_settings_job_spec(settings):
+    return {
+        'transition': settings.value('transition_type', 'fade'),
+        'duration': settings.value('transition_duration', 0.5, type=float),
+        'smart_render': settings.value('smart_render', False, type=bool),
+        'workers': settings.value('parallel_workers', 1, type=int),
+        'profile': settings.value('encoding_profile', DEFAULT_PROFILE),
+        'resolution': settings.value('output_resolution', 'Auto'),
+        'fps': settings.value('output_fps', 'Auto'),
+        'cache': settings.value('intermediate_cache', False, type=bool),
+        'cache_size_gb': settings.value('intermediate_cache_gb', DEFAULT_INTERMEDIATE_CACHE_BYTES / 1024 ** 3, type=float),
+        'incremental': settings.value('incremental', False, type=bool),
+        'resumable': settings.value('resumable', False, type=bool),
+        'memory_alert_mb': settings.value('memory_alert_mb', 0, type=int),
+        'stall_timeout': settings.value('stall_timeout', DEFAULT_STALL_TIMEOUT, type=float),
+        'timeout': settings.value('job_timeout', 0, type=float),
+        'output_mode': settings.value('output_mode', 'mp4'),
+        'faststart': settings.value('faststart', False, type=bool),
+    }
+
+def natural_sort_key(file_path):
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', file_path)]
+
+WATCH_MANIFEST_NAME = 'xfade.json'
+WATCH_STATE_NAME = '.xfade_watch.json'
+WATCH_GROUP_PATTERN = r'^(?P<group>.+?)[_\- ]\d+\.[^.]+$'
+
+class WatchFolderDaemon(QObject):
+    def __init__(self, folders, render_queue, args, settings, settle=10.0, poll_interval=5.0,
+                 group_pattern=WATCH_GROUP_PATTERN, max_pending=2):
+        super().__init__()
+        self.folders = [os.path.abspath(folder) for folder in folders]
+        self.render_queue = render_queue
+        self.args = args
+        self.settings = settings
+        self.settle = settle
+        self.group_pattern = re.compile(group_pattern)
+        self.max_pending = max(1, max_pending)
+        self.files = {}
+        self.submitted = {}
+        self.states = {folder: self.load_state(folder) for folder in self.folders}
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(lambda path: self.scan_timer.start())
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setSingleShot(True)
+        self.scan_timer.setInterval(1000)
+        self.scan_timer.timeout.connect(self.scan)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(int(poll_interval * 1000))
+        self.poll_timer.timeout.connect(self.scan)
+        self.render_queue.job_status.connect(self.on_job_status)
+
+    def start(self):
+        self.scan()
+        self.poll_timer.start()
+
+    def load_state(self, folder):
+        try:
+            with open(os.path.join(folder, WATCH_STATE_NAME), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'processed': {}}
+
+    def save_state(self, folder):
+        state_file = os.path.join(folder, WATCH_STATE_NAME)
+        with open(f"{state_file}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(self.states[folder], f, indent=1)
+        os.replace(f"{state_file}.tmp", state_file)
+
+    def scan(self):
+        now = time.monotonic()
+        seen = set()
+        for folder in self.folders:
+            videos = []
+            manifests = []
+            for root, dirs, files in os.walk(folder):
+                dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'Transitioned']
+                if root not in self.watcher.directories():
+                    self.watcher.addPath(root)
+                for name in files:
+                    file_path = os.path.join(root, name)
+                    if name == WATCH_MANIFEST_NAME:
+                        manifests.append(file_path)
+                    elif is_video_file(name):
+                        videos.append(file_path)
+                    else:
+                        continue
+                    seen.add(file_path)
+                    self.update_file(file_path, now)
+            for group in self.get_groups(folder, videos, manifests):
+                self.submit_group(folder, group, now)
+        for file_path in list(self.files):
+            if file_path not in seen:
+                del self.files[file_path]
+
+    def update_file(self, file_path, now):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+        signature = (stat.st_size, stat.st_mtime_ns)
+        previous = self.files.get(file_path)
+        if previous is None or previous[0] != signature:
+            self.files[file_path] = (signature, now)
+
+    def is_stable(self, file_path, now):
+        entry = self.files.get(file_path)
+        return entry is not None and now - entry[1] >= self.settle
+
+    def get_groups(self, folder, videos, manifests):
+        groups = []
+        claimed = set()
+        for manifest_file in manifests:
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    spec = json.load(f)
+            except (OSError, ValueError):
+                continue
+            root = os.path.dirname(manifest_file)
+            clips = [os.path.normpath(os.path.join(root, clip)) for clip in spec.get('clips', [])]
+            claimed.update(clips)
+            groups.append({'name': os.path.relpath(root, folder), 'clips': clips, 'spec': spec,
+                           'manifest': manifest_file})
+
+        named = {}
+        for file_path in videos:
+            match = self.group_pattern.match(os.path.basename(file_path))
+            if match and file_path not in claimed:
+                named.setdefault((os.path.dirname(file_path), match.group('group')), []).append(file_path)
+        for (root, name), clips in sorted(named.items()):
+            groups.append({'name': name, 'clips': sorted(clips, key=natural_sort_key),
+                           'spec': {'output': f"{name}.mp4"}, 'manifest': None})
+        return groups
+
+    def submit_group(self, folder, group, now):
+        paths = group['clips'] + ([group['manifest']] if group['manifest'] else [])
+        if len(group['clips']) < 2 or not all(self.is_stable(path, now) for path in paths):
+            return
+        key = get_cache_key('watch-v1', [get_file_identity(path) for path in paths])
+        if key in self.states[folder]['processed'] or (folder, key) in self.submitted.values():
+            return
+        if self.render_queue.backlog() >= self.max_pending:
+            return
+
+        spec = dict(get_settings_job_spec(self.settings), **group['spec'])
+        spec['clips'] = group['clips']
+        output_name = spec.pop('output', None) or f"{group['name']}.mp4"
+        spec['output'] = get_default_output_file(group['clips'], os.path.basename(output_name))
+        try:
+            job = build_cli_job(spec, self.args)
+        except Exception as e:
+            release_output_file(spec['output'])
+            self.states[folder]['processed'][key] = {'name': group['name'], 'status': 'invalid', 'message': str(e)}
+            self.save_state(folder)
+            return
+        job_id = self.render_queue.submit(job)
+        self.submitted[job_id] = (folder, key)
+
+    def on_job_status(self, entry):
+        if entry['status'] not in ('completed', 'failed', 'cancelled'):
+            return
+        folder, key = self.submitted.pop(entry['job_id'], (None, None))
+        if key is None or entry['status'] == 'cancelled':
+            return
+        self.states[folder]['processed'][key] = {'output': entry['output_file'], 'status': entry['status'],
+                                                 'time': entry['time'], 'message': entry.get('message', '')}
+        self.save_state(folder)
+        self.scan_timer.start()
+
+def build_dry_run_plan(job):
+    plan = create_render_worker(job).build_plan()
+    output_format = plan['output_format']
+    plan['estimate'] = get_throughput_history().estimate(plan['encoder'], output_format['width'],
+                                                         output_format['height'], plan['profile'], plan['workers'],
+                                                         plan['duration'])
+    if job.get('timeout') and plan['estimate']:
+        plan['exceeds_timeout'] = plan['estimate']['wall_time'] > job['timeout']
+    return plan
+
+def run_dry_run(job_specs, args):
+    plans = []
+    for job_spec in job_specs:
+        try:
+            plans.append(build_dry_run_plan(build_cli_job(job_spec, args)))
+        except Exception as e:
+            plans.append({'clips': job_spec.get('clips') or job_spec.get('segments') or [], 'error': str(e)})
+    print(json.dumps(plans, indent=2))
+    return 0 if not any(plan.get('error') or plan.get('exceeds_timeout') for plan in plans) else 1
+
+def run_watch(args):
+    import signal
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    render_queue = RenderQueue(args.jobs, status_file=args.status)
+    daemon = WatchFolderDaemon(args.watch, render_queue, args, QSettings('afkarxyz', 'FFmpeg Xfade GUI'),
+                               settle=args.settle, poll_interval=args.poll_interval,
+                               group_pattern=args.group_pattern, max_pending=args.max_pending or args.jobs * 2)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    daemon.start()
+    app.exec()
+    render_queue.cancel_all()
+    render_queue.wait()
+    return 0
+
+def run_cli(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog='XfadeGUI', description='Render xfade compilations without the GUI.')
+    parser.add_argument('clips', nargs='*', help='Clips to join, in order')
+    parser.add_argument('--cli', action='store_true',
+                        help='Render the clips without opening the GUI, even when no other option is given')
+    parser.add_argument('-o', '--output',
+                        help='Output file (default: Transitioned/output.mp4 next to the first clip, - for stdout)')
+    parser.add_argument('--output-mode', default='mp4', choices=OUTPUT_MODES,
+                        help='mp4, fragmented mp4 (fmp4), HLS playlist and segments (hls), or fragmented mp4 on stdout (pipe)')
+    parser.add_argument('--faststart', action='store_true', help='Move the MP4 index to the front of the file')
+    parser.add_argument('--hls-time', type=float, default=DEFAULT_HLS_TIME, help='HLS segment length in seconds')
+    parser.add_argument('--hls-list-size', type=int, default=0,
+                        help='Segments kept in the HLS playlist, older ones are deleted (0 = keep all)')
+    parser.add_argument('--job-file', help='JSON file with a list of jobs, or {"defaults": {...}, "jobs": [...]}')
+    parser.add_argument('-t', '--transition', default='fade', help='xfade transition type')
+    parser.add_argument('-d', '--duration', type=float, default=0.5, help='Transition duration in seconds')
+    parser.add_argument('--gpu', action='store_true', help='Encode with the detected GPU encoder')
+    parser.add_argument('--gpu-type', default=None, help='Override GPU detection (NVIDIA, RADEON, Intel)')
+    parser.add_argument('--smart-render', action='store_true', help='Stream-copy everything except the transitions')
+    parser.add_argument('--workers', type=int, default=1, help='Parallel FFmpeg processes per job')
+    parser.add_argument('--threads', type=int, default=0, help='Thread budget per job (0 = FFmpeg default)')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE, choices=sorted(ENCODING_PROFILES),
+                        help='Encoding speed/quality profile')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Keep rendered segments next to the output and reuse the unchanged ones')
+    parser.add_argument('--resumable', action='store_true',
+                        help='Journal finished pieces so a stopped render continues where it left off')
+    parser.add_argument('--stall-timeout', type=float, default=DEFAULT_STALL_TIMEOUT,
+                        help='Stop a job when FFmpeg makes no progress for this many seconds (0 = off)')
+    parser.add_argument('--timeout', type=float, default=0, help='Stop a job after this many seconds (0 = off)')
+    parser.add_argument('--memory-alert-mb', type=int, default=0,
+                        help='Warn when FFmpeg memory use passes this many MB (0 = off)')
+    parser.add_argument('--cache', action='store_true', help='Reuse normalized intermediates between renders')
+    parser.add_argument('--cache-size-gb', type=float, default=DEFAULT_INTERMEDIATE_CACHE_BYTES / 1024 ** 3,
+                        help='Size cap of the intermediate cache')
+    parser.add_argument('--resolution', default='auto', help='Output WIDTHxHEIGHT (default: most common among clips)')
+    parser.add_argument('--fps', default='auto', help='Output frame rate (default: most common among clips)')
+    parser.add_argument('--pix-fmt', default='auto', help='Output pixel format (default: most common among clips)')
+    parser.add_argument('--coordinator', metavar='[HOST:]PORT',
+                        help='Hand chunks to render nodes connecting to this address')
+    parser.add_argument('--local-nodes', type=int, default=0, help='Render nodes to start on this machine')
+    parser.add_argument('--node', metavar='HOST:PORT', help='Run as a render node for the coordinator at this address')
+    parser.add_argument('--node-name', help='Name this render node reports to the coordinator')
+    parser.add_argument('--node-token', default=os.environ.get(NODE_TOKEN_ENV),
+                        help=f"Shared secret render nodes must present to the coordinator (default: ${NODE_TOKEN_ENV})")
+    parser.add_argument('--watch', nargs='+', metavar='FOLDER',
+                        help='Watch folders and render new clip sets with the saved GUI settings')
+    parser.add_argument('--settle', type=float, default=10.0,
+                        help='Seconds a watched file must stop changing before it is used')
+    parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds between watch folder rescans')
+    parser.add_argument('--group-pattern', default=WATCH_GROUP_PATTERN,
+                        help='Regex whose "group" match groups watched clips without a manifest into one job')
+    parser.add_argument('--max-pending', type=int, default=0,
+                        help='Queued and running watch jobs before new sets wait (default: twice --jobs)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Print the render plan and time/size estimate of each job as JSON without rendering')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='Number of jobs rendered at the same time')
+    parser.add_argument('--status', default='-', help='JSON lines status file (default: stdout)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Print FFmpeg output to stderr')
+    args = parser.parse_args(argv)
+
+    if args.node:
+        return run_render_node(args.node, args.node_name, args.node_token)
+
+    if args.gpu_type is None:
+        args.gpu_type = detect_gpu() if args.gpu else 'GPU'
+
+    if args.watch:
+        return run_watch(args)
+
+    job_specs = load_job_file(args.job_file) if args.job_file else []
+    if args.clips:
+        job_specs.append({'clips': args.clips, 'output': args.output})
+    if not job_specs:
+        parser.error('no clips or --job-file given')
+    if args.dry_run:
+        return run_dry_run(job_specs, args)
+
+    jobs = [build_cli_job(job_spec, args) for job_spec in job_specs]
+    if any(job['output_mode'] == 'pipe' for job in jobs) and len(jobs) > 1:
+        parser.error('only one job can write to stdout')
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    render_queue = RenderQueue(args.jobs, status_file=args.status)
+    if jobs[0]['output_mode'] == 'pipe':
+        render_queue.status_stream = sys.stderr
+    results = []
+    render_queue.job_status.connect(lambda entry: results.append(entry), Qt.ConnectionType.DirectConnection)
+
+    for job in jobs:
+        worker = create_render_worker(job)
+        if args.verbose:
+            worker.progress.connect(lambda line: print(line, file=sys.stderr),
+                                    Qt.ConnectionType.DirectConnection)
+            worker.progress_info.connect(lambda info: print(format_progress_info(info), file=sys.stderr),
+                                         Qt.ConnectionType.DirectConnection)
+            worker.resource_sample.connect(lambda sample: print(format_resource_sample(sample), file=sys.stderr),
+                                           Qt.ConnectionType.DirectConnection)
+        render_queue.submit(job, worker)
+
+    try:
+        render_queue.wait()
+    except KeyboardInterrupt:
+        render_queue.cancel_all()
+        render_queue.wait()
+
+    final_status = {}
+    for entry in results:
+        final_status[entry['job_id']] = entry['status']
+    return 0 if all(status == 'completed' for status in final_status.values()) else 1
+
+def is_cli_args(argv):
+    return bool(argv) and (argv[0] == CLI_COMMAND or
+                           any(arg.startswith('-') and not os.path.exists(arg) for arg in argv))
+
 def main():
-    app = QApplication(sys.argv)
+    argv = sys.argv[1:]
+    if is_cli_args(argv):
+        sys.exit(run_cli(argv[1:] if argv[0] == CLI_COMMAND else argv))
+
+    app = QApplication(sys.argv[:1])
+    report_startup_time('application')
     app.setStyle('Fusion')
     ex = XfadeGUI()
+    report_startup_time('window_created')
     ex.show()
+    if argv:
+        ex.handle_dropped_files([os.path.abspath(path) for path in argv])
     sys.exit(app.exec())
 
 if __name__ == '__main__':
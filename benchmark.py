@@ -0,0 +1,205 @@
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import platform
+import threading
+import timeit
+
+from PyQt6.QtCore import Qt, QCoreApplication
+
+import filtergraph
+
+from XfadeGUI import (FFMPEG_PATH, FFPROBE_PATH, DEFAULT_PROFILE, ENCODING_PROFILES, get_cache_dir,
+                      create_render_worker, run_subprocess_simple, read_process_stats)
+
+BENCHMARK_VERSION = 1
+CLIP_SIZES = [(1920, 1080), (1280, 720), (640, 360)]
+CLIP_RATES = ['30', '25', '60']
+RSS_SAMPLE_INTERVAL = 0.05
+
+def get_clip_specs(count, duration):
+    return [{'width': CLIP_SIZES[i % len(CLIP_SIZES)][0], 'height': CLIP_SIZES[i % len(CLIP_SIZES)][1],
+             'fps': CLIP_RATES[i % len(CLIP_RATES)], 'duration': duration, 'has_audio': i % 4 != 3}
+            for i in range(count)]
+
+def generate_clip(spec, media_dir):
+    name = f"{spec['width']}x{spec['height']}_{spec['fps']}fps_{spec['duration']:g}s_{'av' if spec['has_audio'] else 'v'}.mp4"
+    path = os.path.join(media_dir, name)
+    if os.path.exists(path):
+        return path
+
+    ffmpeg_args = [FFMPEG_PATH, '-v', 'error', '-f', 'lavfi',
+                   '-i', f"testsrc2=size={spec['width']}x{spec['height']}:rate={spec['fps']}:duration={spec['duration']}"]
+    if spec['has_audio']:
+        ffmpeg_args.extend(['-f', 'lavfi', '-i', f"sine=frequency=440:sample_rate=48000:duration={spec['duration']}",
+                            '-c:a', 'aac'])
+    partial_file = f"{path}.part.mp4"
+    ffmpeg_args.extend(['-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', '-y', partial_file])
+    result = run_subprocess_simple(ffmpeg_args, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"Could not generate {name}: {result.stderr.strip()}")
+    os.replace(partial_file, path)
+    return path
+
+class PeakRssMonitor(threading.Thread):
+    def __init__(self, worker):
+        super().__init__(daemon=True)
+        self.worker = worker
+        self.peak_rss = {}
+        self.running = True
+
+    def run(self):
+        while self.running:
+            for process in self.worker.get_processes():
+                stats = read_process_stats(process.pid)
+                if stats and stats.get('peak_rss'):
+                    self.peak_rss[process.pid] = max(stats['peak_rss'], self.peak_rss.get(process.pid, 0))
+            time.sleep(RSS_SAMPLE_INTERVAL)
+
+    def stop(self):
+        self.running = False
+        self.join()
+        return max(self.peak_rss.values(), default=None)
+
+def get_duration(path):
+    result = run_subprocess_simple([FFPROBE_PATH, '-v', 'quiet', '-show_entries', 'format=duration',
+                                   '-of', 'csv=p=0', path], capture_output=True, text=True)
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return None
+
+def run_case(case, media_dir):
+    clips = [generate_clip(spec, media_dir) for spec in get_clip_specs(case['clips'], case['clip_duration'])]
+    output_dir = tempfile.mkdtemp(prefix='xfade_benchmark_')
+    output_file = os.path.join(output_dir, 'output.mp4')
+    job = {'segments': clips, 'output_file': output_file, 'transition_type': case['transition'],
+           'transition_duration': case['transition_duration'], 'parallel_workers': case['workers'],
+           'smart_render': case['smart_render'], 'profile': case['profile']}
+    worker = create_render_worker(job)
+    worker.record_history = False
+    status = {'success': False, 'message': '', 'frames': 0}
+    worker.finished.connect(lambda success, message: status.update(success=success, message=message),
+                            Qt.ConnectionType.DirectConnection)
+    worker.progress_info.connect(lambda info: status.update(frames=max(status['frames'], info['frame'])),
+                                 Qt.ConnectionType.DirectConnection)
+
+    monitor = PeakRssMonitor(worker)
+    monitor.start()
+    started = time.perf_counter()
+    try:
+        worker.run()
+        wall_time = time.perf_counter() - started
+        peak_rss = monitor.stop()
+        output_duration = get_duration(output_file) if status['success'] else None
+        output_size = os.path.getsize(output_file) if status['success'] else None
+    finally:
+        monitor.running = False
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return dict(case, success=status['success'], message=status['message'], wall_time=round(wall_time, 3),
+                encode_fps=round(status['frames'] / wall_time, 2) if wall_time > 0 else None,
+                speed=round(output_duration / wall_time, 3) if output_duration and wall_time > 0 else None,
+                peak_rss_mb=round(peak_rss / 1024 ** 2, 1) if peak_rss else None,
+                output_duration=output_duration, output_size=output_size)
+
+def get_environment():
+    result = run_subprocess_simple([FFMPEG_PATH, '-version'], capture_output=True, text=True)
+    return {'ffmpeg': result.stdout.splitlines()[0] if result.stdout else None, 'platform': platform.platform(),
+            'python': platform.python_version(), 'cpu_count': os.cpu_count()}
+
+def build_cases(args):
+    return [{'clips': count, 'clip_duration': duration, 'transition': transition,
+             'transition_duration': args.transition_duration, 'workers': workers,
+             'smart_render': args.smart_render, 'profile': args.profile}
+            for count in args.counts for duration in args.durations
+            for transition in args.transitions for workers in args.workers]
+
+def make_graph_clips(count):
+    sizes = [(1920, 1080), (1920, 1080), (1280, 720)]
+    rates = ['30', '30', '25', '60']
+    return [filtergraph.Clip(os.path.join('media', f"clip_{i:05d}.mp4"), 5.0 + (i % 7) * 0.25, has_audio=i % 5 != 0,
+                             width=sizes[i % 3][0], height=sizes[i % 3][1], fps=rates[i % 4], sar='1:1',
+                             pix_fmt='yuv420p')
+            for i in range(count)]
+
+def run_graph_benchmark(counts=(10, 100, 1000), repeat=5):
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        script_file = os.path.join(temp_dir, 'graph.txt')
+        for count in counts:
+            clips = make_graph_clips(count)
+            output_format = filtergraph.choose_output_format(clips)
+            number = max(1, 1000 // count)
+
+            def build():
+                graph = filtergraph.build_xfade_graph(clips, 'fade', 0.5, output_format)[0]
+                return graph.to_string()
+
+            def build_script():
+                graph = filtergraph.build_xfade_graph(clips, 'fade', 0.5, output_format, use_movie_sources=True)[0]
+                graph.write_script(script_file)
+
+            build_time = min(timeit.repeat(build, number=number, repeat=repeat)) / number
+            script_time = min(timeit.repeat(build_script, number=number, repeat=repeat)) / number
+            results.append({'clips': count, 'build_ms': build_time * 1000, 'script_ms': script_time * 1000,
+                            'graph_chars': len(build())})
+    return results
+
+def print_graph_benchmark(counts):
+    print(f"{'clips':>8} {'build (ms)':>12} {'script (ms)':>12} {'graph chars':>12}")
+    for result in run_graph_benchmark(counts):
+        print(f"{result['clips']:>8} {result['build_ms']:>12.3f} {result['script_ms']:>12.3f} {result['graph_chars']:>12}")
+    return 0
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark the xfade render pipeline on synthetic clips.')
+    parser.add_argument('--counts', type=int, nargs='+', default=None,
+                        help='Clip counts (default: 2 5 10, or 10 100 1000 with --filtergraph)')
+    parser.add_argument('--durations', type=float, nargs='+', default=[2.0, 5.0], help='Clip durations in seconds')
+    parser.add_argument('--transitions', nargs='+', default=['fade', 'wipeleft'], help='xfade transition types')
+    parser.add_argument('-d', '--transition-duration', type=float, default=0.5, help='Transition duration in seconds')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1], help='Parallel FFmpeg processes')
+    parser.add_argument('--smart-render', action='store_true', help='Stream-copy everything except the transitions')
+    parser.add_argument('--profile', default=DEFAULT_PROFILE, choices=sorted(ENCODING_PROFILES),
+                        help='Encoding speed/quality profile')
+    parser.add_argument('--media-dir', default=None, help='Where the synthetic clips are kept')
+    parser.add_argument('-o', '--output', default='benchmark_results.json', help='JSON results file')
+    parser.add_argument('--filtergraph', action='store_true',
+                        help='Only time building the filtergraph and its script file, without rendering')
+    args = parser.parse_args(argv)
+
+    if args.filtergraph:
+        return print_graph_benchmark(args.counts or [10, 100, 1000])
+    args.counts = args.counts or [2, 5, 10]
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    media_dir = args.media_dir or get_cache_dir('benchmark')
+    os.makedirs(media_dir, exist_ok=True)
+    results = []
+
+    print(f"{'clips':>5} {'dur':>5} {'transition':>12} {'workers':>7} {'wall (s)':>9} {'fps':>8} {'speed':>7} "
+          f"{'rss (MB)':>9} {'size (KB)':>10}")
+    for case in build_cases(args):
+        result = run_case(case, media_dir)
+        results.append(result)
+        if not result['success']:
+            print(f"{case['clips']:>5} {case['clip_duration']:>5g} {case['transition']:>12} {case['workers']:>7} "
+                  f"failed: {result['message']}")
+            continue
+        print(f"{result['clips']:>5} {result['clip_duration']:>5g} {result['transition']:>12} {result['workers']:>7} "
+              f"{result['wall_time']:>9.2f} {result['encode_fps'] or 0:>8.1f} {result['speed'] or 0:>7.2f} "
+              f"{result['peak_rss_mb'] or 0:>9.1f} {result['output_size'] / 1024:>10.0f}")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'version': BENCHMARK_VERSION, 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'environment': get_environment(), 'results': results}, f, indent=2)
+    print(f"Results written to {args.output}")
+    return 0 if all(result['success'] for result in results) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
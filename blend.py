@@ -0,0 +1,80 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DISSOLVE_SEED = 0
+_dissolve_noise = {}
+
+def smoothstep(edge0, edge1, x):
+    t = min(max((x - edge0) / (edge1 - edge0), 0.0), 1.0)
+    return t * t * (3.0 - 2.0 * t)
+
+def mix(a, b, m):
+    return a * m + b * (1.0 - m)
+
+def fade(a, b, progress):
+    return mix(a.astype(np.float32), b.astype(np.float32), progress)
+
+def fade_to(color):
+    def blend(a, b, progress):
+        phase = 0.2
+        background = np.float32(color)
+        first = mix(a.astype(np.float32), background, smoothstep(1.0 - phase, 1.0, progress))
+        second = mix(background, b.astype(np.float32), smoothstep(phase, 1.0, progress))
+        return mix(first, second, progress)
+    return blend
+
+def get_dissolve_noise(height, width):
+    if (height, width) not in _dissolve_noise:
+        _dissolve_noise[(height, width)] = np.random.default_rng(DISSOLVE_SEED).random((height, width, 1),
+                                                                                       dtype=np.float32)
+    return _dissolve_noise[(height, width)]
+
+def dissolve(a, b, progress):
+    smooth = get_dissolve_noise(*a.shape[:2]) * 2 + progress * 2 - 1.5
+    return np.where(smooth >= 0.5, a, b)
+
+def wipe(axis, forward):
+    def blend(a, b, progress):
+        size = a.shape[axis]
+        z = size * progress if forward else size * (1 - progress)
+        positions = np.arange(size).reshape((-1, 1, 1) if axis == 0 else (1, -1, 1))
+        return np.where(positions > z, b, a) if forward else np.where(positions > z, a, b)
+    return blend
+
+def slide(axis, direction):
+    def blend(a, b, progress):
+        size = a.shape[axis]
+        shifted = np.arange(size) + int(direction * progress * size)
+        source = shifted % size
+        inside = ((shifted >= 0) & (shifted < size)).reshape((-1, 1, 1) if axis == 0 else (1, -1, 1))
+        return np.where(inside, np.take(b, source, axis=axis), np.take(a, source, axis=axis))
+    return blend
+
+BLEND_MODES = {
+    'fade': fade,
+    'fadeblack': fade_to(0),
+    'fadewhite': fade_to(255),
+    'dissolve': dissolve,
+    'wipeleft': wipe(1, True),
+    'wiperight': wipe(1, False),
+    'wipeup': wipe(0, True),
+    'wipedown': wipe(0, False),
+    'slideleft': slide(1, -1),
+    'slideright': slide(1, 1),
+    'slideup': slide(0, -1),
+    'slidedown': slide(0, 1),
+}
+
+def can_blend(transition):
+    return np is not None and transition in BLEND_MODES
+
+def frame_from_bytes(data, width, height):
+    return np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+
+def blend_frames(transition, a, b, progress):
+    frame = BLEND_MODES[transition](a, b, progress)
+    if frame.dtype != np.uint8:
+        frame = np.clip(frame + 0.5, 0, 255).astype(np.uint8)
+    return np.ascontiguousarray(frame)
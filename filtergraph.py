@@ -0,0 +1,201 @@
+from collections import Counter
+from fractions import Fraction
+
+GRAPH_SPECIAL_CHARS = "\\'[],;"
+OPTION_SPECIAL_CHARS = "\\':"
+
+FILTER_SCRIPT_THRESHOLD = 8000
+COMMAND_LINE_LIMIT = 30000
+
+def escape_chars(value, special_chars):
+    return ''.join(f"\\{char}" if char in special_chars else char for char in str(value))
+
+def escape_option_value(value):
+    return escape_chars(escape_chars(value, OPTION_SPECIAL_CHARS), GRAPH_SPECIAL_CHARS)
+
+class Filter:
+    def __init__(self, name, *args, **options):
+        self.name = name
+        self.args = args
+        self.options = options
+
+    def __str__(self):
+        params = [str(arg) for arg in self.args]
+        params.extend(f"{key}={value}" for key, value in self.options.items())
+        if not params:
+            return self.name
+        return f"{self.name}={':'.join(params)}"
+
+class FilterChain:
+    def __init__(self, inputs, filters, outputs):
+        self.inputs = list(inputs)
+        self.filters = list(filters)
+        self.outputs = list(outputs)
+
+    def __str__(self):
+        inputs = ''.join(f"[{label}]" for label in self.inputs)
+        outputs = ''.join(f"[{label}]" for label in self.outputs)
+        return f"{inputs}{','.join(str(f) for f in self.filters)}{outputs}"
+
+class FilterGraph:
+    def __init__(self):
+        self.chains = []
+
+    def __len__(self):
+        return len(self.chains)
+
+    def add(self, inputs, filters, outputs):
+        chain = FilterChain(inputs, filters, outputs)
+        self.chains.append(chain)
+        return chain
+
+    def to_string(self):
+        return ';'.join(str(chain) for chain in self.chains)
+
+    def write_script(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(';\n'.join(str(chain) for chain in self.chains))
+        return path
+
+class Clip:
+    def __init__(self, path, duration, has_audio=True, width=None, height=None, fps=None, avg_fps=None,
+                 sar=None, pix_fmt=None):
+        self.path = path
+        self.duration = duration
+        self.has_audio = has_audio
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.avg_fps = avg_fps
+        self.sar = sar
+        self.pix_fmt = pix_fmt
+
+class OutputFormat:
+    def __init__(self, width, height, fps='30', pix_fmt='yuv420p'):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.pix_fmt = pix_fmt
+
+    @property
+    def frame_rate(self):
+        return float(parse_frame_rate(self.fps))
+
+    def __repr__(self):
+        return f"{self.width}x{self.height} @ {self.fps} fps, {self.pix_fmt}"
+
+def parse_frame_rate(value):
+    try:
+        rate = Fraction(str(value))
+    except (ValueError, ZeroDivisionError):
+        return None
+    return rate if rate > 0 else None
+
+def format_frame_rate(rate):
+    return str(rate.numerator) if rate.denominator == 1 else f"{rate.numerator}/{rate.denominator}"
+
+def choose_output_format(clips, width=None, height=None, fps=None, pix_fmt=None):
+    if not (width and height):
+        sizes = Counter((clip.width, clip.height) for clip in clips if clip.width and clip.height)
+        width, height = sizes.most_common(1)[0][0] if sizes else (1920, 1080)
+    if not fps:
+        rates = Counter(parse_frame_rate(clip.fps) for clip in clips if parse_frame_rate(clip.fps))
+        fps = format_frame_rate(rates.most_common(1)[0][0]) if rates else '30'
+    if not pix_fmt:
+        pix_fmts = Counter(clip.pix_fmt for clip in clips if clip.pix_fmt)
+        pix_fmt = pix_fmts.most_common(1)[0][0] if pix_fmts else 'yuv420p'
+    return OutputFormat(int(width), int(height), fps, pix_fmt)
+
+def normalize_filters(clip, output_format):
+    filters = [Filter('settb', 'AVTB')]
+    if clip.sar not in ('1:1', '0:1'):
+        filters.append(Filter('setsar', sar=1))
+
+    rate = parse_frame_rate(clip.fps)
+    avg_rate = parse_frame_rate(clip.avg_fps) or rate
+    if rate is None or rate != parse_frame_rate(output_format.fps) or avg_rate != rate:
+        filters.append(Filter('fps', output_format.fps))
+
+    if (clip.width, clip.height) != (output_format.width, output_format.height):
+        filters.append(Filter('scale', w=output_format.width, h=output_format.height, force_original_aspect_ratio=1))
+        filters.append(Filter('pad', output_format.width, output_format.height, '(ow-iw)/2', '(oh-ih)/2'))
+    return filters
+
+def add_movie_sources(graph, clips):
+    video_inputs = []
+    audio_inputs = []
+    for i, clip in enumerate(clips):
+        streams = 'dv+da' if clip.has_audio else 'dv'
+        outputs = [f"src{i}v", f"src{i}a"] if clip.has_audio else [f"src{i}v"]
+        graph.add([], [Filter('movie', escape_option_value(clip.path), s=streams)], outputs)
+        video_inputs.append(f"src{i}v")
+        audio_inputs.append(f"src{i}a" if clip.has_audio else None)
+    return video_inputs, audio_inputs
+
+def add_audio_crossfades(graph, has_audio, transition_duration, audio_inputs=None):
+    audio_inputs = audio_inputs or [f"{i}:a" for i in range(len(has_audio))]
+    last_audio_output = audio_inputs[0] if has_audio[0] else None
+
+    for i in range(1, len(has_audio)):
+        if has_audio[i-1] and has_audio[i]:
+            next_audio_output = f"a{i-1}{i}"
+            graph.add([last_audio_output, audio_inputs[i]], [Filter('acrossfade', d=transition_duration)],
+                      [next_audio_output])
+            last_audio_output = next_audio_output
+        elif has_audio[i]:
+            last_audio_output = audio_inputs[i]
+
+    return last_audio_output
+
+def add_null_sinks(graph, labels, mapped_label):
+    consumed = {label for chain in graph.chains for label in chain.inputs}
+    for label in labels:
+        if label not in consumed and label != mapped_label:
+            graph.add([label], [Filter('anullsink')], [])
+
+def get_map_label(label):
+    return label if ':' in label else f"[{label}]"
+
+def get_transition_offsets(durations, transition_duration):
+    offsets = [0.0]
+    video_length = 0.0
+    for i in range(1, len(durations)):
+        video_length += durations[i - 1] - transition_duration
+        offsets.append(video_length)
+    return offsets
+
+def build_xfade_graph(clips, transition_type, transition_duration, output_format, use_movie_sources=False):
+    graph = FilterGraph()
+    if use_movie_sources:
+        video_inputs, audio_inputs = add_movie_sources(graph, clips)
+    else:
+        video_inputs = [f"{i}:v" for i in range(len(clips))]
+        audio_inputs = None
+
+    for i, clip in enumerate(clips):
+        graph.add([video_inputs[i]], normalize_filters(clip, output_format), [f"{i}v"])
+
+    last_transition_output = "0v"
+    offsets = get_transition_offsets([clip.duration for clip in clips], transition_duration)
+    for i in range(1, len(clips)):
+        next_transition_output = f"v{i-1}{i}"
+        graph.add([last_transition_output, f"{i}v"],
+                  [Filter('xfade', transition=transition_type, duration=transition_duration,
+                          offset=f"{offsets[i]:.3f}")],
+                  [next_transition_output])
+        last_transition_output = next_transition_output
+
+    graph.add([last_transition_output], [Filter('format', pix_fmts=output_format.pix_fmt)], ['final'])
+    last_audio_output = add_audio_crossfades(graph, [clip.has_audio for clip in clips], transition_duration,
+                                             audio_inputs)
+    if use_movie_sources:
+        add_null_sinks(graph, [label for label in audio_inputs if label], last_audio_output)
+
+    return graph, 'final', last_audio_output, offsets[-1] + clips[-1].duration
+
+def needs_filter_script(graph_text, input_paths):
+    command_length = len(graph_text) + sum(len(path) + 4 for path in input_paths)
+    return len(graph_text) > FILTER_SCRIPT_THRESHOLD or command_length > COMMAND_LINE_LIMIT
+
+def needs_movie_sources(input_paths):
+    return sum(len(path) + 4 for path in input_paths) > COMMAND_LINE_LIMIT
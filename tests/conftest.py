@@ -0,0 +1,45 @@
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ['XDG_CACHE_HOME'] = tempfile.mkdtemp(prefix='xfade_test_cache_')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SCRIPT = os.path.join(ROOT, 'XfadeGUI.py')
+
+requires_ffmpeg = pytest.mark.skipif(not (shutil.which('ffmpeg') and shutil.which('ffprobe')),
+                                     reason='ffmpeg and ffprobe are needed')
+
+def make_clip(path, duration, frequency=440, size='160x120', rate=25, audio_duration=None):
+    subprocess.run(['ffmpeg', '-v', 'error', '-f', 'lavfi', '-i', f"testsrc=size={size}:rate={rate}:duration={duration}",
+                    '-f', 'lavfi', '-i', f"sine=frequency={frequency}:sample_rate=48000:duration={audio_duration or duration}",
+                    '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', '-c:a', 'aac',
+                    *([] if audio_duration else ['-shortest']), '-y', str(path)], check=True)
+    return str(path)
+
+def probe_stream_durations(path):
+    result = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'stream=codec_type,duration', '-of', 'csv=p=0',
+                             str(path)], capture_output=True, text=True, check=True)
+    return {kind: float(duration) for kind, duration in (line.split(',') for line in result.stdout.split())}
+
+def probe_duration(path):
+    result = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', str(path)],
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+def run_cli(*args, **kwargs):
+    kwargs.setdefault('stdout', subprocess.PIPE)
+    kwargs.setdefault('stderr', subprocess.PIPE)
+    return subprocess.run([sys.executable, SCRIPT, *args], timeout=300, **kwargs)
+
+@pytest.fixture
+def clips(tmp_path):
+    return [make_clip(tmp_path / f"clip{i}.mp4", duration, frequency=300 * (i + 1))
+            for i, duration in enumerate([2, 3, 2])]
@@ -0,0 +1,81 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import blend
+
+def make_frames(height=4, width=4):
+    y, x = np.mgrid[0:height, 0:width]
+    a = np.stack([x * 10, y * 10, np.full_like(x, 1)], axis=-1).astype(np.uint8)
+    b = np.stack([x * 10 + 100, y * 10 + 100, np.full_like(x, 2)], axis=-1).astype(np.uint8)
+    return a, b
+
+@pytest.mark.parametrize('transition', sorted(blend.BLEND_MODES))
+def test_boundary_frames(transition):
+    a, b = make_frames()
+    first = blend.blend_frames(transition, a, b, 1.0)
+    last = blend.blend_frames(transition, a, b, 0.0)
+    assert first.dtype == np.uint8 and first.shape == a.shape and first.flags['C_CONTIGUOUS']
+    if transition == 'wiperight':
+        np.testing.assert_array_equal(first[:, 1:], a[:, 1:])
+        np.testing.assert_array_equal(first[:, 0], b[:, 0])
+    elif transition == 'wipedown':
+        np.testing.assert_array_equal(first[1:], a[1:])
+        np.testing.assert_array_equal(first[0], b[0])
+    else:
+        np.testing.assert_array_equal(first, a)
+    if transition == 'wipeleft':
+        np.testing.assert_array_equal(last[:, 1:], b[:, 1:])
+        np.testing.assert_array_equal(last[:, 0], a[:, 0])
+    elif transition == 'wipeup':
+        np.testing.assert_array_equal(last[1:], b[1:])
+        np.testing.assert_array_equal(last[0], a[0])
+    else:
+        np.testing.assert_array_equal(last, b)
+
+def test_fade_midpoint():
+    a = np.full((2, 2, 3), 200, dtype=np.uint8)
+    b = np.full((2, 2, 3), 100, dtype=np.uint8)
+    assert (blend.blend_frames('fade', a, b, 0.5) == 150).all()
+    assert (blend.blend_frames('fade', a, b, 0.25) == 125).all()
+
+def test_fade_through_color_midpoint():
+    a = np.full((2, 2, 3), 200, dtype=np.uint8)
+    b = np.full((2, 2, 3), 100, dtype=np.uint8)
+    assert (blend.blend_frames('fadeblack', a, b, 0.5) == 34).all()
+    assert (blend.blend_frames('fadewhite', a, b, 0.5) == 202).all()
+    assert (blend.blend_frames('fadeblack', a, b, 0.9) == 90).all()
+
+def test_wipes_midpoint():
+    a, b = make_frames()
+    assert blend.blend_frames('wipeleft', a, b, 0.5)[0, :, 2].tolist() == [1, 1, 1, 2]
+    assert blend.blend_frames('wiperight', a, b, 0.5)[0, :, 2].tolist() == [2, 2, 2, 1]
+    assert blend.blend_frames('wipeup', a, b, 0.5)[:, 0, 2].tolist() == [1, 1, 1, 2]
+    assert blend.blend_frames('wipedown', a, b, 0.5)[:, 0, 2].tolist() == [2, 2, 2, 1]
+
+def test_slides_midpoint():
+    a, b = make_frames()
+    left = blend.blend_frames('slideleft', a, b, 0.5)[0]
+    assert left[:, 2].tolist() == [1, 1, 2, 2]
+    assert left[:, 0].tolist() == [20, 30, 100, 110]
+    right = blend.blend_frames('slideright', a, b, 0.5)[0]
+    assert right[:, 2].tolist() == [2, 2, 1, 1]
+    assert right[:, 0].tolist() == [120, 130, 0, 10]
+    up = blend.blend_frames('slideup', a, b, 0.5)[:, 0]
+    assert up[:, 1].tolist() == [20, 30, 100, 110]
+    down = blend.blend_frames('slidedown', a, b, 0.5)[:, 0]
+    assert down[:, 1].tolist() == [120, 130, 0, 10]
+
+def test_dissolve_is_seeded_and_mixes():
+    a, b = make_frames(32, 32)
+    frame = blend.blend_frames('dissolve', a, b, 0.5)
+    np.testing.assert_array_equal(frame, blend.blend_frames('dissolve', a, b, 0.5))
+    sources = frame[:, :, 2]
+    assert set(np.unique(sources)) == {1, 2}
+    assert (sources == 1).sum() > (blend.blend_frames('dissolve', a, b, 0.3)[:, :, 2] == 1).sum()
+
+def test_frame_from_bytes_and_can_blend():
+    a, _ = make_frames(2, 3)
+    np.testing.assert_array_equal(blend.frame_from_bytes(a.tobytes(), 3, 2), a)
+    assert blend.can_blend('fade')
+    assert not blend.can_blend('circleopen')
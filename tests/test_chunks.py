@@ -0,0 +1,13 @@
+import pytest
+
+from conftest import requires_ffmpeg, make_clip, probe_stream_durations, run_cli
+
+@requires_ffmpeg
+def test_chunked_audio_stays_in_sync(tmp_path):
+    clips = [make_clip(tmp_path / f"clip{i}.mp4", 2.5, frequency=300 + 50 * i, audio_duration=2.517)
+             for i in range(8)]
+    output = tmp_path / 'out.mp4'
+    result = run_cli(*clips, '-o', str(output), '--workers', '2', '-d', '0.5')
+    assert result.returncode == 0, result.stderr.decode()
+    durations = probe_stream_durations(output)
+    assert durations['audio'] == pytest.approx(durations['video'], abs=0.03)
@@ -0,0 +1,16 @@
+import XfadeGUI
+
+def test_cli_mode_needs_an_option_or_command(tmp_path):
+    clip = tmp_path / 'clip.mp4'
+    clip.write_bytes(b'')
+    assert not XfadeGUI.is_cli_args([])
+    assert not XfadeGUI.is_cli_args([str(clip), str(tmp_path)])
+    assert XfadeGUI.is_cli_args(['render', str(clip)])
+    assert XfadeGUI.is_cli_args([str(clip), '--cli'])
+    assert XfadeGUI.is_cli_args([str(clip), '-o', 'out.mp4'])
+    assert XfadeGUI.is_cli_args(['--node', 'host:7878'])
+
+def test_dash_named_files_open_the_gui(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / '-intro.mp4').write_bytes(b'')
+    assert not XfadeGUI.is_cli_args(['-intro.mp4'])
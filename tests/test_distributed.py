@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import signal
+import threading
+import subprocess
+
+from conftest import SCRIPT, requires_ffmpeg, probe_duration, run_cli
+
+import XfadeGUI
+
+def test_bare_port_listens_on_loopback():
+    assert XfadeGUI.parse_address('7878') == ('127.0.0.1', 7878)
+    assert XfadeGUI.parse_address('0.0.0.0:7878') == ('0.0.0.0', 7878)
+
+def test_nodes_need_the_token():
+    events = []
+    coordinator = XfadeGUI.RenderCoordinator('0', on_event=lambda *event: events.append(event), token='secret')
+    address = f"127.0.0.1:{coordinator.address[1]}"
+    try:
+        assert XfadeGUI.run_render_node(address, 'intruder', 'wrong') == 0
+        assert not coordinator.nodes
+        node = threading.Thread(target=XfadeGUI.run_render_node, args=(address, 'friend', 'secret'), daemon=True)
+        node.start()
+        for _ in range(50):
+            if coordinator.nodes:
+                break
+            time.sleep(0.1)
+        assert [event for event in events if event[0] == 'node'] == [('node', None, 'friend')]
+    finally:
+        coordinator.close()
+
+@requires_ffmpeg
+def test_local_nodes_render(clips, tmp_path):
+    output = tmp_path / 'out.mp4'
+    result = run_cli(*clips, '-o', str(output), '--local-nodes', '2', '-d', '0.5')
+    assert result.returncode == 0, result.stderr.decode()
+    assert abs(probe_duration(output) - 6.0) < 0.2
+
+@requires_ffmpeg
+def test_lost_node_chunk_is_reassigned(tmp_path):
+    events = []
+    coordinator = XfadeGUI.RenderCoordinator('0', on_event=lambda *event: events.append(event))
+    address = f"127.0.0.1:{coordinator.address[1]}"
+    nodes = [subprocess.Popen([sys.executable, SCRIPT, '--node', address, '--node-name', f"node-{index}"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+             for index in range(2)]
+    tasks = [{'id': index, 'label': f"chunk {index}", 'length': 3.0, 'output': str(tmp_path / f"chunk_{index}.mkv"),
+              'args': ['ffmpeg', '-re', '-f', 'lavfi', '-i', 'testsrc=size=160x120:rate=25:duration=3',
+                       '-c:v', 'libx264', '-preset', 'ultrafast', '-y', str(tmp_path / f"chunk_{index}.mkv")]}
+             for index in range(2)]
+
+    def kill_first_busy_node():
+        while not any(event[0] == 'assigned' and event[2] == 'node-0' for event in events):
+            time.sleep(0.05)
+        time.sleep(1.0)
+        os.killpg(nodes[0].pid, signal.SIGKILL)
+
+    killer = threading.Thread(target=kill_first_busy_node, daemon=True)
+    killer.start()
+    try:
+        coordinator.run(tasks, deadline=time.time() + 120)
+    finally:
+        coordinator.close()
+        for node in nodes:
+            node.wait(10)
+
+    lost = next(event[1] for event in events if event[0] == 'assigned' and event[2] == 'node-0')
+    assert any(event[0] == 'lost' and 'node-0' in event[2] for event in events)
+    assert ('retry', lost) in [event[:2] for event in events]
+    assert coordinator.tasks[lost]['attempts'] == 1
+    for task in tasks:
+        assert abs(probe_duration(task['output']) - 3.0) < 0.1
+    assert os.path.exists(tmp_path / f"chunk_{lost}.attempt0.mkv")
+    assert not os.path.exists(tmp_path / f"chunk_{lost}.attempt1.mkv")
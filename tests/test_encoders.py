@@ -0,0 +1,38 @@
+import json
+import subprocess
+
+import XfadeGUI
+
+def test_encoder_errors():
+    assert not XfadeGUI.is_encoder_error(['[libx264 @ 0x55d0] using cpu capabilities: MMX2 SSE2Fast',
+                                          '[libx264 @ 0x55d0] profile High, level 3.0, 4:2:0, 8-bit'], 'libx264')
+    assert not XfadeGUI.is_encoder_error(['[libx264 @ 0x55d0] profile High, level 3.0',
+                                          '[mp4 @ 0x55d1] Could not find tag for codec pcm_s16le in stream #1',
+                                          'Could not write header for output file #0'], 'libx264')
+    assert not XfadeGUI.is_encoder_error(['/missing/out.mp4: No such file or directory'], 'libx264')
+    assert XfadeGUI.is_encoder_error(['[h264_nvenc @ 0x1] OpenEncodeSessionEx failed: out of memory (10)'], 'h264_nvenc')
+    assert XfadeGUI.is_encoder_error(['[h264_qsv @ 0x1] Error initializing an internal MFX session'], 'h264_qsv')
+    assert XfadeGUI.is_encoder_error(['Error while opening encoder for output stream #0:0'], 'h264_amf')
+
+def test_failed_verification_expires(tmp_path, monkeypatch):
+    cache_file = tmp_path / 'encoders.json'
+    registry = XfadeGUI.EncoderRegistry(str(cache_file))
+    registry.data = {'key': 'ffmpeg', 'encoders': ['h264_nvenc'], 'hwaccels': [], 'verified': {'h264_nvenc': False}}
+    results = [1, 0]
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, results.pop(0), '', '')
+
+    monkeypatch.setattr(XfadeGUI, 'run_subprocess_simple', run)
+    assert not registry.verify('h264_nvenc')
+    assert not registry.verify('h264_nvenc')
+    assert len(calls) == 1
+    assert 'h264_nvenc' in json.loads(cache_file.read_text())['failed']
+
+    registry.data['failed']['h264_nvenc'] -= XfadeGUI.ENCODER_FAILURE_TTL
+    assert registry.verify('h264_nvenc')
+    assert registry.verify('h264_nvenc')
+    assert len(calls) == 2
+    assert json.loads(cache_file.read_text())['failed'] == {}
@@ -0,0 +1,102 @@
+import subprocess
+
+import pytest
+
+from conftest import requires_ffmpeg, make_clip
+
+import filtergraph
+from filtergraph import Clip, Filter, FilterGraph, OutputFormat
+
+def make_clips(*specs):
+    return [Clip(path, duration, has_audio, width=width, height=height, fps=fps, avg_fps=fps, sar='1:1',
+                 pix_fmt='yuv420p')
+            for path, duration, has_audio, width, height, fps in specs]
+
+def test_offsets_with_mixed_clip_lengths():
+    assert filtergraph.get_transition_offsets([5.0], 1.0) == [0.0]
+    assert filtergraph.get_transition_offsets([5.0, 2.0, 7.5, 3.0], 1.0) == [0.0, 4.0, 5.0, 11.5]
+    assert filtergraph.get_transition_offsets([2.0, 3.0, 2.0], 0.5) == [0.0, 1.5, 4.0]
+
+def test_graph_duration_and_xfade_offsets():
+    clips = make_clips(('a.mp4', 5.0, True, 640, 360, '30'), ('b.mp4', 2.0, True, 640, 360, '30'),
+                       ('c.mp4', 7.5, True, 640, 360, '30'))
+    graph, video_label, audio_label, duration = filtergraph.build_xfade_graph(
+        clips, 'wipeleft', 1.0, OutputFormat(640, 360, '30'))
+    assert duration == pytest.approx(12.5)
+    assert (video_label, audio_label) == ('final', 'a12')
+    xfades = [str(chain) for chain in graph.chains if chain.filters[0].name == 'xfade']
+    assert xfades == ['[0v][1v]xfade=transition=wipeleft:duration=1.0:offset=4.000[v01]',
+                      '[v01][2v]xfade=transition=wipeleft:duration=1.0:offset=5.000[v12]']
+
+def test_option_escaping():
+    assert filtergraph.escape_option_value('plain.mp4') == 'plain.mp4'
+    assert filtergraph.escape_option_value('C:/clips/a.mp4') == r'C\\:/clips/a.mp4'
+    assert filtergraph.escape_option_value("it's") == r"it\\\'s"
+    assert filtergraph.escape_option_value('[a],b;c') == r'\[a\]\,b\;c'
+    assert filtergraph.escape_option_value('a\\b') == r'a\\\\b'
+
+def test_filter_and_chain_strings():
+    assert str(Filter('anullsink')) == 'anullsink'
+    assert str(Filter('pad', 640, 360, w=1)) == 'pad=640:360:w=1'
+    graph = FilterGraph()
+    graph.add(['0:v'], [Filter('settb', 'AVTB'), Filter('fps', '30')], ['v'])
+    graph.add(['v', '1:v'], [Filter('xfade', offset=1)], ['out'])
+    assert len(graph) == 2
+    assert graph.to_string() == '[0:v]settb=AVTB,fps=30[v];[v][1:v]xfade=offset=1[out]'
+
+def test_movie_sources_and_null_sinks():
+    clips = make_clips(('a.mp4', 4.0, True, 640, 360, '30'), ('b.mp4', 4.0, False, 640, 360, '30'),
+                       ('c.mp4', 4.0, True, 640, 360, '30'))
+    graph, _, audio_label, _ = filtergraph.build_xfade_graph(clips, 'fade', 1.0, OutputFormat(640, 360, '30'),
+                                                             use_movie_sources=True)
+    sources = [str(chain) for chain in graph.chains[:3]]
+    assert sources == ['movie=a.mp4:s=dv+da[src0v][src0a]', 'movie=b.mp4:s=dv[src1v]',
+                       'movie=c.mp4:s=dv+da[src2v][src2a]']
+    assert [chain.inputs for chain in graph.chains[3:6]] == [['src0v'], ['src1v'], ['src2v']]
+    assert audio_label == 'src2a'
+    assert str(graph.chains[-1]) == '[src0a]anullsink'
+
+    produced = [label for chain in graph.chains for label in chain.outputs]
+    consumed = [label for chain in graph.chains for label in chain.inputs]
+    assert sorted(set(produced) - set(consumed)) == ['final', 'src2a']
+
+def test_audio_crossfades_skip_silent_clips():
+    graph = FilterGraph()
+    assert filtergraph.add_audio_crossfades(graph, [True, True, False, True], 0.5) == '3:a'
+    assert graph.to_string() == '[0:a][1:a]acrossfade=d=0.5[a01]'
+
+def test_normalize_filters():
+    output_format = OutputFormat(1280, 720, '30')
+    matching = Clip('a.mp4', 5.0, width=1280, height=720, fps='30/1', avg_fps='30/1', sar='1:1')
+    assert [str(f) for f in filtergraph.normalize_filters(matching, output_format)] == ['settb=AVTB']
+
+    other = Clip('b.mp4', 5.0, width=1920, height=1080, fps='25', avg_fps='25', sar='4:3')
+    assert [str(f) for f in filtergraph.normalize_filters(other, output_format)] == [
+        'settb=AVTB', 'setsar=sar=1', 'fps=30',
+        'scale=w=1280:h=720:force_original_aspect_ratio=1', 'pad=1280:720:(ow-iw)/2:(oh-ih)/2']
+
+    variable = Clip('c.mp4', 5.0, width=1280, height=720, fps='30', avg_fps='29.5', sar='0:1')
+    assert [f.name for f in filtergraph.normalize_filters(variable, output_format)] == ['settb', 'fps']
+
+def test_choose_output_format():
+    clips = make_clips(('a.mp4', 1, True, 640, 360, '25'), ('b.mp4', 1, True, 1280, 720, '30000/1001'),
+                       ('c.mp4', 1, True, 1280, 720, '30000/1001'))
+    output_format = filtergraph.choose_output_format(clips)
+    assert (output_format.width, output_format.height, output_format.fps) == (1280, 720, '30000/1001')
+    assert output_format.frame_rate == pytest.approx(29.97, abs=0.01)
+    forced = filtergraph.choose_output_format(clips, width=320, height=240, fps='50', pix_fmt='yuv444p')
+    assert repr(forced) == '320x240 @ 50 fps, yuv444p'
+
+@requires_ffmpeg
+def test_movie_source_paths_with_special_characters(tmp_path):
+    folder = tmp_path / "it's [a]: b,c;d"
+    folder.mkdir()
+    paths = [make_clip(folder / f"clip {i}.mp4", 1) for i in range(2)]
+    clips = make_clips(*[(path, 1.0, True, 160, 120, '25') for path in paths])
+    graph, video_label, audio_label, _ = filtergraph.build_xfade_graph(
+        clips, 'fade', 0.5, OutputFormat(160, 120, '25'), use_movie_sources=True)
+    script = graph.write_script(str(tmp_path / 'graph.txt'))
+    result = subprocess.run(['ffmpeg', '-v', 'error', '-filter_complex_script', script,
+                             '-map', f"[{video_label}]", '-map', f"[{audio_label}]", '-f', 'null', '-'],
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,25 @@
+import os
+
+from conftest import requires_ffmpeg, probe_duration, run_cli
+
+import XfadeGUI
+
+def test_work_dir_without_output_file():
+    worker = XfadeGUI.create_render_worker({'segments': ['a.mp4', 'b.mp4'], 'output_file': None,
+                                            'output_mode': 'pipe', 'parallel_workers': 2})
+    work_dir = worker.create_work_dir()
+    try:
+        assert os.path.dirname(work_dir) == os.path.abspath(XfadeGUI.tempfile.gettempdir())
+    finally:
+        os.rmdir(work_dir)
+    assert worker.start_resource_sampler() is None
+
+@requires_ffmpeg
+def test_pipe_render_with_workers(clips, tmp_path):
+    output = tmp_path / 'pipe.mp4'
+    with open(output, 'wb') as f:
+        result = run_cli(*clips, '-o', '-', '--workers', '2', '-d', '0.5', stdout=f, cwd=tmp_path)
+    assert result.returncode == 0, result.stderr.decode()
+    assert abs(probe_duration(output) - 6.0) < 0.2
+    assert not os.path.exists(os.path.join(os.path.dirname(clips[0]), 'Transitioned'))
+    assert not any(name.endswith('.resources.json') for name in os.listdir(tmp_path))
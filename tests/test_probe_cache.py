@@ -0,0 +1,59 @@
+import os
+
+import XfadeGUI
+
+def make_files(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"clip{i}.mp4"
+        path.write_bytes(b'')
+        paths.append(str(path))
+    return paths
+
+def test_saves_append_only_new_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(XfadeGUI, 'PROBE_CACHE_LOG_LIMIT', 4)
+    cache_file = str(tmp_path / 'probe_cache.json')
+    paths = make_files(tmp_path, 6)
+    cache = XfadeGUI.ProbeCache(cache_file, max_entries=4)
+
+    cache.save()
+    assert not os.path.exists(cache_file) and not os.path.exists(cache.log_file)
+
+    for path in paths[:3]:
+        cache.put(path, {'format': {'filename': path}})
+    cache.save()
+    assert not os.path.exists(cache_file)
+    assert len(open(cache.log_file).readlines()) == 3
+
+    cache.get(paths[0])
+    cache.save()
+    assert len(open(cache.log_file).readlines()) == 3
+
+    cache.put(paths[3], {'format': {'filename': paths[3]}})
+    cache.save()
+    assert len(open(cache.log_file).readlines()) == 4
+
+    cache.put(paths[4], {'format': {'filename': paths[4]}})
+    cache.save()
+    assert os.path.exists(cache_file) and not os.path.exists(cache.log_file)
+
+    cache.put(paths[5], {'format': {'filename': paths[5]}})
+    cache.save()
+    reloaded = XfadeGUI.ProbeCache(cache_file, max_entries=4)
+    assert reloaded.get(paths[1]) is None and reloaded.get(paths[2]) is None
+    kept = [paths[0]] + paths[3:]
+    assert [reloaded.get(path)['format']['filename'] for path in kept] == kept
+    assert reloaded.log_entries == 1
+
+def test_reload_keeps_the_newest_entries(tmp_path):
+    cache_file = str(tmp_path / 'probe_cache.json')
+    paths = make_files(tmp_path, 4)
+    cache = XfadeGUI.ProbeCache(cache_file, max_entries=3)
+    for path in paths:
+        cache.put(path, {'format': {}})
+    cache.save()
+    with open(cache.log_file, 'a') as f:
+        f.write('{"truncated\\n')
+    reloaded = XfadeGUI.ProbeCache(cache_file, max_entries=3)
+    assert reloaded.get(paths[0]) is None
+    assert all(reloaded.get(path) is not None for path in paths[1:])
@@ -0,0 +1,10 @@
+import XfadeGUI
+
+def test_video_sources(tmp_path):
+    for name in ['Day.1', '2024.10.17 shoot', 'plain']:
+        (tmp_path / name).mkdir()
+        assert XfadeGUI.is_video_source(str(tmp_path / name))
+    assert XfadeGUI.is_video_source(str(tmp_path / 'missing.MP4'))
+    (tmp_path / 'notes.txt').write_text('')
+    assert not XfadeGUI.is_video_source(str(tmp_path / 'notes.txt'))
+    assert not XfadeGUI.is_video_source(str(tmp_path / 'missing'))
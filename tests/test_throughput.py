@@ -0,0 +1,39 @@
+import json
+
+from conftest import requires_ffmpeg
+
+import XfadeGUI
+
+def render(clips, output_file, **job):
+    worker = XfadeGUI.create_render_worker(dict(job, segments=clips, output_file=str(output_file)))
+    worker.run()
+    return worker
+
+def load_samples(history):
+    return sum(entry['samples'] for entry in history.load().values())
+
+@requires_ffmpeg
+def test_reused_pieces_are_not_recorded(clips, tmp_path, monkeypatch):
+    history = XfadeGUI.ThroughputHistory(str(tmp_path / 'history.json'))
+    monkeypatch.setattr(XfadeGUI, '_throughput_history', history)
+    output_file = tmp_path / 'out.mp4'
+
+    render(clips, output_file, incremental=True)
+    assert load_samples(history) == 1
+    worker = render(clips, output_file, incremental=True)
+    assert not worker.fully_encoded
+    assert load_samples(history) == 1
+
+def test_benchmark_runs_are_not_recorded(tmp_path, monkeypatch):
+    history = XfadeGUI.ThroughputHistory(str(tmp_path / 'history.json'))
+    monkeypatch.setattr(XfadeGUI, '_throughput_history', history)
+    worker = XfadeGUI.create_render_worker({'segments': ['a.mp4', 'b.mp4'], 'output_file': str(tmp_path / 'o.mp4')})
+    worker.record_history = False
+    monkeypatch.setattr(XfadeGUI.ProbeService, 'run_ffprobe',
+                        lambda self, path: {'format': {'duration': '4.0'}, 'streams': []})
+    (tmp_path / 'o.mp4').write_bytes(b'0' * 100)
+    worker.record_throughput(1.0)
+    assert not (tmp_path / 'history.json').exists()
+    worker.record_history = True
+    worker.record_throughput(1.0)
+    assert json.loads((tmp_path / 'history.json').read_text())['entries']
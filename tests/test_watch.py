@@ -0,0 +1,25 @@
+from PyQt6.QtCore import QCoreApplication, QSettings
+
+import XfadeGUI
+
+def test_invalid_job_releases_its_output_name(tmp_path, monkeypatch):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    clips = [str(tmp_path / f"beach_{i}.mp4") for i in (1, 2)]
+    for clip in clips:
+        open(clip, 'wb').close()
+    settings = QSettings(str(tmp_path / 'settings.ini'), QSettings.Format.IniFormat)
+    daemon = XfadeGUI.WatchFolderDaemon([str(tmp_path)], XfadeGUI.RenderQueue(1, status_file=None), None, settings,
+                                        settle=0)
+    daemon.files = {clip: (None, 0.0) for clip in clips}
+
+    def fail(spec, args):
+        raise Exception("Invalid resolution: bogus")
+
+    monkeypatch.setattr(XfadeGUI, 'build_cli_job', fail)
+    daemon.submit_group(str(tmp_path), {'clips': clips, 'manifest': None, 'name': 'beach', 'spec': {}}, 1.0)
+
+    output_file = str(tmp_path / 'Transitioned' / 'beach.mp4')
+    assert output_file not in XfadeGUI._reserved_output_files
+    assert XfadeGUI.get_default_output_file(clips, 'beach.mp4') == output_file
+    XfadeGUI.release_output_file(output_file)
+    assert list(daemon.states[str(tmp_path)]['processed'].values())[0]['status'] == 'invalid'